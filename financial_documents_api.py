@@ -5,18 +5,56 @@ Provides endpoints to fetch specific annual/quarterly reports with intelligent s
 
 import os
 import re
+import base64
+import sys
 import time
+import uuid
+import functools
+import hashlib
+import random
+import asyncio
+import anyio
+import threading
+import atexit
+import logging
+import queue
+import httpx
+import orjson
 import requests
-import google.generativeai as genai
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from logging.handlers import QueueHandler, QueueListener
+from cachetools import TTLCache
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List
+from urllib.parse import urlparse, urljoin, unquote
+from html.parser import HTMLParser
+from typing import Optional, Dict, List, Union, Iterator, Tuple
 from dotenv import load_dotenv
-from supabase import create_client
+from supabase import Client, create_client
+from supabase.lib.client_options import ClientOptions
 from firecrawl import Firecrawl
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
 load_dotenv()
 
+# Log records are queued by request handlers and written to stdout by a background listener thread
+logger = logging.getLogger("fin_docs")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+LOG_BANNER = "=" * 80
+
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
@@ -32,22 +70,70 @@ if not FIRECRAWL_API_KEY:
 if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY must be set in environment variables")
 
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-firecrawl = Firecrawl(api_key=FIRECRAWL_API_KEY)
+# Supabase and Firecrawl clients, created per worker in the app lifespan (after any pre-fork) rather than at import
+supabase: Optional[Client] = None
+firecrawl: Optional[Firecrawl] = None
+
+# Pooled session for the remaining sync bank API calls: keep-alive sockets plus retries on gateway errors
+# pool_connections is the number of hosts whose pools are kept; company APIs, PDF hosts and Gemini exceed 16
+SESSION = requests.Session()
+_session_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                               max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                                                 raise_on_status=False))
+SESSION.mount("https://", _session_adapter)
+SESSION.mount("http://", _session_adapter)
+
+# Gemini REST endpoint, called through the pooled SESSION
+# Using gemini-2.5-flash for better document understanding and metadata extraction capabilities,if duplicate link found
+GEMINI_MODEL = "gemini-2.5-flash"
+GEMINI_GENERATE_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent"
+
+# Firecrawl REST endpoint used by the async scraping path
+FIRECRAWL_SCRAPE_URL = "https://api.firecrawl.dev/v2/scrape"
+
+# Shared async HTTP client, opened per worker in the app lifespan
+http_client: Optional[httpx.AsyncClient] = None
+
+# Threads available to sync endpoints and run_in_threadpool calls (blocking Supabase/requests I/O) per worker
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+# Uvicorn worker processes started by __main__; workers share nothing but the database
+WORKER_COUNT = int(os.getenv("WORKERS", min(8, os.cpu_count() or 1)))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the Supabase/Firecrawl/HTTP clients and preload the banks table on startup, close the HTTP pools on shutdown"""
+    global http_client, supabase, firecrawl
+    # Explicit PostgREST/storage timeouts so a slow Supabase pooler fails fast instead of piling up requests
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY,
+                             options=ClientOptions(postgrest_client_timeout=10, storage_client_timeout=10))
+    firecrawl = Firecrawl(api_key=FIRECRAWL_API_KEY)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0),
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+    await run_in_threadpool(load_banks)
+    refresh_task = asyncio.create_task(_refresh_banks_loop(BANKS_REFRESH_INTERVAL))
+    yield
+    refresh_task.cancel()
+    await http_client.aclose()
+    SESSION.close()
+    FIRECRAWL_EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
-# Configure Gemini AI
-# Using gemini-2.5-flash for better document understanding and metadata extraction capabilities,if duplicate link found 
-genai.configure(api_key=GEMINI_API_KEY)
-gemini_model = genai.GenerativeModel('gemini-2.5-flash')
 
 app = FastAPI(
     title="Financial Documents API",
     description="API for scraping and retrieving financial documents from various banks and financial institutions",
-    version="4.0.0"
+    version="4.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Fiscal year conversion dictionary
-FISCAL_YEAR_CONVERSION = {
+_FISCAL_YEAR_CONVERSION_RAW = {
     "2000/01": "2057/58", "2001/02": "2058/59", "2002/03": "2059/60",
     "2003/04": "2060/61", "2004/05": "2061/62", "2005/06": "2062/63",
     "2006/07": "2063/64", "2007/08": "2064/65", "2008/09": "2065/66",
@@ -59,8 +145,24 @@ FISCAL_YEAR_CONVERSION = {
     "2024/25": "2081/82", "2025/26": "2082/83"
 }
 
+# Read-only views with interned keys/values so lookups of interned query strings hit on identity
+FISCAL_YEAR_CONVERSION = MappingProxyType({sys.intern(k): sys.intern(v) for k, v in _FISCAL_YEAR_CONVERSION_RAW.items()})
+
 # Reverse conversion (Nepali to English)
-FISCAL_YEAR_REVERSE = {v: k for k, v in FISCAL_YEAR_CONVERSION.items()}
+FISCAL_YEAR_REVERSE = MappingProxyType({v: k for k, v in FISCAL_YEAR_CONVERSION.items()})
+
+
+
+def _long_fiscal_year(fiscal_year: str) -> str:
+    """Expand a short fiscal year (2078/79) to its long form (2078/2079)"""
+    year1, year2 = fiscal_year.split('/')
+    return f"{year1}/{year1[:2]}{year2}" if year2 > year1[2:] else f"{year1}/{int(year1) + 1}"
+
+
+# Either format (English or Nepali), short or long (2078/79, 2078/2079) -> (nepali, english)
+FISCAL_YEAR_BIDI = MappingProxyType({sys.intern(form): (v, k)
+                                     for k, v in FISCAL_YEAR_CONVERSION.items()
+                                     for form in (k, v, _long_fiscal_year(k), _long_fiscal_year(v))})
 
 # SANIMA-specific fiscal year corrections
 SANIMA_FISCAL_YEAR_CORRECTIONS = {
@@ -113,6 +215,12 @@ DYNAMIC_API_BANKS = {
     }
 }
 
+# Report type of each NABIL subcategory the sync imports, keyed by subcategory_id
+NABIL_SUBCATEGORY_REPORT_TYPES = MappingProxyType({
+    DYNAMIC_API_BANKS["NABIL"]["quarterly_subcategory_id"]: "quarterly",
+    DYNAMIC_API_BANKS["NABIL"]["annual_subcategory_id"]: "annual"
+})
+
 
 # ============================================================================
 # DEVELOPMENT BANK DYNAMIC API CONFIGURATION
@@ -254,8 +362,9 @@ FINANCE_COMPANY_STATIC = {
         "quarterly_url": "https://gurkhasfinance.com.np/type-of-report/quarter-report"
     }
 }
+@functools.lru_cache(maxsize=1024)
 def normalize_fiscal_year_format(fiscal_year: str) -> str:
-    """Normalize fiscal year to YYYY/YY format"""
+    """Normalize fiscal year to YYYY/YY format (memoized: called once per catalog document)"""
     if not fiscal_year:
         return fiscal_year
     fiscal_year = fiscal_year.strip()
@@ -270,39 +379,78 @@ def normalize_fiscal_year_format(fiscal_year: str) -> str:
     return fiscal_year
 
 
+# Gemini metadata per (pdf_url, bank_symbol); a published report PDF does not change, so only failures are retried
+GEMINI_METADATA_CACHE = TTLCache(maxsize=1024, ttl=86400)
+GEMINI_METADATA_CACHE_LOCK = threading.Lock()
+
+# Gemini replies with a bare JSON object instead of a fenced markdown block
+GEMINI_JSON_CONFIG = {"responseMimeType": "application/json"}
+
+# Gemini calls in flight at once per worker; the callers run on up to THREADPOOL_SIZE threads
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+_gemini_slots = threading.BoundedSemaphore(GEMINI_MAX_CONCURRENCY)
+
+
+def gemini_generate_json(prompt: str, pdf_bytes: bytes, timeout: float = 120) -> Dict:
+    """Ask Gemini about an inline PDF over its REST API and decode the JSON answer"""
+    payload = {
+        "contents": [{"parts": [
+            {"text": prompt},
+            {"inline_data": {"mime_type": "application/pdf", "data": base64.b64encode(pdf_bytes).decode("ascii")}},
+        ]}],
+        "generationConfig": GEMINI_JSON_CONFIG,
+    }
+    with _gemini_slots:
+        response = SESSION.post(GEMINI_GENERATE_URL, data=orjson.dumps(payload), timeout=timeout,
+                                headers={"x-goog-api-key": GEMINI_API_KEY, "Content-Type": "application/json"})
+    response.raise_for_status()
+    candidate = orjson.loads(response.content)["candidates"][0]
+    return orjson.loads(candidate["content"]["parts"][0]["text"])
+
+
+# Hosts known to serve an incomplete certificate chain; only their PDFs are re-downloaded without TLS verification
+# when the certificate check fails. Opt-in, e.g. INSECURE_PDF_HOSTS=www.examplebank.com.np
+INSECURE_PDF_HOSTS = frozenset(host.strip().lower() for host in os.getenv("INSECURE_PDF_HOSTS", "").split(",")
+                               if host.strip())
+
+
 def extract_metadata_from_pdf_url(pdf_url: str, bank_symbol: str) -> Optional[Dict]:
     """
     Extract metadata (fiscal year, report type, quarter) from PDF using Google Gemini AI
     This ensures accurate metadata even if the URL or filename is misleading
     """
-    import tempfile
-    import json
+    with GEMINI_METADATA_CACHE_LOCK:
+        cached = GEMINI_METADATA_CACHE.get((pdf_url, bank_symbol))
+    if cached is not None:
+        logger.info("🤖 Reusing Gemini metadata extracted earlier for this PDF")
+        return dict(cached)
 
     try:
-        print(f"🤖 Using Gemini AI to extract metadata from PDF...")
-
-        # Download PDF content
-        response = requests.get(pdf_url, timeout=30, verify=False, stream=True)
-        if response.status_code != 200:
-            print(f"   ❌ Failed to download PDF: {response.status_code}")
-            return None
+        logger.info("🤖 Using Gemini AI to extract metadata from PDF...")
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            # Get PDF bytes (limit to first 5MB to avoid timeout)
-            chunk_size = 1024 * 1024  # 1MB chunks
-            max_size = 5 * 1024 * 1024  # 5MB limit
-            total_size = 0
-
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                tmp_file.write(chunk)
-                total_size += len(chunk)
-                if total_size >= max_size:
+        # Download PDF content (first 5MB is enough for the cover pages and avoids timeouts); servers that
+        # honour Range send only that prefix (206), others send the whole file (200) and the loop stops early
+        max_size = 5 * 1024 * 1024
+        pdf_bytes = bytearray()
+        range_header = {"Range": f"bytes=0-{max_size - 1}"}
+        try:
+            response = SESSION.get(pdf_url, timeout=30, stream=True, headers=range_header)
+        except requests.exceptions.SSLError as e:
+            if urlparse(pdf_url).hostname not in INSECURE_PDF_HOSTS:
+                logger.warning("Certificate check failed for %s: %s", pdf_url, e)
+                return None
+            logger.warning("Certificate check failed for allow-listed host of %s, retrying without verification", pdf_url)
+            response = SESSION.get(pdf_url, timeout=30, verify=False, stream=True, headers=range_header)
+        with response:
+            if response.status_code not in (200, 206):
+                logger.warning("   ❌ Failed to download PDF: %s", response.status_code)
+                return None
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                pdf_bytes += chunk
+                if len(pdf_bytes) >= max_size:
                     break
 
-            tmp_path = tmp_file.name
-
-        print(f"   📄 PDF downloaded: {total_size} bytes")
+        logger.debug("   📄 PDF downloaded: %s bytes", len(pdf_bytes))
 
         # Prepare prompt for Gemini
         prompt = f"""
@@ -331,88 +479,249 @@ Return ONLY a JSON object in this exact format:
 Bank: {bank_symbol}
 """
 
-        try:
-            # Upload PDF to Gemini
-            uploaded_file = genai.upload_file(tmp_path, mime_type="application/pdf")
+        # PDF goes inline with the prompt (one request instead of upload + generate) and the
+        # model is asked for JSON directly, so no code fences need stripping
+        metadata = gemini_generate_json(prompt, bytes(pdf_bytes))
 
-            # Generate response
-            response = gemini_model.generate_content([prompt, uploaded_file])
+        # Normalize fiscal year
+        if metadata.get('fiscal_year'):
+            metadata['fiscal_year'] = normalize_fiscal_year_format(metadata['fiscal_year'])
 
-            # Clean response and parse JSON
-            response_text = response.text.strip()
+        logger.info("   ✅ Metadata extracted: %s", metadata)
+        with GEMINI_METADATA_CACHE_LOCK:
+            GEMINI_METADATA_CACHE[(pdf_url, bank_symbol)] = dict(metadata)
+        return metadata
 
-            # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
+    except Exception as e:
+        logger.warning("   ⚠️ Failed to extract metadata with Gemini: %s", e)
+        return None
 
-            metadata = json.loads(response_text)
 
-            # Normalize fiscal year
-            if metadata.get('fiscal_year'):
-                metadata['fiscal_year'] = normalize_fiscal_year_format(metadata['fiscal_year'])
+# Separator as users type it: "2080/81", "2080-81", "2080 / 81", "2080–81"
+_FISCAL_YEAR_SEPARATOR_RE = re.compile(r'\s*[/\-\u2013]\s*')
+# Fiscal years embedded in scraped titles and labels, compiled once for the per-document parsers
+_FY_PAIR_RE = re.compile(r'(\d{4})[/\-](\d{2,4})')  # "2080/81", "2080-2081"
+_FY_SLASH_RE = re.compile(r'(\d{3,4})/(\d{2,4})')  # every "YYY(Y)/YY(YY)" in a field, dates included
+_FY_TEXT_RE = re.compile(r'(\d{4}/\d{2,4})')  # "Fiscal Year 2078/79"
+_FY_SHORT_RE = re.compile(r'(\d{2}/\d{2})')  # "80/81"
 
-            print(f"   ✅ Metadata extracted: {metadata}")
-            return metadata
 
-        finally:
-            # Clean up temporary file
-            import os
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+@functools.lru_cache(maxsize=256)
+def normalize_fiscal_year(fiscal_year: str) -> tuple:
+    """
+    Normalize fiscal year to Nepali format and return both formats
+    Separator variants are folded to '/' first so every spelling of a year shares one cache and database key
+    """
+    fiscal_year = sys.intern(_FISCAL_YEAR_SEPARATOR_RE.sub('/', fiscal_year.strip()))
+    return FISCAL_YEAR_BIDI.get(fiscal_year, (fiscal_year, fiscal_year))
+
+
+# Whole banks table keyed on upper-cased symbol, loaded on startup and refreshed in the background
+BANKS_BY_SYMBOL: Dict[str, Dict] = {}
+BANKS_REFRESH_INTERVAL = 300
+# How often each worker polls the cache_generation row for /cache/invalidate calls received by other workers
+CACHE_GENERATION_POLL_INTERVAL = int(os.getenv("CACHE_GENERATION_POLL_INTERVAL", "15"))
+
+# Per-symbol fallback used only while the banks table has not been preloaded; misses are not cached
+BANK_INFO_CACHE = TTLCache(maxsize=512, ttl=300)
+BANK_INFO_CACHE_LOCK = threading.Lock()
+
+# Development bank / finance / microfinance / life insurance rows keyed on (table, symbol); misses are not cached
+INSTITUTION_INFO_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+
+def load_banks() -> int:
+    """Load the whole banks table into BANKS_BY_SYMBOL, keeping the previous copy if the query fails"""
+    global BANKS_BY_SYMBOL
+    try:
+        rows = supabase.table("banks").select("*").execute().data or []
+        BANKS_BY_SYMBOL = {row['symbol'].upper(): row for row in rows if row.get('symbol')}
+        logger.info("🏦 Loaded %s banks into memory", len(BANKS_BY_SYMBOL))
+    except Exception as e:
+        logger.error("Error loading banks table: %s", e)
+    return len(BANKS_BY_SYMBOL)
+
 
+# Database-hit responses of /annual-report and /quarterly-report keyed on (report_type, symbol, nepali_fy, quarter)
+REPORT_RESPONSE_CACHE = TTLCache(maxsize=2048, ttl=600)
+REPORT_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_report_response(key: tuple) -> Optional[Dict]:
+    with REPORT_RESPONSE_CACHE_LOCK:
+        return REPORT_RESPONSE_CACHE.get(key)
+
+
+def cache_report_response(key: tuple, response: Dict) -> Dict:
+    with REPORT_RESPONSE_CACHE_LOCK:
+        REPORT_RESPONSE_CACHE[key] = response
+    return response
+
+
+def clear_report_response_cache() -> int:
+    with REPORT_RESPONSE_CACHE_LOCK:
+        cleared = len(REPORT_RESPONSE_CACHE)
+        REPORT_RESPONSE_CACHE.clear()
+    return cleared
+
+
+# pdf_urls known to be stored per bank_id, filled from lookups and confirmed writes only; the upsert on pdf_url stays authoritative
+EXISTING_URLS_CACHE = TTLCache(maxsize=32, ttl=300)
+EXISTING_URLS_CACHE_LOCK = threading.Lock()
+# Candidate pdf_urls per `in` lookup, keeping the query string well under URL length limits
+EXISTING_URLS_QUERY_BATCH_SIZE = 50
+
+
+def document_report_key(row: Dict) -> tuple:
+    """(fiscal_year, report_type, quarter) of a financial_documents row, unique per bank"""
+    return row['fiscal_year'], row['report_type'], row['quarter']
+
+
+def filter_stored_documents(bank_id: int, rows: List[Dict], results: Dict) -> List[Dict]:
+    """
+    Drop rows whose pdf_url is already stored for the bank, counting them as existing, and rows whose report is
+    already stored under another pdf_url, counting them as conflicting
+    Only candidates not yet known from EXISTING_URLS_CACHE are looked up, so the bank's full URL list is never pulled
+    """
+    with EXISTING_URLS_CACHE_LOCK:
+        known = EXISTING_URLS_CACHE.get(bank_id)
+        if known is None:
+            known = EXISTING_URLS_CACHE[bank_id] = set()
+    unknown = [row['pdf_url'] for row in rows if row['pdf_url'] not in known]
+    for start in range(0, len(unknown), EXISTING_URLS_QUERY_BATCH_SIZE):
+        stored = supabase.table("financial_documents").select("pdf_url").eq("bank_id", bank_id).in_(
+            "pdf_url", unknown[start:start + EXISTING_URLS_QUERY_BATCH_SIZE]).execute()
+        known.update(doc['pdf_url'] for doc in stored.data or [])
+    new_rows = [row for row in rows if row['pdf_url'] not in known]
+    results["existing_documents"] += len(rows) - len(new_rows)
+    # Stored reports of the same fiscal years; inserting one of them again would violate financial_documents_report_key
+    fiscal_years = sorted({row['fiscal_year'] for row in new_rows})
+    stored_keys = set()
+    for start in range(0, len(fiscal_years), EXISTING_URLS_QUERY_BATCH_SIZE):
+        stored = supabase.table("financial_documents").select("fiscal_year,report_type,quarter").eq(
+            "bank_id", bank_id).in_("fiscal_year", fiscal_years[start:start + EXISTING_URLS_QUERY_BATCH_SIZE]).execute()
+        stored_keys.update(document_report_key(doc) for doc in stored.data or [])
+    unstored_rows = [row for row in new_rows if document_report_key(row) not in stored_keys]
+    results["conflicting_documents"] += len(new_rows) - len(unstored_rows)
+    return unstored_rows
+
+
+def mark_documents_stored(bank_id: int, pdf_urls: List[str]):
+    """Record pdf_urls confirmed written (or already present) for the bank in EXISTING_URLS_CACHE"""
+    if not pdf_urls:
+        return
+    with EXISTING_URLS_CACHE_LOCK:
+        known = EXISTING_URLS_CACHE.get(bank_id)
+        if known is None:
+            known = EXISTING_URLS_CACHE[bank_id] = set()
+        known.update(pdf_urls)
+
+
+# Last cache generation this worker has seen; None until it has been read once
+_cache_generation: Optional[str] = None
+
+
+def read_cache_generation() -> Optional[str]:
+    """Current cache generation from the cache_generation table, None when it cannot be read"""
+    try:
+        result = supabase.table("cache_generation").select("generation").eq("id", 1).limit(1).execute()
     except Exception as e:
-        print(f"   ⚠️ Failed to extract metadata with Gemini: {e}")
+        logger.warning("Could not read cache generation: %s", e)
         return None
+    return result.data[0]["generation"] if result.data else ""
 
 
-def normalize_fiscal_year(fiscal_year: str) -> tuple:
-    """Normalize fiscal year to Nepali format and return both formats"""
-    fiscal_year = fiscal_year.strip()
+def bump_cache_generation() -> Optional[str]:
+    """Write a new cache generation so every worker clears its caches, returns it or None when it could not be written"""
+    generation = uuid.uuid4().hex
     try:
-        year_start = int(fiscal_year.split('/')[0])
-        if year_start < 2030:
-            nepali_fy = FISCAL_YEAR_CONVERSION.get(fiscal_year, fiscal_year)
-            return nepali_fy, fiscal_year
-    except:
-        pass
-    english_fy = FISCAL_YEAR_REVERSE.get(fiscal_year, fiscal_year)
-    return fiscal_year, english_fy
+        supabase.table("cache_generation").upsert({"id": 1, "generation": generation,
+                                                   "updated_at": datetime.now().isoformat()}).execute()
+        return generation
+    except Exception as e:
+        logger.warning("Could not write cache generation: %s", e)
+        return None
+
+
+async def _refresh_banks_loop(interval: int):
+    """
+    Reload the banks table every `interval` seconds, and clear this worker's caches as soon as the cache generation
+    changes (another worker served /cache/invalidate)
+    """
+    global _cache_generation
+    _cache_generation = await run_in_threadpool(read_cache_generation)
+    next_reload = time.monotonic() + interval
+    while True:
+        await asyncio.sleep(min(CACHE_GENERATION_POLL_INTERVAL, interval))
+        generation = await run_in_threadpool(read_cache_generation)
+        if generation is not None and _cache_generation is not None and generation != _cache_generation:
+            cleared = clear_local_caches()
+            logger.info("🧹 Cache generation changed, cleared %s", cleared)
+            next_reload = 0
+        if generation is not None:
+            _cache_generation = generation
+        if time.monotonic() >= next_reload:
+            await run_in_threadpool(load_banks)
+            next_reload = time.monotonic() + interval
 
 
 def get_bank_info(bank_symbol: str) -> Optional[Dict]:
-    """Fetch bank information from database"""
+    """
+    Fetch bank information from the preloaded banks table (database lookup until it is loaded)
+    bank_symbol must already be upper-cased; the endpoints normalize it once on entry
+    """
+    if BANKS_BY_SYMBOL:
+        return BANKS_BY_SYMBOL.get(bank_symbol)
+    with BANK_INFO_CACHE_LOCK:
+        cached = BANK_INFO_CACHE.get(bank_symbol)
+    if cached is not None:
+        return cached
     try:
-        result = supabase.table("banks").select("*").eq("symbol", bank_symbol.upper()).execute()
+        result = supabase.table("banks").select("*").eq("symbol", bank_symbol).execute()
         if result.data and len(result.data) > 0:
+            with BANK_INFO_CACHE_LOCK:
+                BANK_INFO_CACHE[bank_symbol] = result.data[0]
             return result.data[0]
         return None
     except Exception as e:
-        print(f"Error fetching bank info: {e}")
+        logger.error("Error fetching bank info: %s", e)
         return None
 
 
-def get_development_bank_info(bank_symbol: str) -> Optional[Dict]:
-    """Fetch development bank information from database"""
+def get_institution_info(table: str, symbol: str) -> Optional[Dict]:
+    """Fetch an institution row by symbol from `table` through INSTITUTION_INFO_CACHE"""
+    key = (table, symbol.upper())
+    with BANK_INFO_CACHE_LOCK:
+        cached = INSTITUTION_INFO_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
-        result = supabase.table("development_banks").select("*").eq("symbol", bank_symbol.upper()).execute()
+        result = supabase.table(table).select("*").eq("symbol", key[1]).execute()
         if result.data and len(result.data) > 0:
+            with BANK_INFO_CACHE_LOCK:
+                INSTITUTION_INFO_CACHE[key] = result.data[0]
             return result.data[0]
         return None
     except Exception as e:
-        print(f"Error fetching development bank info: {e}")
+        logger.error("Error fetching %s info: %s", table, e)
         return None
 
 
-def check_document_exists(bank_id: int, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[
-    Dict]:
-    """Check if document already exists in financial_documents table"""
+def get_development_bank_info(bank_symbol: str) -> Optional[Dict]:
+    """Fetch development bank information from database"""
+    return get_institution_info("development_banks", bank_symbol)
+
+
+def check_document_exists_any(bank_id: int, fiscal_years: List[str], report_type: str,
+                              quarter: Optional[str] = None, table: str = "financial_documents",
+                              id_column: str = "bank_id") -> Optional[Dict]:
+    """
+    Check if a document exists for any of the given fiscal year strings in one query
+    Rows are preferred in the order the fiscal years are listed
+    """
     try:
-        query = supabase.table("financial_documents").select("*").eq("bank_id", bank_id).eq("fiscal_year",
-                                                                                            fiscal_year).eq(
-            "report_type", report_type)
+        query = supabase.table(table).select("*").eq(id_column, bank_id).in_(
+            "fiscal_year", list(dict.fromkeys(fiscal_years))).eq("report_type", report_type)
         if quarter:
             query = query.eq("quarter", quarter)
         else:
@@ -420,62 +729,30 @@ def check_document_exists(bank_id: int, fiscal_year: str, report_type: str, quar
         result = query.execute()
 
         if result.data and len(result.data) > 0:
+            for fy in fiscal_years:
+                for row in result.data:
+                    if row.get('fiscal_year') == fy:
+                        return row
             return result.data[0]
-
-        nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-        alt_fy = english_fy if fiscal_year == nepali_fy else nepali_fy
-
-        if alt_fy != fiscal_year:
-            query_alt = supabase.table("financial_documents").select("*").eq("bank_id", bank_id).eq("fiscal_year",
-                                                                                                    alt_fy).eq(
-                "report_type", report_type)
-            if quarter:
-                query_alt = query_alt.eq("quarter", quarter)
-            else:
-                query_alt = query_alt.is_("quarter", "null")
-            result_alt = query_alt.execute()
-            if result_alt.data and len(result_alt.data) > 0:
-                return result_alt.data[0]
         return None
     except Exception as e:
-        print(f"Error checking document: {e}")
+        logger.error("Error checking %s document: %s", table, e)
         return None
 
 
-def check_dev_bank_document_exists(bank_id: int, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[
+def check_document_exists(bank_id: int, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[
     Dict]:
-    """Check if document already exists in development_banks_documents table"""
-    try:
-        query = supabase.table("development_banks_documents").select("*").eq("bank_id", bank_id).eq("fiscal_year",
-                                                                                            fiscal_year).eq(
-            "report_type", report_type)
-        if quarter:
-            query = query.eq("quarter", quarter)
-        else:
-            query = query.is_("quarter", "null")
-        result = query.execute()
+    """Check if document already exists in financial_documents table (either fiscal year format)"""
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    return check_document_exists_any(bank_id, [fiscal_year, nepali_fy, english_fy], report_type, quarter)
 
-        if result.data and len(result.data) > 0:
-            return result.data[0]
 
-        nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-        alt_fy = english_fy if fiscal_year == nepali_fy else nepali_fy
-
-        if alt_fy != fiscal_year:
-            query_alt = supabase.table("development_banks_documents").select("*").eq("bank_id", bank_id).eq("fiscal_year",
-                                                                                                    alt_fy).eq(
-                "report_type", report_type)
-            if quarter:
-                query_alt = query_alt.eq("quarter", quarter)
-            else:
-                query_alt = query_alt.is_("quarter", "null")
-            result_alt = query_alt.execute()
-            if result_alt.data and len(result_alt.data) > 0:
-                return result_alt.data[0]
-        return None
-    except Exception as e:
-        print(f"Error checking development bank document: {e}")
-        return None
+def check_dev_bank_document_exists(bank_id: int, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[
+    Dict]:
+    """Check if document already exists in development_banks_documents table (either fiscal year format)"""
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    return check_document_exists_any(bank_id, [fiscal_year, nepali_fy, english_fy], report_type, quarter,
+                                     table="development_banks_documents", id_column="bank_id")
 
 
 # ============================================================================
@@ -683,50 +960,14 @@ MICROFINANCE_SKIP = {
 
 def get_finance_company_info(company_symbol: str) -> Optional[Dict]:
     """Fetch finance company information from database"""
-    try:
-        result = supabase.table("finance_companies").select("*").eq("symbol", company_symbol.upper()).execute()
-        if result.data and len(result.data) > 0:
-            return result.data[0]
-        return None
-    except Exception as e:
-        print(f"Error fetching finance company info: {e}")
-        return None
+    return get_institution_info("finance_companies", company_symbol)
 
 
 def check_finance_company_document_exists(company_id: int, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
-    """Check if document already exists in finance_companies_documents table"""
-    try:
-        query = supabase.table("finance_companies_documents").select("*").eq("finance_company_id", company_id).eq("fiscal_year",
-                                                                                            fiscal_year).eq(
-            "report_type", report_type)
-        if quarter:
-            query = query.eq("quarter", quarter)
-        else:
-            query = query.is_("quarter", "null")
-        result = query.execute()
-
-        if result.data and len(result.data) > 0:
-            return result.data[0]
-
-        # Try alternate fiscal year format
-        nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-        alt_fy = english_fy if fiscal_year == nepali_fy else nepali_fy
-
-        if alt_fy != fiscal_year:
-            query_alt = supabase.table("finance_companies_documents").select("*").eq("finance_company_id", company_id).eq("fiscal_year",
-                                                                                                    alt_fy).eq(
-                "report_type", report_type)
-            if quarter:
-                query_alt = query_alt.eq("quarter", quarter)
-            else:
-                query_alt = query_alt.is_("quarter", "null")
-            result_alt = query_alt.execute()
-            if result_alt.data and len(result_alt.data) > 0:
-                return result_alt.data[0]
-        return None
-    except Exception as e:
-        print(f"Error checking finance company document: {e}")
-        return None
+    """Check if document already exists in finance_companies_documents table (either fiscal year format)"""
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    return check_document_exists_any(company_id, [fiscal_year, nepali_fy, english_fy], report_type, quarter,
+                                     table="finance_companies_documents", id_column="finance_company_id")
 
 
 def has_finance_company_dynamic_api(company_symbol: str) -> bool:
@@ -753,7 +994,7 @@ def insert_finance_company_document_to_db(company_id: int, company_symbol: str,
         existing = supabase.table("finance_companies_documents").select("*").eq("pdf_url", pdf_url).execute()
 
         if existing.data and len(existing.data) > 0:
-            print(f"   📄 PDF URL already exists in database")
+            logger.info("   📄 PDF URL already exists in database")
             existing_doc = existing.data[0]
 
             # Check if we have better metadata from Gemini
@@ -776,7 +1017,7 @@ def insert_finance_company_document_to_db(company_id: int, company_symbol: str,
                 update_data['report_type'] = report['report_type']
 
             if should_update:
-                print(f"   ✏️  Updating existing record with better metadata from Gemini")
+                logger.info("   ✏️  Updating existing record with better metadata from Gemini")
                 update_data['updated_at'] = datetime.now().isoformat()
                 updated = supabase.table("finance_companies_documents")\
                     .update(update_data)\
@@ -784,7 +1025,7 @@ def insert_finance_company_document_to_db(company_id: int, company_symbol: str,
                     .execute()
                 return updated.data[0] if updated.data else existing_doc
             else:
-                print(f"   ℹ️  Existing record already has complete metadata")
+                logger.info("   ℹ️  Existing record already has complete metadata")
                 return existing_doc
 
         # Insert new document
@@ -801,11 +1042,11 @@ def insert_finance_company_document_to_db(company_id: int, company_symbol: str,
         }
 
         result = supabase.table("finance_companies_documents").insert(doc_data).execute()
-        print(f"   ✅ Document inserted to database")
+        logger.info("   ✅ Document inserted to database")
         return result.data[0] if result.data else doc_data
 
     except Exception as e:
-        print(f"   ❌ Error inserting finance company document: {e}")
+        logger.error("   ❌ Error inserting finance company document: %s", e)
         raise
 
 
@@ -815,50 +1056,14 @@ def insert_finance_company_document_to_db(company_id: int, company_symbol: str,
 
 def get_microfinance_company_info(company_symbol: str) -> Optional[Dict]:
     """Fetch microfinance company information from database"""
-    try:
-        result = supabase.table("microfinance_companies").select("*").eq("symbol", company_symbol.upper()).execute()
-        if result.data and len(result.data) > 0:
-            return result.data[0]
-        return None
-    except Exception as e:
-        print(f"Error fetching microfinance company info: {e}")
-        return None
+    return get_institution_info("microfinance_companies", company_symbol)
 
 
 def check_microfinance_company_document_exists(company_id: int, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
-    """Check if document already exists in microfinance_companies_documents table"""
-    try:
-        query = supabase.table("microfinance_companies_documents").select("*").eq("microfinance_id", company_id).eq("fiscal_year",
-                                                                                            fiscal_year).eq(
-            "report_type", report_type)
-        if quarter:
-            query = query.eq("quarter", quarter)
-        else:
-            query = query.is_("quarter", "null")
-        result = query.execute()
-
-        if result.data and len(result.data) > 0:
-            return result.data[0]
-
-        # Try alternate fiscal year format
-        nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-        alt_fy = english_fy if fiscal_year == nepali_fy else nepali_fy
-
-        if alt_fy != fiscal_year:
-            query_alt = supabase.table("microfinance_companies_documents").select("*").eq("microfinance_id", company_id).eq("fiscal_year",
-                                                                                                    alt_fy).eq(
-                "report_type", report_type)
-            if quarter:
-                query_alt = query_alt.eq("quarter", quarter)
-            else:
-                query_alt = query_alt.is_("quarter", "null")
-            result_alt = query_alt.execute()
-            if result_alt.data and len(result_alt.data) > 0:
-                return result_alt.data[0]
-        return None
-    except Exception as e:
-        print(f"Error checking microfinance company document: {e}")
-        return None
+    """Check if document already exists in microfinance_companies_documents table (either fiscal year format)"""
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    return check_document_exists_any(company_id, [fiscal_year, nepali_fy, english_fy], report_type, quarter,
+                                     table="microfinance_companies_documents", id_column="microfinance_id")
 
 
 def insert_microfinance_company_document_to_db(company_id: int, company_symbol: str, report: Dict) -> Dict:
@@ -875,7 +1080,7 @@ def insert_microfinance_company_document_to_db(company_id: int, company_symbol:
         existing = supabase.table("microfinance_companies_documents").select("*").eq("pdf_url", pdf_url).execute()
 
         if existing.data and len(existing.data) > 0:
-            print(f"   📄 PDF URL already exists in database")
+            logger.info("   📄 PDF URL already exists in database")
             existing_doc = existing.data[0]
 
             # Check if we have better metadata from Gemini
@@ -898,7 +1103,7 @@ def insert_microfinance_company_document_to_db(company_id: int, company_symbol:
                 update_data['report_type'] = report['report_type']
 
             if should_update:
-                print(f"   ✏️  Updating existing record with better metadata from Gemini")
+                logger.info("   ✏️  Updating existing record with better metadata from Gemini")
                 update_data['updated_at'] = datetime.now().isoformat()
                 updated = supabase.table("microfinance_companies_documents")\
                     .update(update_data)\
@@ -906,7 +1111,7 @@ def insert_microfinance_company_document_to_db(company_id: int, company_symbol:
                     .execute()
                 return updated.data[0] if updated.data else existing_doc
             else:
-                print(f"   ℹ️  Existing record already has complete metadata")
+                logger.info("   ℹ️  Existing record already has complete metadata")
                 return existing_doc
 
         # Insert new document
@@ -923,11 +1128,11 @@ def insert_microfinance_company_document_to_db(company_id: int, company_symbol:
         }
 
         result = supabase.table("microfinance_companies_documents").insert(doc_data).execute()
-        print(f"   ✅ Document inserted to database")
+        logger.info("   ✅ Document inserted to database")
         return result.data[0] if result.data else doc_data
 
     except Exception as e:
-        print(f"   ❌ Error inserting microfinance company document: {e}")
+        logger.error("   ❌ Error inserting microfinance company document: %s", e)
         raise
 
 
@@ -944,8 +1149,6 @@ class VijayaTokenManager:
 
     def get_token(self):
         """Get valid token, refresh if expired"""
-        import time
-
         if self.token and time.time() < self.expires_at:
             return self.token
 
@@ -953,13 +1156,13 @@ class VijayaTokenManager:
         config = MICROFINANCE_DYNAMIC_API["VLBS"]
         TOKEN_URL = config["token_url"]
 
-        response = requests.post(TOKEN_URL, data={
+        response = SESSION.post(TOKEN_URL, data={
             "client_id": config["client_id"],
             "client_secret": config["client_secret"],
             "grant_type": "client_credentials"
         }, headers={"Content-Type": "application/x-www-form-urlencoded"}, timeout=10)
 
-        data = response.json()
+        data = orjson.loads(response.content)
         self.token = data["access_token"]
         self.expires_at = time.time() + 3500  # 100s buffer before 3600s expiry
 
@@ -968,6 +1171,18 @@ class VijayaTokenManager:
 # Global token manager instance
 vijaya_token_manager = VijayaTokenManager()
 
+# Ordinal keywords the company APIs use in quarterly titles, one compiled alternation per quarter
+ORDINAL_QUARTER_KEYWORDS = {'Q1': ('first', '1st', 'q1'), 'Q2': ('second', '2nd', 'q2'),
+                            'Q3': ('third', '3rd', 'q3'), 'Q4': ('fourth', '4th', 'q4')}
+_ORDINAL_QUARTER_RE = {qtr: re.compile('|'.join(map(re.escape, keywords)))
+                       for qtr, keywords in ORDINAL_QUARTER_KEYWORDS.items()}
+
+
+def title_matches_quarter(title_lower: str, quarter: str) -> bool:
+    """True if the lower-cased title names the quarter (Q1..Q4) by ordinal word or qN token"""
+    pattern = _ORDINAL_QUARTER_RE.get(quarter)
+    return bool(pattern and pattern.search(title_lower))
+
 
 def fetch_from_vijaya_jwt_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     """Fetch reports from Vijaya Laghubitta JWT API"""
@@ -991,12 +1206,12 @@ def fetch_from_vijaya_jwt_api(fiscal_year: str, report_type: str, quarter: Optio
             "language": "en"
         }
 
-        response = requests.get(config["api_url"], headers=headers, params=params, timeout=15)
+        response = SESSION.get(config["api_url"], headers=headers, params=params, timeout=15)
 
         if response.status_code != 200:
             return None
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Extract reports from response
         if not data or 'data' not in data:
@@ -1016,16 +1231,7 @@ def fetch_from_vijaya_jwt_api(fiscal_year: str, report_type: str, quarter: Optio
                 # For quarterly, check quarter
                 if report_type == "quarterly" and quarter:
                     file_title = report.get('file_title', '').lower()
-                    quarter_match = False
-
-                    if quarter == 'Q1' and any(k in file_title for k in ['first', '1st', 'q1']):
-                        quarter_match = True
-                    elif quarter == 'Q2' and any(k in file_title for k in ['second', '2nd', 'q2']):
-                        quarter_match = True
-                    elif quarter == 'Q3' and any(k in file_title for k in ['third', '3rd', 'q3']):
-                        quarter_match = True
-                    elif quarter == 'Q4' and any(k in file_title for k in ['fourth', '4th', 'q4']):
-                        quarter_match = True
+                    quarter_match = title_matches_quarter(file_title, quarter)
 
                     if not quarter_match:
                         continue
@@ -1048,7 +1254,7 @@ def fetch_from_vijaya_jwt_api(fiscal_year: str, report_type: str, quarter: Optio
         return None
 
     except Exception as e:
-        print(f"  ❌ Error fetching from Vijaya API: {e}")
+        logger.error("  ❌ Error fetching from Vijaya API: %s", e)
         return None
 
 
@@ -1062,15 +1268,15 @@ def fetch_from_nicbl_api(fiscal_year: str, report_type: str, quarter: Optional[s
         nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
         api_url_with_year = f"{api_url}?fiscalYear={nepali_fy.replace('/', '%2F')}"
 
-        response = requests.get(api_url_with_year, timeout=15)
+        response = SESSION.get(api_url_with_year, timeout=15)
 
         if response.status_code != 200:
             # Try without fiscal year filter
-            response = requests.get(api_url, timeout=15)
+            response = SESSION.get(api_url, timeout=15)
             if response.status_code != 200:
                 return None
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Determine target category
         target_category = config["annual_category"] if report_type == "annual" else config["quarterly_category"]
@@ -1098,16 +1304,7 @@ def fetch_from_nicbl_api(fiscal_year: str, report_type: str, quarter: Optional[s
                 # For quarterly, check quarter
                 if report_type == "quarterly" and quarter:
                     title_lower = doc_title.lower()
-                    quarter_match = False
-
-                    if quarter == 'Q1' and any(k in title_lower for k in ['first', '1st', 'q1']):
-                        quarter_match = True
-                    elif quarter == 'Q2' and any(k in title_lower for k in ['second', '2nd', 'q2']):
-                        quarter_match = True
-                    elif quarter == 'Q3' and any(k in title_lower for k in ['third', '3rd', 'q3']):
-                        quarter_match = True
-                    elif quarter == 'Q4' and any(k in title_lower for k in ['fourth', '4th', 'q4']):
-                        quarter_match = True
+                    quarter_match = title_matches_quarter(title_lower, quarter)
 
                     if not quarter_match:
                         continue
@@ -1136,16 +1333,7 @@ def fetch_from_nicbl_api(fiscal_year: str, report_type: str, quarter: Optional[s
                         # Quarter check for quarterly reports
                         if report_type == "quarterly" and quarter:
                             title_lower = doc_title.lower()
-                            quarter_match = False
-
-                            if quarter == 'Q1' and any(k in title_lower for k in ['first', '1st', 'q1']):
-                                quarter_match = True
-                            elif quarter == 'Q2' and any(k in title_lower for k in ['second', '2nd', 'q2']):
-                                quarter_match = True
-                            elif quarter == 'Q3' and any(k in title_lower for k in ['third', '3rd', 'q3']):
-                                quarter_match = True
-                            elif quarter == 'Q4' and any(k in title_lower for k in ['fourth', '4th', 'q4']):
-                                quarter_match = True
+                            quarter_match = title_matches_quarter(title_lower, quarter)
 
                             if not quarter_match:
                                 continue
@@ -1165,10 +1353,28 @@ def fetch_from_nicbl_api(fiscal_year: str, report_type: str, quarter: Optional[s
         return None
 
     except Exception as e:
-        print(f"  ❌ Error fetching from NicAsia Laghubitta API: {e}")
+        logger.error("  ❌ Error fetching from NicAsia Laghubitta API: %s", e)
         return None
 
 
+# Ninja Tables data URLs fetched at once when searching a GILB report page
+GILB_TABLE_FETCH_WORKERS = 8
+_GILB_DATA_URL_RE = re.compile(r'"data_request_url":"(https:\\/\\/gilb\.com\.np\\/wp-admin\\/admin-ajax\.php[^"]+)"')
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']')
+
+
+def _fetch_gilb_table(raw_url: str) -> List[Dict]:
+    """Rows of one GILB Ninja Tables data URL, or [] when it cannot be fetched"""
+    try:
+        api_response = SESSION.get(raw_url.replace('\\/', '/'), timeout=10)
+        if api_response.status_code != 200:
+            return []
+        return orjson.loads(api_response.content)
+    except Exception as e:
+        logger.warning("  ⚠️ GILB table fetch failed: %s", e)
+        return []
+
+
 def fetch_from_gilb_ninja_tables(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     """Fetch reports from Global IME Laghubitta using Ninja Tables API"""
     try:
@@ -1176,15 +1382,14 @@ def fetch_from_gilb_ninja_tables(fiscal_year: str, report_type: str, quarter: Op
         page_url = config["annual_page"] if report_type == "annual" else config["quarterly_page"]
 
         # Get API URLs from page
-        response = requests.get(page_url, timeout=15)
+        response = SESSION.get(page_url, timeout=15)
         if response.status_code != 200:
             return None
 
         html = response.text
 
         # Extract API URLs
-        pattern = r'"data_request_url":"(https:\\/\\/gilb\.com\.np\\/wp-admin\\/admin-ajax\.php[^"]+)"'
-        matches = re.findall(pattern, html)
+        matches = _GILB_DATA_URL_RE.findall(html)
 
         if not matches:
             return None
@@ -1192,41 +1397,33 @@ def fetch_from_gilb_ninja_tables(fiscal_year: str, report_type: str, quarter: Op
         # Normalize fiscal year
         nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
+        # Fetch every table once, concurrently; both searches below scan them in page order
+        with ThreadPoolExecutor(max_workers=min(len(matches), GILB_TABLE_FETCH_WORKERS)) as pool:
+            tables = list(pool.map(_fetch_gilb_table, matches))
+
         # Check special mapping for GILB
         special_mapping = config.get("special_mapping", {})
         for ordinal, mapped_year in special_mapping.items():
             if mapped_year == nepali_fy or mapped_year == fiscal_year:
                 # Search for ordinal in title (e.g., "8th annual")
-                for match in matches:
-                    clean_url = match.replace('\\/', '/')
-                    api_response = requests.get(clean_url, timeout=10)
-                    if api_response.status_code == 200:
-                        data = api_response.json()
-                        for row in data:
-                            title = row.get('report_details', '').lower()
-                            if ordinal in title:
-                                # Extract PDF link
-                                downloads = row.get('downloads', '')
-                                link_match = re.search(r'href=["\']([^"\']+)["\']', downloads)
-                                if link_match:
-                                    return {
-                                        'pdf_url': link_match.group(1),
-                                        'fiscal_year': nepali_fy,
-                                        'report_type': report_type,
-                                        'quarter': quarter if report_type == 'quarterly' else None,
-                                        'source': 'gilb_ninja_tables'
-                                    }
+                for data in tables:
+                    for row in data:
+                        title = row.get('report_details', '').lower()
+                        if ordinal in title:
+                            # Extract PDF link
+                            downloads = row.get('downloads', '')
+                            link_match = _HREF_RE.search(downloads)
+                            if link_match:
+                                return {
+                                    'pdf_url': link_match.group(1),
+                                    'fiscal_year': nepali_fy,
+                                    'report_type': report_type,
+                                    'quarter': quarter if report_type == 'quarterly' else None,
+                                    'source': 'gilb_ninja_tables'
+                                }
 
         # Standard search by fiscal year
-        for raw_url in matches:
-            clean_url = raw_url.replace('\\/', '/')
-
-            api_response = requests.get(clean_url, timeout=10)
-            if api_response.status_code != 200:
-                continue
-
-            data = api_response.json()
-
+        for data in tables:
             for row in data:
                 if 'report_details' not in row:
                     continue
@@ -1240,23 +1437,14 @@ def fetch_from_gilb_ninja_tables(fiscal_year: str, report_type: str, quarter: Op
                 # For quarterly, check quarter
                 if report_type == "quarterly" and quarter:
                     title_lower = title.lower()
-                    quarter_match = False
-
-                    if quarter == 'Q1' and any(k in title_lower for k in ['first', '1st', 'q1']):
-                        quarter_match = True
-                    elif quarter == 'Q2' and any(k in title_lower for k in ['second', '2nd', 'q2', 'mid']):
-                        quarter_match = True
-                    elif quarter == 'Q3' and any(k in title_lower for k in ['third', '3rd', 'q3']):
-                        quarter_match = True
-                    elif quarter == 'Q4' and any(k in title_lower for k in ['fourth', '4th', 'q4']):
-                        quarter_match = True
+                    quarter_match = title_matches_quarter(title_lower, quarter) or (quarter == 'Q2' and 'mid' in title_lower)
 
                     if not quarter_match:
                         continue
 
                 # Extract PDF link
                 downloads = row.get('downloads', '')
-                link_match = re.search(r'href=["\']([^"\']+)["\']', downloads)
+                link_match = _HREF_RE.search(downloads)
 
                 if link_match:
                     return {
@@ -1270,7 +1458,7 @@ def fetch_from_gilb_ninja_tables(fiscal_year: str, report_type: str, quarter: Op
         return None
 
     except Exception as e:
-        print(f"  ❌ Error fetching from GILB Ninja Tables: {e}")
+        logger.error("  ❌ Error fetching from GILB Ninja Tables: %s", e)
         return None
 
 
@@ -1282,7 +1470,10 @@ def fetch_from_ddbl_csrf_form(fiscal_year: str, report_type: str, quarter: Optio
         config = MICROFINANCE_CSRF_FORM["DDBL"]
         url = config["annual_url"] if report_type == "annual" else config["quarterly_url"]
 
+        # Own cookie jar for the CSRF token, but the shared keep-alive pool (closing it would close SESSION's pool)
         session = requests.Session()
+        session.mount("https://", _session_adapter)
+        session.mount("http://", _session_adapter)
 
         # Get page with CSRF token
         response = session.get(url, timeout=15)
@@ -1330,7 +1521,7 @@ def fetch_from_ddbl_csrf_form(fiscal_year: str, report_type: str, quarter: Optio
                 title = title_tag.get_text(strip=True) if title_tag else ""
 
                 # Extract fiscal year from title or year label
-                fy_match = re.search(r'(\d{4})[/\-](\d{2,4})', title or year_label)
+                fy_match = _FY_PAIR_RE.search(title or year_label)
                 if fy_match:
                     doc_fy = f"{fy_match.group(1)}/{fy_match.group(2)[-2:]}"
                 else:
@@ -1343,16 +1534,7 @@ def fetch_from_ddbl_csrf_form(fiscal_year: str, report_type: str, quarter: Optio
                     # For quarterly, check quarter in title
                     if report_type == "quarterly" and quarter:
                         title_lower = title.lower()
-                        quarter_match = False
-
-                        if quarter == 'Q1' and any(k in title_lower for k in ['first', '1st', 'q1']):
-                            quarter_match = True
-                        elif quarter == 'Q2' and any(k in title_lower for k in ['second', '2nd', 'q2']):
-                            quarter_match = True
-                        elif quarter == 'Q3' and any(k in title_lower for k in ['third', '3rd', 'q3']):
-                            quarter_match = True
-                        elif quarter == 'Q4' and any(k in title_lower for k in ['fourth', '4th', 'q4']):
-                            quarter_match = True
+                        quarter_match = title_matches_quarter(title_lower, quarter)
 
                         if not quarter_match:
                             continue
@@ -1368,7 +1550,7 @@ def fetch_from_ddbl_csrf_form(fiscal_year: str, report_type: str, quarter: Optio
         return None
 
     except Exception as e:
-        print(f"  ❌ Error fetching from Deprosc CSRF form: {e}")
+        logger.error("  ❌ Error fetching from Deprosc CSRF form: %s", e)
         return None
 
 
@@ -1410,97 +1592,278 @@ def get_scraping_urls(bank: Dict, report_type: str) -> List[tuple]:
 
 
 def has_dynamic_api(bank_symbol: str) -> bool:
-    """Check if bank has a dynamic API configured"""
-    return bank_symbol.upper() in DYNAMIC_API_BANKS
+    """Check if bank has a dynamic API configured (bank_symbol upper-cased by the caller)"""
+    return bank_symbol in DYNAMIC_API_BANKS
+
+
+# Seconds a bank API catalog is reused before it is revalidated upstream (shared by the raw and indexed caches)
+CATALOG_CACHE_TTL = int(os.getenv("CATALOG_CACHE_TTL", "900"))
+
+# Parsed bank API responses keyed on URL; these catalogs change only a few times per quarter
+_catalog_cache = TTLCache(maxsize=512, ttl=CATALOG_CACHE_TTL)
+_catalog_locks: Dict[str, asyncio.Lock] = {}
+
+# Last response validators (ETag, Last-Modified) and parsed value per URL, kept past the TTL so a refresh can be
+# a conditional GET; only stored when the bank API sends validators
+_catalog_validators = TTLCache(maxsize=512, ttl=86400)
+
+
+async def _get_catalog(bank_key: str, url: str, timeout: float = 20) -> Optional[Dict]:
+    """
+    Fetch a bank API JSON document through the catalog cache
+    Concurrent misses for the same URL share one upstream request; non-200 responses are not cached
+    """
+    cached = _catalog_cache.get(url)
+    if cached is not None:
+        return cached
+    async with _catalog_locks.setdefault(url, asyncio.Lock()):
+        cached = _catalog_cache.get(url)
+        if cached is not None:
+            return cached
+        data = await _fetch_catalog(bank_key, url, timeout)
+        if data is not None:
+            _catalog_cache[url] = data
+        return data
+
+
+async def _fetch_catalog(bank_key: str, url: str, timeout: float, builder=None):
+    """
+    Fetch and decode a bank API JSON document (passed through builder if given), or None on a non-200 response
+    Revalidates with If-None-Match/If-Modified-Since when validators are known; a 304 reuses the previous value
+    """
+    key = (url, builder)
+    previous = _catalog_validators.get(key)
+    headers = {}
+    if previous:
+        etag, last_modified, _ = previous
+        if etag: headers['If-None-Match'] = etag
+        if last_modified: headers['If-Modified-Since'] = last_modified
+    async with http_client.stream("GET", url, headers=headers, timeout=timeout) as response:
+        if response.status_code == 304 and previous:
+            logger.debug("  %s API catalog not modified, reusing parsed copy", bank_key)
+            _catalog_validators[key] = previous
+            return previous[2]
+        if response.status_code != 200:
+            logger.warning("  %s API returned status %s", bank_key, response.status_code)
+            return None
+        body = await response.aread()
+        etag, last_modified = response.headers.get('etag'), response.headers.get('last-modified')
+    value = orjson.loads(body)
+    if builder is not None:
+        value = builder(value)
+    if etag or last_modified:
+        _catalog_validators[key] = (etag, last_modified, value)
+    return value
+
+
+# Decoded finance company / microfinance / life insurance API responses keyed on URL, for the sync fetchers
+_api_json_cache = TTLCache(maxsize=64, ttl=CATALOG_CACHE_TTL)
+_api_json_cache_lock = threading.Lock()
+
+
+def get_api_json(url: str, headers: Optional[Dict] = None, timeout: float = 15):
+    """
+    Fetch and decode a company API JSON document through _api_json_cache (the sync counterpart of _get_catalog)
+    Returns None on a non-200 response, which is not cached
+    """
+    with _api_json_cache_lock:
+        cached = _api_json_cache.get(url)
+    if cached is not None:
+        return cached
+    response = SESSION.get(url, headers=headers, timeout=timeout)
+    if response.status_code != 200:
+        logger.warning("  API returned status %s: %s", response.status_code, url)
+        return None
+    data = orjson.loads(response.content)
+    with _api_json_cache_lock:
+        _api_json_cache[url] = data
+    return data
+
+
+# Quarter lookup tables shared by the bank API parsers (built once instead of per document)
+# systemName of the CMS 'quater' object (the bank CMS APIs spell it "quater")
+QUATER_SYSTEM_NAME_MAP = {'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3', 'fourth_quater': 'Q4'}
+# Keywords NABIL uses in quarterly document names
+NABIL_QUARTER_KEYWORDS = {'Q1': ('first', 'q1', '1st'), 'Q2': ('second', 'q2', '2nd'),
+                          'Q3': ('third', 'q3', '3rd'), 'Q4': ('fourth', 'q4', '4th')}
+_GBIME_SYS_NAME_MAP = {'first': 'Q1', 'second': 'Q2', 'third': 'Q3', 'fourth': 'Q4'}
+_NAME_Q_TOKENS = (('q1', 'Q1'), ('q2', 'Q2'), ('q3', 'Q3'), ('q4', 'Q4'))
+# Title fallback after the qN tokens: ordinals and closing months, checked Q1 first wherever they appear
+_TITLE_QUARTER_WORDS = (('1st', 'Q1'), ('ashwin', 'Q1'), ('2nd', 'Q2'), ('poush', 'Q2'),
+                        ('3rd', 'Q3'), ('chaitra', 'Q3'), ('4th', 'Q4'), ('ashad', 'Q4'))
+
+
+def infer_nabil_quarter(name_lower: str) -> Optional[str]:
+    """Quarter from the first NABIL_QUARTER_KEYWORDS entry (Q1..Q4) with a keyword in the lower-cased name"""
+    return next((qtr for qtr, keywords in NABIL_QUARTER_KEYWORDS.items() if any(kw in name_lower for kw in keywords)),
+                None)
+
+
+def extract_q_token_quarter(name: str) -> Optional[str]:
+    """Quarter from the first of q1..q4 (checked in that order) found anywhere in the name"""
+    name = name.lower()
+    return next((qtr for token, qtr in _NAME_Q_TOKENS if token in name), None)
+
+
+def resolve_quarter_from_quater_obj(quater_obj: Optional[Dict]) -> Optional[str]:
+    """Map a CMS 'quater' object (e.g. {"systemName": "first_quater"}) to Q1-Q4"""
+    if not quater_obj: return None
+    return QUATER_SYSTEM_NAME_MAP.get((quater_obj.get('systemName') or '').lower())
+
+
+# Indexes built from a catalog keyed on URL; only the index is kept, the raw document tree is dropped
+_catalog_index_cache = TTLCache(maxsize=512, ttl=CATALOG_CACHE_TTL)
+
+
+async def _get_catalog_index(bank_key: str, url: str, builder, timeout: float = 20):
+    """
+    Return builder(catalog) for a bank API catalog, caching only the derived index
+    Concurrent misses for the same URL share one upstream request and one build
+    """
+    cached = _catalog_index_cache.get(url)
+    if cached is not None:
+        return cached
+    async with _catalog_locks.setdefault(url, asyncio.Lock()):
+        cached = _catalog_index_cache.get(url)
+        if cached is not None:
+            return cached
+        index = await _fetch_catalog(bank_key, url, timeout, builder)
+        if index is not None:
+            _catalog_index_cache[url] = index
+        return index
+
+
+def _build_sanima_index(api_response: Dict) -> Dict[tuple, List[tuple]]:
+    """
+    Index Sanima documents in one pass
+    (category name, normalized fiscal year) -> [(position, category no, quarter, doc)] in catalog order
+    """
+    index = defaultdict(list)
+    if api_response.get('resCod') != '200': return index
+    position = 0
+    for category_no, category in enumerate(api_response.get('data', {}).get('documentCategory', []) or []):
+        for subcategory in category.get('subCategories', []) or []:
+            for doc in subcategory.get('documents', []) or []:
+                doc_quarter = resolve_quarter_from_quater_obj(doc.get('quater'))
+                doc_fy = normalize_fiscal_year_format(doc.get('fiscal_year', ''))
+                index[(category.get('name'), doc_fy)].append((position, category_no, doc_quarter, doc))
+                position += 1
+    return index
+
+
+def _build_nabil_index(api_response: Dict) -> Dict[tuple, List[Dict]]:
+    """
+    Index NABIL documents in one pass
+    (subcategory id, normalized fiscal year) -> [doc] in catalog order, from the first listing of each subcategory
+    """
+    index = defaultdict(list)
+    seen_subcategories = set()
+    for subcategory in api_response.get('data', []) or []:
+        subcat_id = subcategory.get('subcategory_id')
+        if subcat_id in seen_subcategories: continue
+        seen_subcategories.add(subcat_id)
+        for doc in subcategory.get('documents', []) or []:
+            index[(subcat_id, normalize_fiscal_year_format(doc.get('fiscal_year', '')))].append(doc)
+    return index
+
+
+def _build_nimb_index(api_response: Dict) -> Dict[tuple, List[tuple]]:
+    """
+    Index NIMB documents in one pass
+    (report type, normalized fiscal year) -> [(position, category no, quarter, doc)] in catalog order
+    """
+    config = DYNAMIC_API_BANKS["NIMB"]
+    index = defaultdict(list)
+    if api_response.get('resCod') != '200': return index
+    position = 0
+    for category_no, category in enumerate(api_response.get('data', {}).get('documentCategory', []) or []):
+        name = category.get('name', '')
+        report_types = [rt for rt, keywords in (('annual', config['annual_keywords']),
+                                                ('quarterly', config['quarterly_keywords']))
+                        if any(keyword in name for keyword in keywords)]
+        if not report_types: continue
+        # Documents nested in subcategories first, then any placed directly on the category
+        docs = [doc for subcategory in category.get('subCategories', []) or []
+                for doc in subcategory.get('documents', []) or []]
+        docs.extend(category.get('documents', []) or [])
+        for doc in docs:
+            doc_quarter = resolve_quarter_from_quater_obj(doc.get('quater'))
+            doc_fy = normalize_fiscal_year_format(doc.get('fiscal_year', ''))
+            for report_type in report_types:
+                index[(report_type, doc_fy)].append((position, category_no, doc_quarter, doc))
+            position += 1
+    return index
 
 
 # --- GBIME SPECIFIC HELPERS ---
 def extract_gbime_quarter(quarter_obj, title):
     if quarter_obj:
         sys_name = quarter_obj.get('systemName', '').lower()
-        if 'first' in sys_name: return 'Q1'
-        if 'second' in sys_name: return 'Q2'
-        if 'third' in sys_name: return 'Q3'
-        if 'fourth' in sys_name: return 'Q4'
+        for word, qtr in _GBIME_SYS_NAME_MAP.items():
+            if word in sys_name: return qtr
     t_lower = title.lower()
-    if 'q1' in t_lower: return 'Q1'
-    if 'q2' in t_lower: return 'Q2'
-    if 'q3' in t_lower: return 'Q3'
-    if 'q4' in t_lower: return 'Q4'
-    if '1st' in t_lower or 'ashwin' in t_lower: return 'Q1'
-    if '2nd' in t_lower or 'poush' in t_lower: return 'Q2'
-    if '3rd' in t_lower or 'chaitra' in t_lower: return 'Q3'
-    if '4th' in t_lower or 'ashad' in t_lower: return 'Q4'
-    return None
+    return extract_q_token_quarter(t_lower) or next((qtr for word, qtr in _TITLE_QUARTER_WORDS if word in t_lower),
+                                                    None)
 
 
-def flatten_gbime_documents(api_response: Dict) -> List[Dict]:
-    raw_docs = []
+def iter_gbime_documents(api_response: Dict) -> Iterator[Dict]:
     categories_root = api_response.get('data', {}).get('documentCategory', [])
     for root_cat in categories_root:
         for sub in root_cat.get('subCategories', []) or []:
-            for doc in sub.get('documents', []) or []:
-                raw_docs.append(doc)
-        for doc in root_cat.get('categories', []) or []:
-            raw_docs.append(doc)
-    return raw_docs
+            yield from sub.get('documents', []) or []
+        yield from root_cat.get('categories', []) or []
+
+
+def _build_gbime_index(api_response: Dict) -> Dict[str, List[Dict]]:
+    """Group GBIME documents by normalized fiscal year, in catalog order"""
+    index = defaultdict(list)
+    for doc in iter_gbime_documents(api_response):
+        index[normalize_fiscal_year_format(doc.get('fiscal_year'))].append(doc)
+    return index
 
 
-def fetch_from_gbime_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+async def fetch_from_gbime_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     config = DYNAMIC_API_BANKS["GBIME"]
     api_url = config['annual_api'] if report_type == 'annual' else config['quarterly_api']
     try:
         norm_fy = normalize_fiscal_year_format(fiscal_year)
-        print(f"  Fetching from GBIME API: {api_url}")
-        response = requests.get(api_url, timeout=20)
-        if response.status_code != 200: return None
-        all_docs = flatten_gbime_documents(response.json())
-        candidates = []
-        for doc in all_docs:
-            if normalize_fiscal_year_format(doc.get('fiscal_year')) != norm_fy: continue
+        logger.debug("  Fetching from GBIME API: %s", api_url)
+        index = await _get_catalog_index("GBIME", api_url, _build_gbime_index, timeout=20)
+        if index is None: return None
+        # First match wins unless an English version follows it; stop as soon as one is seen
+        first = sel = None
+        for doc in index.get(norm_fy, ()):
             if report_type == 'quarterly' and quarter:
                 if extract_gbime_quarter(doc.get('quater'), doc.get('name', '')) != quarter: continue
-            candidates.append(doc)
-        if not candidates: return None
-        sel = candidates[0]
-        if len(candidates) > 1:
-            eng = next((d for d in candidates if "english" in d.get('name', '').lower()), None)
-            if eng: sel = eng
+            if first is None: first = doc
+            if "english" in doc.get('name', '').lower():
+                sel = doc
+                break
+        sel = sel or first
+        if sel is None: return None
         full_url = f"{config['file_base']}{sel.get('file', '').lstrip('/')}"
         return {'fiscal_year': norm_fy, 'report_type': report_type, 'quarter': quarter, 'pdf_url': full_url,
                 'document_name': sel.get('name', ''), 'source': 'gbime_api', 'raw_data': sel}
     except Exception as e:
-        print(f"  GBIME Error: {e}")
+        logger.error("  GBIME Error: %s", e)
         return None
 
 
-def fetch_from_nabil_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+async def fetch_from_nabil_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     config = DYNAMIC_API_BANKS["NABIL"]
     try:
         api_url = f"{config['api_base']}/get_financial_document_subcategories_by_category/{config['category_id']}"
-        print(f"  Fetching from Nabil API: {api_url}")
-        response = requests.get(api_url, timeout=30)
-        if response.status_code != 200: return None
-        data = response.json()
-        subcategories = data.get('data', [])
+        logger.debug("  Fetching from Nabil API: %s", api_url)
+        index = await _get_catalog_index("NABIL", api_url, _build_nabil_index, timeout=30)
+        if index is None: return None
         target_subcategory_id = config['annual_subcategory_id'] if report_type == 'annual' else config[
             'quarterly_subcategory_id']
-        documents = []
-        for subcategory in subcategories:
-            if subcategory.get('subcategory_id') == target_subcategory_id:
-                documents = subcategory.get('documents', [])
-                break
-        if not documents: return None
-        for doc in documents:
-            doc_fiscal_year = doc.get('fiscal_year', '')
+        fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
+        # Only the target year's documents, in catalog order
+        for doc in index.get((target_subcategory_id, fiscal_year_normalized), ()):
             doc_name = doc.get('name', '').lower()
-            doc_fiscal_year_normalized = normalize_fiscal_year_format(doc_fiscal_year)
-            fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
-            if doc_fiscal_year_normalized != fiscal_year_normalized: continue
             if report_type == 'quarterly' and quarter:
-                quarter_map = {'Q1': ['first', 'q1', '1st'], 'Q2': ['second', 'q2', '2nd'],
-                               'Q3': ['third', 'q3', '3rd'], 'Q4': ['fourth', 'q4', '4th']}
-                quarter_keywords = quarter_map.get(quarter, [])
+                quarter_keywords = NABIL_QUARTER_KEYWORDS.get(quarter, ())
                 if not any(kw in doc_name for kw in quarter_keywords): continue
             if doc.get('name_np') or 'nepali' in doc_name: continue
             file_path = doc.get('file', '')
@@ -1509,47 +1872,79 @@ def fetch_from_nabil_api(fiscal_year: str, report_type: str, quarter: Optional[s
                     'pdf_url': full_url, 'document_name': doc.get('name', ''), 'source': 'nabil_api', 'raw_data': doc}
         return None
     except Exception as e:
-        print(f"  Error fetching from Nabil API: {e}")
+        logger.error("  Error fetching from Nabil API: %s", e)
         return None
 
 
-def fetch_from_prime_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+# Caps concurrent page requests against the Prime Bank API
+PRIME_PAGE_SEMAPHORE = asyncio.Semaphore(8)
+PRIME_MAX_PAGES = 20
+
+
+async def fetch_from_prime_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     config = DYNAMIC_API_BANKS["PCBL"]
     try:
         endpoint_template = config['annual_endpoint'] if report_type == 'annual' else config['quarterly_endpoint']
         fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
-        page = 1
-        while page <= 20:
-            api_url = f"{config['api_base']}{endpoint_template.format(page=page)}"
-            response = requests.get(api_url, timeout=10)
-            if response.status_code != 200: break
-            api_response = response.json()
-            if api_response.get('status') != 'Success': break
-            items = api_response.get('items', [])
-            if not items: break
-            for record in items:
-                title = record.get('Title', '')
-                doc_path = record.get('DocPath', '')
-                if not title or not doc_path: continue
-                if 'kankai' in title.lower(): continue
-                doc_fiscal_year = extract_fiscal_year_from_title(title)
-                if not doc_fiscal_year: continue
-                doc_fiscal_year_normalized = normalize_fiscal_year_format(doc_fiscal_year)
-                if doc_fiscal_year_normalized != fiscal_year_normalized: continue
-                if report_type == 'quarterly' and quarter:
-                    doc_quarter = extract_quarter_from_title(title)
-                    if doc_quarter != quarter: continue
-                return {'fiscal_year': fiscal_year_normalized, 'report_type': report_type,
-                        'quarter': quarter if report_type == 'quarterly' else None, 'pdf_url': doc_path,
-                        'document_name': title, 'source': 'prime_api', 'raw_data': record}
-            page += 1
-        return None
+
+        async def fetch_page(page: int):
+            async with PRIME_PAGE_SEMAPHORE:
+                return await _get_catalog("PCBL", f"{config['api_base']}{endpoint_template.format(page=page)}",
+                                          timeout=10)
+
+        # Fetch every page concurrently (each page cached separately) but scan them in page order,
+        # cancelling the pages still in flight as soon as a match or the end of the listing is hit
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(1, PRIME_MAX_PAGES + 1)]
+        try:
+            for task in tasks:
+                try:
+                    api_response = await task
+                except Exception:
+                    break
+                if api_response is None or api_response.get('status') != 'Success': break
+                items = api_response.get('items', [])
+                if not items: break
+                match = _match_prime_record(items, fiscal_year_normalized, report_type, quarter)
+                if match: return match
+            return None
+        finally:
+            for task in tasks:
+                if not task.done(): task.cancel()
     except Exception as e:
-        print(f"  Error fetching from Prime API: {e}")
+        logger.error("  Error fetching from Prime API: %s", e)
         return None
 
 
-def fetch_from_sanima_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+def _match_prime_record(items: List[Dict], fiscal_year_normalized: str, report_type: str,
+                        quarter: Optional[str]) -> Optional[Dict]:
+    """Return the first PCBL record on a page matching the requested report"""
+    for record in items:
+        title = record.get('Title', '')
+        doc_path = record.get('DocPath', '')
+        if not title or not doc_path: continue
+        if 'kankai' in title.lower(): continue
+        doc_fiscal_year = extract_fiscal_year_from_title(title)
+        if not doc_fiscal_year: continue
+        doc_fiscal_year_normalized = normalize_fiscal_year_format(doc_fiscal_year)
+        if doc_fiscal_year_normalized != fiscal_year_normalized: continue
+        if report_type == 'quarterly' and quarter:
+            doc_quarter = extract_quarter_from_title(title)
+            if doc_quarter != quarter: continue
+        return {'fiscal_year': fiscal_year_normalized, 'report_type': report_type,
+                'quarter': quarter if report_type == 'quarterly' else None, 'pdf_url': doc_path,
+                'document_name': title, 'source': 'prime_api', 'raw_data': record}
+    return None
+
+
+def _is_sanima_english_doc(doc: Dict) -> bool:
+    """English if marked so in the name, Nepali if marked so, otherwise English unless it has a Nepali name"""
+    name = doc.get('name', '').lower()
+    if 'english' in name or '(eng)' in name: return True
+    if 'nepali' in name or '(nep)' in name: return False
+    return not doc.get('name_np')
+
+
+async def fetch_from_sanima_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     config = DYNAMIC_API_BANKS["SANIMA"]
     try:
         fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
@@ -1557,130 +1952,70 @@ def fetch_from_sanima_api(fiscal_year: str, report_type: str, quarter: Optional[
         if fiscal_year_normalized in SANIMA_FISCAL_YEAR_CORRECTIONS:
             fiscal_years_to_check.extend(SANIMA_FISCAL_YEAR_CORRECTIONS[fiscal_year_normalized])
         fiscal_years_to_check = list(set(fiscal_years_to_check))
-        print(f"  Fetching from Sanima API: {config['api_base']}")
-        response = requests.get(config['api_base'], timeout=15)
-        if response.status_code != 200: return None
-        api_response = response.json()
-        if api_response.get('resCod') != '200': return None
-        categories = api_response.get('data', {}).get('documentCategory', [])
+        logger.debug("  Fetching from Sanima API: %s", config['api_base'])
+        index = await _get_catalog_index("SANIMA", config['api_base'], _build_sanima_index, timeout=15)
+        if not index: return None
         target_category = config['annual_category'] if report_type == 'annual' else config['quarterly_category']
-        for category in categories:
-            if category.get('name') != target_category: continue
-            matching_docs = []
-            for subcategory in category.get('subCategories', []):
-                for doc in subcategory.get('documents', []):
-                    doc_fiscal_year = doc.get('fiscal_year', '')
-                    doc_fiscal_year_normalized = normalize_fiscal_year_format(doc_fiscal_year)
-                    if doc_fiscal_year_normalized not in fiscal_years_to_check: continue
-                    if report_type == 'quarterly' and quarter:
-                        quater_obj = doc.get('quater')
-                        if not quater_obj: continue
-                        system_name = quater_obj.get('systemName', '')
-                        quarter_map = {'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3',
-                                       'fourth_quater': 'Q4'}
-                        if quarter_map.get(system_name) != quarter: continue
-                    matching_docs.append(doc)
-            if matching_docs:
-                selected_doc = None
-                if len(matching_docs) == 1:
-                    selected_doc = matching_docs[0]
-                else:
-                    english_docs = []
-                    nepali_docs = []
-                    for doc in matching_docs:
-                        name = doc.get('name', '').lower()
-                        if 'english' in name or '(eng)' in name:
-                            english_docs.append(doc)
-                        elif 'nepali' in name or '(nep)' in name:
-                            nepali_docs.append(doc)
-                        else:
-                            if not doc.get('name_np'):
-                                english_docs.append(doc)
-                            else:
-                                nepali_docs.append(doc)
-                    if english_docs:
-                        selected_doc = english_docs[0]
-                    elif nepali_docs:
-                        selected_doc = nepali_docs[0]
-                if selected_doc:
-                    file_path = selected_doc.get('file', '')
-                    full_url = f"{config['file_base']}{file_path}" if file_path else None
-                    return {'fiscal_year': fiscal_year_normalized, 'report_type': report_type,
-                            'quarter': quarter if report_type == 'quarterly' else None, 'pdf_url': full_url,
-                            'document_name': selected_doc.get('name', ''), 'source': 'sanima_api',
-                            'raw_data': selected_doc}
+        entries = sorted(entry for fy in fiscal_years_to_check for entry in index.get((target_category, fy), ()))
+        if report_type == 'quarterly' and quarter:
+            entries = [entry for entry in entries if entry[2] == quarter]
+        if not entries: return None
+        # Only the first category holding a match is considered, as in the original category walk
+        first_category = entries[0][1]
+        matching_docs = (entry[3] for entry in entries if entry[1] == first_category)
+        # Single scan: the first English document wins, otherwise the first match
+        selected_doc = entries[0][3]
+        for doc in matching_docs:
+            if _is_sanima_english_doc(doc):
+                selected_doc = doc
+                break
+        if selected_doc:
+            file_path = selected_doc.get('file', '')
+            full_url = f"{config['file_base']}{file_path}" if file_path else None
+            return {'fiscal_year': fiscal_year_normalized, 'report_type': report_type,
+                    'quarter': quarter if report_type == 'quarterly' else None, 'pdf_url': full_url,
+                    'document_name': selected_doc.get('name', ''), 'source': 'sanima_api',
+                    'raw_data': selected_doc}
         return None
     except Exception as e:
-        print(f"  Error fetching from Sanima API: {e}")
+        logger.error("  Error fetching from Sanima API: %s", e)
         return None
 
 
-def fetch_from_nimb_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+async def fetch_from_nimb_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     config = DYNAMIC_API_BANKS["NIMB"]
     try:
         fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
-        print(f"  Fetching from NIMB API: {config['api_base']}")
-        response = requests.get(config['api_base'], timeout=15)
-        if response.status_code != 200: return None
-        api_response = response.json()
-        if api_response.get('resCod') != '200': return None
-
-        categories = api_response.get('data', {}).get('documentCategory', [])
-        target_keywords = config['annual_keywords'] if report_type == 'annual' else config['quarterly_keywords']
-
-        for category in categories:
-            # Check if category matches NIMB specific keywords
-            if not any(keyword in category.get('name', '') for keyword in target_keywords): continue
-
-            matching_docs = []
-            # Check nested subcategories
-            for subcategory in category.get('subCategories', []) or []:
-                for doc in subcategory.get('documents', []) or []:
-                    doc_fy = normalize_fiscal_year_format(doc.get('fiscal_year', ''))
-                    if doc_fy != fiscal_year_normalized: continue
-
-                    if report_type == 'quarterly' and quarter:
-                        quater_obj = doc.get('quater')
-                        if not quater_obj: continue
-                        sys_name = quater_obj.get('systemName', '').lower()
-                        q_map = {'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3',
-                                 'fourth_quater': 'Q4'}
-                        if q_map.get(sys_name) != quarter: continue
-
-                    matching_docs.append(doc)
-
-            # Check direct documents in category (unlikely based on JSON but good practice)
-            for doc in category.get('documents', []) or []:
-                doc_fy = normalize_fiscal_year_format(doc.get('fiscal_year', ''))
-                if doc_fy != fiscal_year_normalized: continue
-                if report_type == 'quarterly' and quarter:
-                    quater_obj = doc.get('quater')
-                    if not quater_obj: continue
-                    sys_name = quater_obj.get('systemName', '').lower()
-                    q_map = {'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3', 'fourth_quater': 'Q4'}
-                    if q_map.get(sys_name) != quarter: continue
-                matching_docs.append(doc)
-
-            if matching_docs:
-                # Prefer latest upload or English if duplicates exist
-                selected_doc = matching_docs[0]
-                file_path = selected_doc.get('file', '')
-                # Ensure no space in URL
-                if file_path:
-                    file_path = file_path.replace(' ', '%20')
-                    full_url = f"{config['file_base']}{file_path}"
-                    return {
-                        'fiscal_year': fiscal_year_normalized,
-                        'report_type': report_type,
-                        'quarter': quarter if report_type == 'quarterly' else None,
-                        'pdf_url': full_url,
-                        'document_name': selected_doc.get('name', ''),
-                        'source': 'nimb_api',
-                        'raw_data': selected_doc
-                    }
+        logger.debug("  Fetching from NIMB API: %s", config['api_base'])
+        index = await _get_catalog_index("NIMB", config['api_base'], _build_nimb_index, timeout=15)
+        if not index: return None
+        index_type = 'annual' if report_type == 'annual' else 'quarterly'
+        entries = index.get((index_type, fiscal_year_normalized), [])
+        if report_type == 'quarterly' and quarter:
+            entries = [entry for entry in entries if entry[2] == quarter]
+
+        # Walk matches category by category; the first document of a category is picked if it has a file
+        seen_categories = set()
+        for _, category_no, _, selected_doc in entries:
+            if category_no in seen_categories: continue
+            seen_categories.add(category_no)
+            file_path = selected_doc.get('file', '')
+            # Ensure no space in URL
+            if file_path:
+                file_path = file_path.replace(' ', '%20')
+                full_url = f"{config['file_base']}{file_path}"
+                return {
+                    'fiscal_year': fiscal_year_normalized,
+                    'report_type': report_type,
+                    'quarter': quarter if report_type == 'quarterly' else None,
+                    'pdf_url': full_url,
+                    'document_name': selected_doc.get('name', ''),
+                    'source': 'nimb_api',
+                    'raw_data': selected_doc
+                }
         return None
     except Exception as e:
-        print(f"  Error fetching from NIMB API: {e}")
+        logger.error("  Error fetching from NIMB API: %s", e)
         return None
 
 
@@ -1691,20 +2026,20 @@ def insert_document_from_api(bank_id: int, bank_symbol: str, doc_info: Dict) ->
             "fiscal_year": doc_info['fiscal_year'], "report_type": doc_info['report_type'],
             "quarter": doc_info.get('quarter'), "scraped_at": datetime.now().isoformat(), "method": "dynamic"
         }
+        # One round trip for new documents; an already stored pdf_url is left untouched and re-read
+        result = supabase.table("financial_documents").upsert(document_data, on_conflict="pdf_url",
+                                                               ignore_duplicates=True).execute()
+        if result.data and len(result.data) > 0: return result.data[0]
         existing = supabase.table("financial_documents").select("*").eq("pdf_url", doc_info['pdf_url']).execute()
         if existing.data and len(existing.data) > 0: return existing.data[0]
-        result = supabase.table("financial_documents").insert(document_data).execute()
-        if result.data and len(result.data) > 0: return result.data[0]
         raise Exception("Failed to insert document")
     except Exception as e:
-        print(f"  Error inserting document: {e}")
+        logger.error("  Error inserting document: %s", e)
         raise
 
 
-def create_scraping_prompt(report_type: str, fiscal_year: str, quarter: Optional[str] = None) -> str:
-    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-
-    # Calculate the "Closing Year" for Nepali dates (e.g., 2079/80 -> 2080)
+def _closing_years(nepali_fy: str) -> tuple:
+    """Return the Nepali closing year of a fiscal year and the one before it (e.g., 2079/80 -> 2080, 2079)"""
     closing_year_str = ""
     prev_closing_year_str = ""
     try:
@@ -1720,12 +2055,16 @@ def create_scraping_prompt(report_type: str, fiscal_year: str, quarter: Optional
                 prev_closing_year_str = str(int(closing_year_str) - 1)
     except Exception:
         pass
+    return closing_year_str, prev_closing_year_str
 
-    if report_type == "annual":
-        # Enhanced Prompt for Annual Reports with STRICT Q4 Exclusion
-        ashad_instruction = ""
-        if closing_year_str:
-            ashad_instruction = f"""
+
+@functools.lru_cache(maxsize=256)
+def _build_annual_prompt(nepali_fy: str, english_fy: str) -> str:
+    # Enhanced Prompt for Annual Reports with STRICT Q4 Exclusion
+    closing_year_str, prev_closing_year_str = _closing_years(nepali_fy)
+    ashad_instruction = ""
+    if closing_year_str:
+        ashad_instruction = f"""
 - AMBIGUITY HANDLING ("Ashad End" vs Annual):
   - "Ashad End {closing_year_str}" is the closing date for Fiscal Year {nepali_fy}.
   - CRITICAL: Banks publish TWO reports with this date:
@@ -1734,7 +2073,7 @@ def create_scraping_prompt(report_type: str, fiscal_year: str, quarter: Optional
   - IF the link text says "Ashad End {closing_year_str}" BUT also says "Unaudited", "Interim", "Quarterly", or "Q4" -> IGNORE IT.
   - "Ashad End {prev_closing_year_str}" -> IGNORE (Previous Year)."""
 
-        return f"""Extract ONLY the AUDITED ANNUAL REPORT for fiscal year {nepali_fy} or {english_fy}.
+    return f"""Extract ONLY the AUDITED ANNUAL REPORT for fiscal year {nepali_fy} or {english_fy}.
 IMPORTANT CRITERIA:
 - Must be the FINAL AUDITED ANNUAL report.
 - STRICTLY EXCLUDE: Any document labeled "Unaudited", "Interim", "Quarterly", "Q4", "Fourth Quarter", "Financial Highlights", or "Statement of Financial Position" (unless explicitly marked Annual/Audited).
@@ -1755,16 +2094,19 @@ Return ONLY ONE report in this exact JSON format:
 }}
 If the specific annual report for {nepali_fy} is NOT found, return: {{"found": false, "report": null}}"""
 
-    else:
-        # Quarterly Report Prompt
-        quarter_names = {"Q1": "First Quarter", "Q2": "Second Quarter", "Q3": "Third Quarter", "Q4": "Fourth Quarter"}
-        quarter_desc = quarter_names.get(quarter.upper(), quarter)
 
-        q4_instruction = ""
-        if quarter.upper() == "Q4" and closing_year_str:
-            q4_instruction = f'- Note: "Ashad End {closing_year_str}" usually represents Q4 of {nepali_fy}. Match this ONLY if it is "Unaudited" or "Quarterly".'
+@functools.lru_cache(maxsize=512)
+def _build_quarterly_prompt(nepali_fy: str, english_fy: str, quarter: str) -> str:
+    # Quarterly Report Prompt
+    closing_year_str, _ = _closing_years(nepali_fy)
+    quarter_names = {"Q1": "First Quarter", "Q2": "Second Quarter", "Q3": "Third Quarter", "Q4": "Fourth Quarter"}
+    quarter_desc = quarter_names.get(quarter.upper(), quarter)
 
-        return f"""Extract ONLY the quarterly/interim report for {quarter_desc} of fiscal year {nepali_fy} or {english_fy}.
+    q4_instruction = ""
+    if quarter.upper() == "Q4" and closing_year_str:
+        q4_instruction = f'- Note: "Ashad End {closing_year_str}" usually represents Q4 of {nepali_fy}. Match this ONLY if it is "Unaudited" or "Quarterly".'
+
+    return f"""Extract ONLY the quarterly/interim report for {quarter_desc} of fiscal year {nepali_fy} or {english_fy}.
 IMPORTANT CRITERIA:
 - Must be a QUARTERLY/INTERIM/UNAUDITED report.
 - Must be specifically for {quarter.upper()} (Quarter {quarter[1]}) of fiscal year {nepali_fy} or {english_fy}
@@ -1785,45 +2127,317 @@ Return ONLY ONE report in this exact JSON format:
 If the specific {quarter.upper()} report for {nepali_fy} is NOT found, return: {{"found": false, "report": null}}"""
 
 
-def scrape_specific_report(bank: Dict, fiscal_year: str, report_type: str, quarter: Optional[str] = None,
-                           max_retries: int = 3) -> Optional[Dict]:
+def _build_scraping_prompt(report_type: str, fiscal_year: str, quarter: Optional[str] = None) -> str:
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    if report_type == "annual":
+        return _build_annual_prompt(nepali_fy, english_fy)
+    return _build_quarterly_prompt(nepali_fy, english_fy, quarter)
+
+
+def _precompute_scraping_prompts() -> Dict[tuple, str]:
+    """Build the prompt for every known fiscal year (both formats), report type and quarter"""
+    prompts = {}
+    for english_fy, nepali_fy in FISCAL_YEAR_CONVERSION.items():
+        for report_type, quarters in (("annual", (None,)), ("quarterly", ("Q1", "Q2", "Q3", "Q4"))):
+            for quarter in quarters:
+                prompt = _build_scraping_prompt(report_type, nepali_fy, quarter)
+                prompts[(report_type, nepali_fy, quarter)] = prompt
+                prompts[(report_type, english_fy, quarter)] = prompt
+    return prompts
+
+
+# Read-only prompt table built once at import time
+_PROMPT_CACHE = MappingProxyType(_precompute_scraping_prompts())
+
+
+def create_scraping_prompt(report_type: str, fiscal_year: str, quarter: Optional[str] = None) -> str:
+    """Return the precomputed prompt, building it on the fly for fiscal years outside the table"""
+    return _PROMPT_CACHE.get((report_type, fiscal_year, quarter)) or \
+        _build_scraping_prompt(report_type, fiscal_year, quarter)
+
+
+async def firecrawl_scrape(url: str, formats: List, max_age: Optional[int] = None) -> Dict:
+    """
+    Scrape a page through the Firecrawl REST API using the shared async client
+    max_age (ms) lets Firecrawl answer from its cached copy of the page when it is at most that old
+    Returns the 'data' document (json/links/metadata, depending on formats) from the response
+    """
+    payload = {"url": url, "formats": formats}
+    if max_age is not None:
+        payload["maxAge"] = max_age
+    response = await http_client.post(
+        FIRECRAWL_SCRAPE_URL,
+        json=payload,
+        headers={"Authorization": f"Bearer {FIRECRAWL_API_KEY}"}
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content).get('data') or {}
+
+
+# Blocking Firecrawl SDK scrapes in flight at once across the sync (threadpool) endpoints
+FIRECRAWL_SDK_WORKERS = int(os.getenv("FIRECRAWL_SDK_WORKERS", "16"))
+FIRECRAWL_EXECUTOR = ThreadPoolExecutor(max_workers=FIRECRAWL_SDK_WORKERS, thread_name_prefix="firecrawl")
+# Listing pages of a paginated scan in flight at once, so one request cannot take most of FIRECRAWL_EXECUTOR
+FIRECRAWL_PAGE_WINDOW = 3
+
+
+def scrape_pages_json(urls: List[str], prompt: str,
+                      window: Optional[int] = None) -> Iterator[Tuple[str, Optional[Dict]]]:
+    """
+    Scrape candidate pages with the Firecrawl SDK concurrently, yielding (url, extracted json) in the given order
+    With window set, at most that many pages are in flight and the next one is submitted as each is yielded
+    A failed scrape yields None; pages still pending when the caller stops iterating are cancelled
+    """
+    formats = ["markdown", {"type": "json", "prompt": prompt}]
+    pending_urls = iter(urls)
+    futures = deque()
+
+    def submit_next():
+        url = next(pending_urls, None)
+        if url is not None:
+            futures.append((url, FIRECRAWL_EXECUTOR.submit(firecrawl.scrape, url, formats=formats)))
+
+    for _ in range(window or len(urls)):
+        submit_next()
+    try:
+        while futures:
+            url, future = futures.popleft()
+            try:
+                data = future.result().json
+            except Exception as e:
+                logger.warning("  ❌ Error scraping %s: %s", url, e)
+                data = None
+            yield url, data
+            submit_next()
+    finally:
+        for _, future in futures:
+            future.cancel()
+
+
+# Caps how many candidate report pages are scraped at once
+SCRAPE_URL_SEMAPHORE = asyncio.Semaphore(5)
+
+# Caps concurrent scrapes per bank domain so one slow site cannot hold every SCRAPE_URL_SEMAPHORE slot
+SCRAPE_HOST_CONCURRENCY = 2
+_host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(SCRAPE_HOST_CONCURRENCY))
+
+# Caps how many report scrapes run across all clients; further scrapes are rejected with 503 instead of queueing
+MAX_CONCURRENT_SCRAPES = int(os.getenv("MAX_CONCURRENT_SCRAPES", "8"))
+SCRAPE_REPORT_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+# Reports every candidate page was scraped for without a match, keyed on (symbol, fiscal_year, report_type, quarter)
+SCRAPE_NEGATIVE_CACHE = TTLCache(maxsize=4096, ttl=3600)
+SCRAPE_NEGATIVE_STATS = {"hits": 0, "stored": 0}
+
+
+async def _backoff(attempt: int, base: float = 1.0, cap: float = 30.0):
+    """Wait a capped exponential delay with jitter so concurrent retries do not line up"""
+    await asyncio.sleep(min(cap, base * 2 ** attempt) + random.uniform(0, 0.5))
+
+
+async def try_url(url: str, url_type: str, prompt: str, max_retries: int = 3) -> Union[Dict, bool, None]:
+    """
+    Scrape a single candidate page with retries, returning the report if it was found there
+    Returns False when the page definitively has no such report (Firecrawl answered found: false, or 404/410),
+    None when scraping failed or the page refused the request
+    """
+    logger.info("🔍 Searching in %s: %s", url_type, url)
+    host_semaphore = _host_semaphores[urlparse(url).netloc.lower()]
+    for attempt in range(max_retries):
+        try:
+            async with host_semaphore, SCRAPE_URL_SEMAPHORE:
+                result = await firecrawl_scrape(url, [{"type": "json", "prompt": prompt}])
+            status_code = (result.get('metadata') or {}).get('statusCode')
+            if status_code in (404, 410):
+                # The page is gone, so it definitively holds no report
+                return False
+            if status_code and 400 <= status_code < 500 and status_code != 429:
+                # Forbidden or rejected page: retrying now cannot help, but a WAF or bot block may lift later,
+                # so report it as a failed scrape rather than a miss
+                return None
+            if status_code and status_code >= 400:
+                if attempt < max_retries - 1:
+                    await _backoff(attempt, base=5 if status_code == 429 else 2)
+                    continue
+                else:
+                    break
+            extracted = result.get('json')
+            if not extracted:
+                if attempt < max_retries - 1:
+                    await _backoff(attempt)
+                    continue
+                else:
+                    break
+            found = extracted.get('found', False)
+            report = extracted.get('report')
+            if found and report and report.get('file_url'):
+                logger.info("   ✅ Found report in %s", url_type)
+                return report
+            else:
+                return False
+        except Exception as e:
+            error_status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+            if error_status and 400 <= error_status < 500 and error_status != 429:
+                # Bad request, auth or URL error from Firecrawl: fail fast
+                logger.error("   ❌ %s failed with HTTP %s, not retrying", url_type, error_status)
+                break
+            if attempt < max_retries - 1:
+                rate_limited = error_status == 429
+                await _backoff(attempt, base=5 if rate_limited else 2)
+                continue
+            else:
+                break
+    return None
+
+
+# Banks (upper-cased symbols) whose report pages are plain HTML listing PDF links; their pages are fetched and matched
+# in-process before falling back to Firecrawl. Opt-in, e.g. DIRECT_HTML_BANKS=ADBL,NICA
+DIRECT_HTML_BANKS = frozenset(symbol.strip().upper() for symbol in os.getenv("DIRECT_HTML_BANKS", "").split(",")
+                              if symbol.strip())
+_LINK_FISCAL_YEAR_RE = re.compile(r'(20\d{2})\s*[/\-_\u2013]\s*(\d{2}(?:\d{2})?)(?!\d)')
+_LINK_WORD_SEPARATOR_RE = re.compile(r'[_\-.]+')
+_LINK_ANNUAL_REPORT_RE = re.compile(r'\bannual\s*report')
+# Meeting notices and minutes often carry "annual" and the fiscal year without being a report
+_LINK_NOT_REPORT_RE = re.compile(r'\b(?:general\s+meeting|agm|notice|minutes?)\b')
+
+
+class _PdfLinkParser(HTMLParser):
+    """Collect (href, link text) of every anchor pointing at a PDF, in page order"""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+        self._href = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a': return
+        href = dict(attrs).get('href') or ''
+        if '.pdf' in href.lower():
+            self._href, self._text = href, []
+
+    def handle_data(self, data):
+        if self._href is not None: self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._href is not None:
+            self.links.append((self._href, ' '.join(''.join(self._text).split())))
+            self._href = None
+
+
+def _match_pdf_link(links: List[tuple], page_url: str, fiscal_year: str, report_type: str,
+                    quarter: Optional[str]) -> Optional[Dict]:
+    """
+    First PDF link whose text or file name names the fiscal year (either format) and the report type/quarter
+    Only the link text and the file name are read, never the directories of the href
+    Deliberately strict: anything ambiguous is left to the Firecrawl extraction
+    """
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    for href, text in links:
+        label = f"{text} {os.path.basename(unquote(urlparse(href).path))}".lower()
+        link_years = {normalize_fiscal_year(f"{start}/{end}")[0] for start, end in _LINK_FISCAL_YEAR_RE.findall(label)}
+        words = _LINK_WORD_SEPARATOR_RE.sub(' ', label)
+        if nepali_fy not in link_years or _LINK_NOT_REPORT_RE.search(words): continue
+        if report_type == 'annual':
+            if not _LINK_ANNUAL_REPORT_RE.search(words): continue
+        elif 'annual' in label or extract_quarter_from_title(label) != quarter:
+            continue
+        return {"fiscal_year": nepali_fy, "report_type": report_type, "quarter": quarter,
+                "file_url": urljoin(page_url, href), "report_title": text}
+    return None
+
+
+async def try_url_direct(url: str, url_type: str, fiscal_year: str, report_type: str,
+                         quarter: Optional[str]) -> Optional[Dict]:
+    """Fetch a plain HTML report page and match its PDF links in-process, without Firecrawl"""
+    try:
+        async with _host_semaphores[urlparse(url).netloc.lower()]:
+            response = await http_client.get(url, timeout=15, follow_redirects=True)
+        if response.status_code != 200 or 'html' not in response.headers.get('content-type', ''):
+            return None
+        parser = _PdfLinkParser()
+        parser.feed(response.text)
+        report = _match_pdf_link(parser.links, str(response.url), fiscal_year, report_type, quarter)
+        if report:
+            logger.info("   ⚡ Found report in %s by direct HTML parse", url_type)
+        return report
+    except Exception as e:
+        logger.warning("   Direct HTML parse of %s failed, falling back to Firecrawl: %s", url_type, e)
+        return None
+
+
+# In-flight scrapes keyed on (bank_id, fiscal_year, report_type, quarter)
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+def _finish_inflight(key: tuple, task: asyncio.Task):
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # Mark the outcome as retrieved so asyncio does not warn when every caller has gone away
+    if not task.cancelled():
+        task.exception()
+
+
+async def dedup(key: tuple, coro_factory):
+    """
+    Share one in-flight coroutine between concurrent identical requests
+    The work runs as its own task, so a caller that disconnects does not cancel it for the others
+    """
+    task = _inflight.get(key)
+    if task is not None:
+        logger.info("⏳ Joining in-flight request for %s", key)
+    else:
+        task = asyncio.create_task(coro_factory())
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_finish_inflight, key))
+    return await asyncio.shield(task)
+
+
+async def scrape_specific_report(bank: Dict, fiscal_year: str, report_type: str, quarter: Optional[str] = None,
+                                 max_retries: int = 3) -> Optional[Dict]:
+    negative_key = (bank['symbol'].upper(), normalize_fiscal_year_format(fiscal_year), report_type, quarter)
+    if negative_key in SCRAPE_NEGATIVE_CACHE:
+        SCRAPE_NEGATIVE_STATS["hits"] += 1
+        logger.info("⏭️  Skipping scrape of %s: not found recently (%s negative hits, %s cached)",
+                    negative_key, SCRAPE_NEGATIVE_STATS['hits'], len(SCRAPE_NEGATIVE_CACHE))
+        return None
     urls = get_scraping_urls(bank, report_type)
     if not urls: return None
+    if negative_key[0] in DIRECT_HTML_BANKS:
+        # Cheap in-process pass over the same pages first; a miss falls through to Firecrawl
+        for report in await asyncio.gather(*(try_url_direct(url, url_type, fiscal_year, report_type, quarter)
+                                             for url, url_type in urls)):
+            if report: return report
     prompt = create_scraping_prompt(report_type, fiscal_year, quarter)
-    for url, url_type in urls:
-        print(f"🔍 Searching in {url_type}: {url}")
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0: time.sleep(5 * attempt)
-                result = firecrawl.scrape(url, formats=["markdown", {"type": "json", "prompt": prompt}])
-                if result.metadata and result.metadata.status_code and result.metadata.status_code >= 400:
-                    if attempt < max_retries - 1:
-                        time.sleep(20);
-                        continue
-                    else:
-                        break
-                if not result.json:
-                    if attempt < max_retries - 1:
-                        continue
-                    else:
-                        break
-                found = result.json.get('found', False)
-                report = result.json.get('report')
-                if found and report and report.get('file_url'):
-                    print(f"   ✅ Found report in {url_type}")
+
+    if SCRAPE_REPORT_SEMAPHORE.locked():
+        # Every scrape slot is busy: shed the request rather than let all in-flight scrapes slow down together
+        logger.warning("🚦 Scraper busy (%s scrapes running), rejecting %s", MAX_CONCURRENT_SCRAPES, negative_key)
+        raise HTTPException(status_code=503, detail="Scraper busy, retry shortly", headers={"Retry-After": "30"})
+    async with SCRAPE_REPORT_SEMAPHORE:
+        # Scrape every candidate page at once and keep the first one that finds the report
+        tasks = [asyncio.create_task(try_url(url, url_type, prompt, max_retries)) for url, url_type in urls]
+        definitive = True
+        try:
+            for coro in asyncio.as_completed(tasks):
+                report = await coro
+                if report:
                     return report
-                else:
-                    break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    time.sleep(10);
-                    continue
-                else:
-                    break
-        time.sleep(3)
+                definitive = definitive and report is False
+        finally:
+            for task in tasks:
+                task.cancel()
+    if definitive:
+        # Every page answered without the report (rather than failing): skip Firecrawl on repeat lookups
+        SCRAPE_NEGATIVE_CACHE[negative_key] = True
+        SCRAPE_NEGATIVE_STATS["stored"] += 1
     return None
 
 
+# Columns of the financial_documents UNIQUE index used as the upsert conflict target
+DOCUMENT_CONFLICT_COLUMNS = "bank_id,fiscal_year,report_type,quarter"
+
+
 def insert_document_to_db(bank_id: int, bank_symbol: str, report: Dict) -> Dict:
     """
     Insert document with strict PDF URL uniqueness
@@ -1834,15 +2448,15 @@ def insert_document_to_db(bank_id: int, bank_symbol: str, report: Dict) -> Dict:
     try:
         pdf_url = report['file_url']
 
-        print(f"🔍 Checking if PDF URL already exists...")
+        logger.info("🔍 Checking if PDF URL already exists...")
         existing = supabase.table("financial_documents").select("*").eq("pdf_url", pdf_url).execute()
 
         if existing.data and len(existing.data) > 0:
             existing_doc = existing.data[0]
 
-            print(f"⚠️  PDF URL already exists in database!")
+            logger.warning("⚠️  PDF URL already exists in database!")
 
-            print(f"🤖 Using Gemini AI to verify correct metadata...")
+            logger.info("🤖 Using Gemini AI to verify correct metadata...")
             ai_metadata = extract_metadata_from_pdf_url(pdf_url, bank_symbol)
 
             if ai_metadata and ai_metadata.get('confidence') in ['high', 'medium']:
@@ -1864,10 +2478,10 @@ def insert_document_to_db(bank_id: int, bank_symbol: str, report: Dict) -> Dict:
                 )
 
                 if metadata_matches:
-                    print("   ✅ Existing metadata is correct.")
+                    logger.info("   ✅ Existing metadata is correct.")
                     return existing_doc
                 else:
-                    print("   ⚠️ Updating incorrect metadata...")
+                    logger.warning("   ⚠️ Updating incorrect metadata...")
 
                     update_data = {
                         'fiscal_year': ai_fiscal_year,
@@ -1884,13 +2498,16 @@ def insert_document_to_db(bank_id: int, bank_symbol: str, report: Dict) -> Dict:
                         .execute()
                     )
 
+                    # Cached responses may still point at the old metadata
+                    clear_report_response_cache()
+
                     if updated.data:
                         return updated.data[0]
 
             return existing_doc
 
         # ✅ NEW INSERT
-        print("✅ PDF URL is new. Inserting directly...")
+        logger.info("✅ PDF URL is new. Inserting directly...")
 
         report_type = report['report_type']
         quarter = report.get('quarter')
@@ -1912,12 +2529,23 @@ def insert_document_to_db(bank_id: int, bank_symbol: str, report: Dict) -> Dict:
             'method': 'api'
         }
 
-        result = supabase.table("financial_documents").insert(doc_data).execute()
+        # Single race-free write backed by the UNIQUE (bank_id, fiscal_year, report_type, quarter) index
+        result = supabase.table("financial_documents").upsert(
+            doc_data, on_conflict=DOCUMENT_CONFLICT_COLUMNS, ignore_duplicates=True).execute()
 
         if result.data:
-            print("   ✅ Document inserted successfully!")
+            logger.info("   ✅ Document inserted successfully!")
             return result.data[0]
 
+        # Conflict: another request already stored this report, re-read it once
+        logger.info("   ℹ️ Report already stored by a concurrent request")
+        query = supabase.table("financial_documents").select("*").eq("bank_id", bank_id).eq(
+            "fiscal_year", doc_data['fiscal_year']).eq("report_type", report_type)
+        query = query.eq("quarter", quarter) if quarter else query.is_("quarter", "null")
+        existing = query.execute()
+        if existing.data:
+            return existing.data[0]
+
         return None
 
     except Exception as e:
@@ -1926,7 +2554,7 @@ def insert_document_to_db(bank_id: int, bank_symbol: str, report: Dict) -> Dict:
             if existing.data:
                 return existing.data[0]
 
-        print(f"❌ Error inserting document: {e}")
+        logger.error("❌ Error inserting document: %s", e)
         raise
 
 
@@ -1942,18 +2570,18 @@ def insert_dev_bank_document_to_db(bank_id: int, bank_symbol: str, report: Dict)
         pdf_url = report.get('pdf_url') or report.get('file_url')
 
         # ✅ STEP 1: Check if PDF URL already exists in database
-        print(f"🔍 Checking if PDF URL already exists in development banks...")
+        logger.info("🔍 Checking if PDF URL already exists in development banks...")
         existing = supabase.table("development_banks_documents").select("*").eq("pdf_url", pdf_url).execute()
 
         if existing.data and len(existing.data) > 0:
             # ⚠️ DUPLICATE FOUND - Use AI to determine correct metadata
             existing_doc = existing.data[0]
-            print(f"⚠️  PDF URL already exists in database!")
-            print(f"   Existing: fiscal_year={existing_doc.get('fiscal_year')}, report_type={existing_doc.get('report_type')}, quarter={existing_doc.get('quarter')}")
-            print(f"   Requested: fiscal_year={report.get('fiscal_year')}, report_type={report.get('report_type')}, quarter={report.get('quarter')}")
+            logger.warning("⚠️  PDF URL already exists in database!")
+            logger.debug("   Existing: fiscal_year=%s, report_type=%s, quarter=%s", existing_doc.get('fiscal_year'), existing_doc.get('report_type'), existing_doc.get('quarter'))
+            logger.debug("   Requested: fiscal_year=%s, report_type=%s, quarter=%s", report.get('fiscal_year'), report.get('report_type'), report.get('quarter'))
 
             # ✅ STEP 2: Use Gemini AI to verify which metadata is correct
-            print(f"🤖 Using Gemini AI to verify correct metadata...")
+            logger.info("🤖 Using Gemini AI to verify correct metadata...")
             ai_metadata = extract_metadata_from_pdf_url(pdf_url, bank_symbol)
 
             if ai_metadata and ai_metadata.get('confidence') in ['high', 'medium']:
@@ -1961,7 +2589,7 @@ def insert_dev_bank_document_to_db(bank_id: int, bank_symbol: str, report: Dict)
                 ai_report_type = ai_metadata.get('report_type')
                 ai_quarter = ai_metadata.get('quarter')
 
-                print(f"   AI Result: fiscal_year={ai_fiscal_year}, report_type={ai_report_type}, quarter={ai_quarter}")
+                logger.debug("   AI Result: fiscal_year=%s, report_type=%s, quarter=%s", ai_fiscal_year, ai_report_type, ai_quarter)
 
                 # Check if existing data matches AI extraction
                 metadata_matches = (
@@ -1971,11 +2599,11 @@ def insert_dev_bank_document_to_db(bank_id: int, bank_symbol: str, report: Dict)
                 )
 
                 if metadata_matches:
-                    print(f"   ✅ Existing metadata is CORRECT. Returning existing record.")
+                    logger.info("   ✅ Existing metadata is CORRECT. Returning existing record.")
                     return existing_doc
                 else:
                     # ✅ STEP 3: Update existing record with correct AI-verified metadata
-                    print(f"   ⚠️  Existing metadata is INCORRECT. Updating with AI-verified data...")
+                    logger.warning("   ⚠️  Existing metadata is INCORRECT. Updating with AI-verified data...")
                     update_data = {
                         'fiscal_year': ai_fiscal_year,
                         'report_type': ai_report_type,
@@ -1990,14 +2618,14 @@ def insert_dev_bank_document_to_db(bank_id: int, bank_symbol: str, report: Dict)
                         .execute()
 
                     if updated.data and len(updated.data) > 0:
-                        print(f"   ✅ Metadata corrected successfully!")
+                        logger.info("   ✅ Metadata corrected successfully!")
                         return updated.data[0]
             else:
-                print(f"   ⚠️  AI extraction failed or low confidence. Keeping existing record.")
+                logger.warning("   ⚠️  AI extraction failed or low confidence. Keeping existing record.")
                 return existing_doc
 
         # ✅ NEW PDF URL - Just insert directly (no AI verification needed)
-        print(f"✅ PDF URL is new. Inserting directly...")
+        logger.info("✅ PDF URL is new. Inserting directly...")
 
         doc_data = {
             'bank_id': bank_id,
@@ -2012,19 +2640,19 @@ def insert_dev_bank_document_to_db(bank_id: int, bank_symbol: str, report: Dict)
 
         result = supabase.table("development_banks_documents").insert(doc_data).execute()
         if result.data and len(result.data) > 0:
-            print(f"   ✅ Development bank document inserted successfully!")
+            logger.info("   ✅ Development bank document inserted successfully!")
             return result.data[0]
         return None
 
     except Exception as e:
         # Handle unique constraint violations gracefully
         if "unique constraint" in str(e).lower() or "duplicate" in str(e).lower():
-            print(f"⚠️  Duplicate constraint violation detected")
+            logger.warning("⚠️  Duplicate constraint violation detected")
             # Fetch and return existing document
             existing = supabase.table("development_banks_documents").select("*").eq("pdf_url", report['file_url']).execute()
             if existing.data:
                 return existing.data[0]
-        print(f"❌ Error inserting development bank document: {e}")
+        logger.error("❌ Error inserting development bank document: %s", e)
         raise
 
 
@@ -2032,21 +2660,18 @@ def insert_dev_bank_document_to_db(bank_id: int, bank_symbol: str, report: Dict)
 # DEVELOPMENT BANK DYNAMIC API HANDLERS
 # ============================================================================
 
-def fetch_from_jbbl_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+async def fetch_from_jbbl_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     """Fetch document from JBBL (Jyoti Bikas Bank) API"""
     config = DEV_BANK_DYNAMIC_API["JBBL"]
     try:
-        print(f"  Fetching from JBBL API: {config['api_base']}")
-        response = requests.get(config['api_base'], timeout=15)
-
-        if response.status_code != 200:
-            print(f"  ❌ JBBL API returned status {response.status_code}")
+        logger.debug("  Fetching from JBBL API: %s", config['api_base'])
+        # Cached for CATALOG_CACHE_TTL, then revalidated with a conditional GET
+        data = await _get_catalog("JBBL", config['api_base'], timeout=15)
+        if data is None:
             return None
 
-        data = response.json()
-
         if "data" not in data or "documentCategory" not in data["data"]:
-            print(f"  ❌ Unexpected JBBL API structure")
+            logger.warning("  ❌ Unexpected JBBL API structure")
             return None
 
         # Normalize target fiscal year
@@ -2054,19 +2679,19 @@ def fetch_from_jbbl_api(fiscal_year: str, report_type: str, quarter: Optional[st
 
         # Determine which category to search
         category_name = config['annual_category'] if report_type == 'annual' else config['quarterly_category']
-        print(f"  Looking for category: {category_name}, Fiscal Year: {target_fy}")
+        logger.debug("  Looking for category: %s, Fiscal Year: %s", category_name, target_fy)
 
         # Debug: Show all categories
         all_categories = [cat.get("name", "") for cat in data["data"]["documentCategory"]]
-        print(f"  Available categories: {all_categories}")
+        logger.debug("  Available categories: %s", all_categories)
 
         # Search through categories
         for category in data["data"]["documentCategory"]:
             if category_name.lower() not in category.get("name", "").lower():
                 continue
 
-            print(f"  ✓ Found category: {category.get('name')}")
-            print(f"     Subcategories: {len(category.get('subCategories', []))}")
+            logger.debug("  ✓ Found category: %s", category.get('name'))
+            logger.debug("     Subcategories: %s", len(category.get('subCategories', [])))
 
             docs_checked = 0
             docs_matching_fy = 0
@@ -2115,7 +2740,7 @@ def fetch_from_jbbl_api(fiscal_year: str, report_type: str, quarter: Optional[st
 
                         # Debug output for quarterly matching
                         quater_display = quater_obj.get("displayName", "") if isinstance(quater_obj, dict) else quater_obj
-                        print(f"     Checking doc: {doc.get('name')[:50]}... | FY: {doc_fy} | Quarter obj: {quater_display} | Extracted: {doc_quarter}")
+                        logger.debug("     Checking doc: %s... | FY: %s | Quarter obj: %s | Extracted: %s", doc.get('name')[:50], doc_fy, quater_display, doc_quarter)
 
                         if doc_quarter != quarter:
                             continue
@@ -2127,7 +2752,7 @@ def fetch_from_jbbl_api(fiscal_year: str, report_type: str, quarter: Optional[st
 
                     pdf_url = f"{config['file_base'].rstrip('/')}/{file_path.lstrip('/')}"
 
-                    print(f"  ✅ Found matching document: {doc.get('name')}")
+                    logger.info("  ✅ Found matching document: %s", doc.get('name'))
 
                     return {
                         "fiscal_year": target_fy,
@@ -2139,36 +2764,33 @@ def fetch_from_jbbl_api(fiscal_year: str, report_type: str, quarter: Optional[st
                     }
 
             # Show summary
-            print(f"  📊 Summary: Checked {docs_checked} documents, {docs_matching_fy} matched fiscal year {target_fy}")
+            logger.info("  📊 Summary: Checked %s documents, %s matched fiscal year %s", docs_checked, docs_matching_fy, target_fy)
 
-        print(f"  ❌ No matching document found for {target_fy} {quarter if quarter else ''}")
+        logger.info("  ❌ No matching document found for %s %s", target_fy, quarter if quarter else '')
         return None
 
     except Exception as e:
-        print(f"  ❌ JBBL API Error: {e}")
+        logger.error("  ❌ JBBL API Error: %s", e)
         return None
 
 
-def fetch_from_grdbl_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+async def fetch_from_grdbl_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     """Fetch document from GRDBL (Green Development Bank) API"""
     config = DEV_BANK_DYNAMIC_API["GRDBL"]
     try:
-        print(f"  Fetching from GRDBL API: {config['api_base']}")
-        response = requests.get(config['api_base'], timeout=15)
-
-        if response.status_code != 200:
-            print(f"  ❌ GRDBL API returned status {response.status_code}")
+        logger.debug("  Fetching from GRDBL API: %s", config['api_base'])
+        # Cached for CATALOG_CACHE_TTL, then revalidated with a conditional GET
+        data = await _get_catalog("GRDBL", config['api_base'], timeout=15)
+        if data is None:
             return None
 
-        data = response.json()
-
         if not isinstance(data, list):
-            print(f"  ❌ Unexpected GRDBL API structure")
+            logger.warning("  ❌ Unexpected GRDBL API structure")
             return None
 
         # Normalize target fiscal year (e.g., "2080/81")
         target_fy = normalize_fiscal_year_format(fiscal_year)
-        print(f"  Target fiscal year: {target_fy}")
+        logger.debug("  Target fiscal year: %s", target_fy)
 
         # Search through reports
         for item in data:
@@ -2221,7 +2843,7 @@ def fetch_from_grdbl_api(fiscal_year: str, report_type: str, quarter: Optional[s
             if not pdf_url:
                 continue
 
-            print(f"  ✅ Found matching document: {item.get('name')}")
+            logger.info("  ✅ Found matching document: %s", item.get('name'))
 
             return {
                 "fiscal_year": target_fy,
@@ -2232,36 +2854,33 @@ def fetch_from_grdbl_api(fiscal_year: str, report_type: str, quarter: Optional[s
                 "source": "grdbl_api"
             }
 
-        print(f"  ❌ No matching document found for {target_fy}")
+        logger.info("  ❌ No matching document found for %s", target_fy)
         return None
 
     except Exception as e:
-        print(f"  ❌ GRDBL API Error: {e}")
+        logger.error("  ❌ GRDBL API Error: %s", e)
         return None
 
 
-def fetch_from_sapdbl_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+async def fetch_from_sapdbl_api(fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     """Fetch document from SAPDBL (Saptakoshi Development Bank) API"""
     config = DEV_BANK_DYNAMIC_API["SAPDBL"]
     try:
         api_url = config["annual_api"] if report_type == "annual" else config["quarterly_api"]
 
-        print(f"  Fetching from SAPDBL API: {api_url}")
-        response = requests.get(api_url, timeout=15)
-
-        if response.status_code != 200:
-            print(f"  ❌ SAPDBL API returned status {response.status_code}")
+        logger.debug("  Fetching from SAPDBL API: %s", api_url)
+        # Cached for CATALOG_CACHE_TTL, then revalidated with a conditional GET
+        data = await _get_catalog("SAPDBL", api_url, timeout=15)
+        if data is None:
             return None
 
-        data = response.json()
-
         if "items" not in data or "en" not in data["items"]:
-            print(f"  ❌ Unexpected SAPDBL API structure")
+            logger.warning("  ❌ Unexpected SAPDBL API structure")
             return None
 
         # Normalize target fiscal year (e.g., "2081/82")
         target_fy = normalize_fiscal_year_format(fiscal_year)
-        print(f"  Target fiscal year: {target_fy}")
+        logger.debug("  Target fiscal year: %s", target_fy)
 
         # Search through fiscal year groups
         for fy_group in data["items"]["en"]:
@@ -2276,7 +2895,7 @@ def fetch_from_sapdbl_api(fiscal_year: str, report_type: str, quarter: Optional[
             if target_fy not in normalize_fiscal_year_format(clean_title):
                 continue
 
-            print(f"  ✓ Found fiscal year group: {raw_group_title}")
+            logger.debug("  ✓ Found fiscal year group: %s", raw_group_title)
 
             # Search through child documents
             for doc in fy_group.get("child", []):
@@ -2289,13 +2908,14 @@ def fetch_from_sapdbl_api(fiscal_year: str, report_type: str, quarter: Optional[
                     # Handle specific case if 'end' or 'ending' confuses the extractor
                     if not doc_quarter:
                         # Fallback for SAPDBL naming conventions if needed
-                        if "ashoj" in doc_name.lower() or "asoj" in doc_name.lower():
+                        doc_name_lower = doc_name.lower()
+                        if "ashoj" in doc_name_lower or "asoj" in doc_name_lower:
                             doc_quarter = "Q1"
-                        elif "poush" in doc_name.lower() or "pus" in doc_name.lower():
+                        elif "poush" in doc_name_lower or "pus" in doc_name_lower:
                             doc_quarter = "Q2"
-                        elif "chaitra" in doc_name.lower():
+                        elif "chaitra" in doc_name_lower:
                             doc_quarter = "Q3"
-                        elif "ashadh" in doc_name.lower() or "ashad" in doc_name.lower():
+                        elif "ashadh" in doc_name_lower or "ashad" in doc_name_lower:
                             doc_quarter = "Q4"
 
                     if doc_quarter != quarter:
@@ -2306,7 +2926,7 @@ def fetch_from_sapdbl_api(fiscal_year: str, report_type: str, quarter: Optional[
                 if not pdf_url:
                     continue
 
-                print(f"  ✅ Found matching document: {doc_name}")
+                logger.info("  ✅ Found matching document: %s", doc_name)
 
                 return {
                     "fiscal_year": target_fy,
@@ -2317,11 +2937,11 @@ def fetch_from_sapdbl_api(fiscal_year: str, report_type: str, quarter: Optional[
                     "source": "sapdbl_api"
                 }
 
-        print(f"  ❌ No matching document found for {target_fy}")
+        logger.info("  ❌ No matching document found for %s", target_fy)
         return None
 
     except Exception as e:
-        print(f"  ❌ SAPDBL API Error: {e}")
+        logger.error("  ❌ SAPDBL API Error: %s", e)
         return None
 
 
@@ -2330,24 +2950,23 @@ def has_dev_bank_dynamic_api(bank_symbol: str) -> bool:
     return bank_symbol.upper() in DEV_BANK_DYNAMIC_API
 
 
-def fetch_from_dev_bank_api(bank_symbol: str, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
+# Report lookup per development bank with a dynamic API
+DEV_BANK_API_FETCHERS = {
+    "JBBL": fetch_from_jbbl_api,
+    "GRDBL": fetch_from_grdbl_api,
+    "SAPDBL": fetch_from_sapdbl_api,
+}
+
+
+async def fetch_from_dev_bank_api(bank_symbol: str, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> Optional[Dict]:
     """Main dispatcher for development bank dynamic APIs"""
     bank_symbol = bank_symbol.upper()
-
-    if not has_dev_bank_dynamic_api(bank_symbol):
+    fetcher = DEV_BANK_API_FETCHERS.get(bank_symbol)
+    if not fetcher:
         return None
 
-    config = DEV_BANK_DYNAMIC_API[bank_symbol]
-    print(f"  Using dynamic API for {bank_symbol} ({config['name']})")
-
-    if bank_symbol == "JBBL":
-        return fetch_from_jbbl_api(fiscal_year, report_type, quarter)
-    elif bank_symbol == "GRDBL":
-        return fetch_from_grdbl_api(fiscal_year, report_type, quarter)
-    elif bank_symbol == "SAPDBL":
-        return fetch_from_sapdbl_api(fiscal_year, report_type, quarter)
-
-    return None
+    logger.debug("  Using dynamic API for %s (%s)", bank_symbol, DEV_BANK_DYNAMIC_API[bank_symbol]['name'])
+    return await fetcher(fiscal_year, report_type, quarter)
 
 
 # ============================================================================
@@ -2360,11 +2979,9 @@ def fetch_from_pfl_api(fiscal_year: str, report_type: str, quarter: Optional[str
     api_url = config['annual_api'] if report_type == 'annual' else config['quarterly_api']
 
     try:
-        print(f"  Fetching from PFL API: {api_url}")
-        response = requests.get(api_url, timeout=15)
-        if response.status_code != 200: return None
-
-        data = response.json()
+        logger.debug("  Fetching from PFL API: %s", api_url)
+        data = get_api_json(api_url)
+        if data is None: return None
         target_fy = normalize_fiscal_year_format(fiscal_year)
 
         # Structure: {"FY": {"en": [{"title": "FY 2079-80", "child": [...]}]}}
@@ -2394,7 +3011,7 @@ def fetch_from_pfl_api(fiscal_year: str, report_type: str, quarter: Optional[str
                 }
         return None
     except Exception as e:
-        print(f"  PFL API Error: {e}")
+        logger.error("  PFL API Error: %s", e)
         return None
 
 
@@ -2404,11 +3021,9 @@ def fetch_from_gmfil_api(fiscal_year: str, report_type: str, quarter: Optional[s
     api_url = config['annual_api'] if report_type == 'annual' else config['quarterly_api']
 
     try:
-        print(f"  Fetching from GMFIL API: {api_url}")
-        response = requests.get(api_url, timeout=15)
-        if response.status_code != 200: return None
-
-        data = response.json()
+        logger.debug("  Fetching from GMFIL API: %s", api_url)
+        data = get_api_json(api_url)
+        if data is None: return None
         target_fy = normalize_fiscal_year_format(fiscal_year)
 
         items = data.get("items", {}).get("en", [])
@@ -2436,7 +3051,7 @@ def fetch_from_gmfil_api(fiscal_year: str, report_type: str, quarter: Optional[s
             }
         return None
     except Exception as e:
-        print(f"  GMFIL API Error: {e}")
+        logger.error("  GMFIL API Error: %s", e)
         return None
 
 
@@ -2446,11 +3061,9 @@ def fetch_from_icfc_api(fiscal_year: str, report_type: str, quarter: Optional[st
     api_url = config['annual_api'] if report_type == 'annual' else config['quarterly_api']
 
     try:
-        print(f"  Fetching from ICFC API: {api_url}")
-        response = requests.get(api_url, timeout=15)
-        if response.status_code != 200: return None
-
-        data = response.json()
+        logger.debug("  Fetching from ICFC API: %s", api_url)
+        data = get_api_json(api_url)
+        if data is None: return None
         target_fy = normalize_fiscal_year_format(fiscal_year)
 
         items = data.get("items", {}).get("en", [])
@@ -2479,7 +3092,7 @@ def fetch_from_icfc_api(fiscal_year: str, report_type: str, quarter: Optional[st
             }
         return None
     except Exception as e:
-        print(f"  ICFC API Error: {e}")
+        logger.error("  ICFC API Error: %s", e)
         return None
 
 
@@ -2488,11 +3101,9 @@ def fetch_from_mfil_api(fiscal_year: str, report_type: str, quarter: Optional[st
     config = FINANCE_COMPANY_DYNAMIC_API["MFIL"]
 
     try:
-        print(f"  Fetching from MFIL API: {config['api_base']}")
-        response = requests.get(config['api_base'], timeout=15)
-        if response.status_code != 200: return None
-
-        data = response.json()
+        logger.debug("  Fetching from MFIL API: %s", config['api_base'])
+        data = get_api_json(config['api_base'])
+        if data is None: return None
         target_fy = normalize_fiscal_year_format(fiscal_year)
         target_cat = config['annual_category'] if report_type == 'annual' else config['quarterly_category']
 
@@ -2540,7 +3151,7 @@ def fetch_from_mfil_api(fiscal_year: str, report_type: str, quarter: Optional[st
                 }
         return None
     except Exception as e:
-        print(f"  MFIL API Error: {e}")
+        logger.error("  MFIL API Error: %s", e)
         return None
 
 
@@ -2549,7 +3160,7 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
     config = FINANCE_COMPANY_DYNAMIC_API["PROFL"]
 
     try:
-        print(f"  Fetching from PROFL API: {config['api_url']}")
+        logger.debug("  Fetching from PROFL API: %s", config['api_url'])
 
         headers = {
             "x-api-token": config['api_token'],
@@ -2557,14 +3168,11 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
             "Content-Type": "application/json"
         }
 
-        response = requests.get(config['api_url'], headers=headers, timeout=15)
-        if response.status_code != 200:
-            print(f"  PROFL API returned status {response.status_code}")
+        documents = get_api_json(config['api_url'], headers=headers)
+        if documents is None:
             return None
-
-        documents = response.json()
         if not isinstance(documents, list):
-            print(f"  Unexpected PROFL API response format")
+            logger.warning("  Unexpected PROFL API response format")
             return None
 
         target_fy = normalize_fiscal_year_format(fiscal_year)
@@ -2577,7 +3185,7 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
         else:
             return None
 
-        print(f"  Looking for: {target_file_type}, FY: {target_fy}, Quarter: {quarter}")
+        logger.debug("  Looking for: %s, FY: %s, Quarter: %s", target_file_type, target_fy, quarter)
 
         candidates = []
         for doc in documents:
@@ -2602,7 +3210,7 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
             # - "2078/09/08" (date format - skip)
 
             # Find all fiscal year patterns
-            fy_matches = re.findall(r'(\d{3,4})/(\d{2,4})', fiscal_year_field)
+            fy_matches = _FY_SLASH_RE.findall(fiscal_year_field)
 
             if not fy_matches:
                 continue
@@ -2648,7 +3256,7 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
             candidates.append(doc)
 
         if not candidates:
-            print(f"  No matching document found")
+            logger.info("  No matching document found")
             return None
 
         # Select best candidate (first one for now, or prioritize most recent)
@@ -2657,10 +3265,10 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
         # Build full URL
         file_path = selected.get("file_path_url", "")
         if not file_path:
-            print(f"  No file_path_url in document")
+            logger.info("  No file_path_url in document")
             return None
 
-        print(f"  ✅ Found matching document: {selected.get('file_title', '')}")
+        logger.info("  ✅ Found matching document: %s", selected.get('file_title', ''))
 
         return {
             "fiscal_year": target_fy,
@@ -2672,49 +3280,52 @@ def fetch_from_profl_api(fiscal_year: str, report_type: str, quarter: Optional[s
         }
 
     except Exception as e:
-        print(f"  PROFL API Error: {e}")
+        logger.error("  PROFL API Error: %s", e)
         return None
 
 
 
+# Report lookup per finance company with a dynamic API
+FINANCE_COMPANY_API_FETCHERS = {
+    "PFL": fetch_from_pfl_api,
+    "GMFIL": fetch_from_gmfil_api,
+    "ICFC": fetch_from_icfc_api,
+    "MFIL": fetch_from_mfil_api,
+    "PROFL": fetch_from_profl_api,
+}
+
+
 def fetch_from_finance_company_api(company_symbol: str, fiscal_year: str, report_type: str,
                                    quarter: Optional[str] = None) -> Optional[Dict]:
     """Dispatcher for Finance Company Dynamic APIs"""
-    company_symbol = company_symbol.upper()
+    fetcher = FINANCE_COMPANY_API_FETCHERS.get(company_symbol.upper())
+    if not fetcher:
+        return None
+    return fetcher(fiscal_year, report_type, quarter)
 
-    if company_symbol == "PFL":
-        return fetch_from_pfl_api(fiscal_year, report_type, quarter)
-    elif company_symbol == "GMFIL":
-        return fetch_from_gmfil_api(fiscal_year, report_type, quarter)
-    elif company_symbol == "ICFC":
-        return fetch_from_icfc_api(fiscal_year, report_type, quarter)
-    elif company_symbol == "MFIL":
-        return fetch_from_mfil_api(fiscal_year, report_type, quarter)
-    elif company_symbol == "PROFL":
-        return fetch_from_profl_api(fiscal_year, report_type, quarter)
 
-    return None
 # ============================================================================
 # COMMERCIAL BANK DYNAMIC API DISPATCHER
 # ============================================================================
 
-def fetch_from_dynamic_api(bank_symbol: str, fiscal_year: str, report_type: str, quarter: Optional[str] = None) -> \
-        Optional[Dict]:
-    bank_symbol = bank_symbol.upper()
-    if not has_dynamic_api(bank_symbol): return None
-    if bank_symbol == "NABIL":
-        return fetch_from_nabil_api(fiscal_year, report_type, quarter)
-    elif bank_symbol == "PCBL":
-        return fetch_from_prime_api(fiscal_year, report_type, quarter)
-    elif bank_symbol == "SANIMA":
-        return fetch_from_sanima_api(fiscal_year, report_type, quarter)
-    elif bank_symbol == "GBIME":
-        return fetch_from_gbime_api(fiscal_year, report_type, quarter)
-    elif bank_symbol == "NIMB":
-        return fetch_from_nimb_api(fiscal_year, report_type, quarter)
-    return None
+# Report lookup per bank with a dynamic API
+DYNAMIC_API_FETCHERS = {
+    "NABIL": fetch_from_nabil_api,
+    "PCBL": fetch_from_prime_api,
+    "SANIMA": fetch_from_sanima_api,
+    "GBIME": fetch_from_gbime_api,
+    "NIMB": fetch_from_nimb_api,
+}
+
 
+async def fetch_from_dynamic_api(bank_symbol: str, fiscal_year: str, report_type: str,
+                                 quarter: Optional[str] = None) -> Optional[Dict]:
+    fetcher = DYNAMIC_API_FETCHERS.get(bank_symbol)
+    if not fetcher: return None
+    return await fetcher(fiscal_year, report_type, quarter)
 
+
+@functools.lru_cache(maxsize=4096)
 def extract_fiscal_year_from_title(title: str) -> Optional[str]:
     title = title.lower()
     for part in title.split():
@@ -2723,6 +3334,32 @@ def extract_fiscal_year_from_title(title: str) -> Optional[str]:
     return None
 
 
+# Nepali month to quarter mapping used by extract_quarter_from_title
+TITLE_NEPALI_MONTH_QUARTERS = {
+    # Q1 months (Shrawan to Ashwin - July to October)
+    'shrawan': 'Q1', 'sawan': 'Q1', 'ashwin': 'Q1', 'ashoj': 'Q1', 'asoj': 'Q1',
+    # Q2 months (Kartik to Poush - November to January)
+    'kartik': 'Q2', 'mangsir': 'Q2', 'poush': 'Q2', 'magh': 'Q2',
+    # Q3 months (Falgun to Chaitra - February to April)
+    'falgun': 'Q3', 'chaitra': 'Q3', 'chait': 'Q3',
+    # Q4 months (Baisakh to Ashadh - May to July)
+    'baisakh': 'Q4', 'jestha': 'Q4', 'ashadh': 'Q4', 'ashad': 'Q4', 'ashar': 'Q4'
+}
+
+# English quarter keywords, checked in order after the Nepali months
+TITLE_QUARTER_KEYWORDS = {
+    'q1': 'Q1', 'q2': 'Q2', 'q3': 'Q3', 'q4': 'Q4',
+    '1st': 'Q1', '2nd': 'Q2', '3rd': 'Q3', '4th': 'Q4',
+    'first': 'Q1', 'second': 'Q2', 'third': 'Q3', 'fourth': 'Q4',
+    'quarter 1': 'Q1', 'quarter 2': 'Q2', 'quarter 3': 'Q3', 'quarter 4': 'Q4',
+    'quarter-1': 'Q1', 'quarter-2': 'Q2', 'quarter-3': 'Q3', 'quarter-4': 'Q4',
+    # JBBL API uses "quater" (typo) instead of "quarter"
+    'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3', 'fourth_quater': 'Q4',
+    'first quater': 'Q1', 'second quater': 'Q2', 'third quater': 'Q3', 'fourth quater': 'Q4'
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_quarter_from_title(title: str) -> Optional[str]:
     """
     Extract quarter from title - handles English, Nepali months, and various formats
@@ -2732,36 +3369,13 @@ def extract_quarter_from_title(title: str) -> Optional[str]:
 
     title = title.lower()
 
-    # Nepali month to quarter mapping
-    nepali_months = {
-        # Q1 months (Shrawan to Ashwin - July to October)
-        'shrawan': 'Q1', 'sawan': 'Q1', 'ashwin': 'Q1', 'ashoj': 'Q1', 'asoj': 'Q1',
-        # Q2 months (Kartik to Poush - November to January)
-        'kartik': 'Q2', 'mangsir': 'Q2', 'poush': 'Q2', 'magh': 'Q2',
-        # Q3 months (Falgun to Chaitra - February to April)
-        'falgun': 'Q3', 'chaitra': 'Q3', 'chait': 'Q3',
-        # Q4 months (Baisakh to Ashadh - May to July)
-        'baisakh': 'Q4', 'jestha': 'Q4', 'ashadh': 'Q4', 'ashad': 'Q4', 'ashar': 'Q4'
-    }
-
     # Check Nepali months first
-    for month, qtr in nepali_months.items():
+    for month, qtr in TITLE_NEPALI_MONTH_QUARTERS.items():
         if month in title:
             return qtr
 
     # English keywords
-    keywords = {
-        'q1': 'Q1', 'q2': 'Q2', 'q3': 'Q3', 'q4': 'Q4',
-        '1st': 'Q1', '2nd': 'Q2', '3rd': 'Q3', '4th': 'Q4',
-        'first': 'Q1', 'second': 'Q2', 'third': 'Q3', 'fourth': 'Q4',
-        'quarter 1': 'Q1', 'quarter 2': 'Q2', 'quarter 3': 'Q3', 'quarter 4': 'Q4',
-        'quarter-1': 'Q1', 'quarter-2': 'Q2', 'quarter-3': 'Q3', 'quarter-4': 'Q4',
-        # JBBL API uses "quater" (typo) instead of "quarter"
-        'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3', 'fourth_quater': 'Q4',
-        'first quater': 'Q1', 'second quater': 'Q2', 'third quater': 'Q3', 'fourth quater': 'Q4'
-    }
-
-    for k, v in keywords.items():
+    for k, v in TITLE_QUARTER_KEYWORDS.items():
         if k in title:
             return v
 
@@ -2778,10 +3392,53 @@ def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+def clear_local_caches() -> Dict[str, int]:
+    """Drop this worker's cached bank metadata, report responses, bank API catalogs and negative scrape results"""
+    with BANK_INFO_CACHE_LOCK:
+        cleared = len(BANK_INFO_CACHE) + len(INSTITUTION_INFO_CACHE)
+        BANK_INFO_CACHE.clear()
+        INSTITUTION_INFO_CACHE.clear()
+    responses_cleared = clear_report_response_cache()
+    with _api_json_cache_lock:
+        catalogs_cleared = len(_catalog_cache) + len(_catalog_index_cache) + len(_api_json_cache)
+        _api_json_cache.clear()
+    _catalog_cache.clear()
+    _catalog_index_cache.clear()
+    _catalog_validators.clear()
+    negative_cleared = len(SCRAPE_NEGATIVE_CACHE)
+    SCRAPE_NEGATIVE_CACHE.clear()
+    with EXISTING_URLS_CACHE_LOCK:
+        EXISTING_URLS_CACHE.clear()
+    return {"bank_info_entries": cleared, "report_responses": responses_cleared, "catalogs": catalogs_cleared,
+            "negative_scrapes": negative_cleared}
+
+
+@app.post("/cache/invalidate")
+async def invalidate_cache():
+    """
+    Clear this worker's caches and reload banks, then bump the cache generation so the other workers clear theirs
+    within CACHE_GENERATION_POLL_INTERVAL seconds
+    """
+    global _cache_generation
+    cleared = clear_local_caches()
+    generation = await run_in_threadpool(bump_cache_generation)
+    if generation is not None:
+        _cache_generation = generation
+    banks_loaded = await run_in_threadpool(load_banks)
+    logger.info("🧹 Cleared %s, reloaded %s banks, other workers notified: %s", cleared, banks_loaded,
+                generation is not None)
+    return {"status": "cleared", **cleared, "banks_loaded": banks_loaded, "all_workers": generation is not None,
+            "timestamp": datetime.now().isoformat()}
+
+
+# How old a Firecrawl-cached page /diagnose accepts (1 hour)
+DIAGNOSE_MAX_AGE_MS = 3600000
+
+
 @app.get("/diagnose/{bank_symbol}")
-def diagnose_bank_website(bank_symbol: str):
+async def diagnose_bank_website(bank_symbol: str):
     bank_symbol = bank_symbol.upper()
-    bank = get_bank_info(bank_symbol)
+    bank = await run_in_threadpool(get_bank_info, bank_symbol)
     if not bank: raise HTTPException(status_code=404, detail=f"Bank '{bank_symbol}' not found")
     results = {"bank_symbol": bank_symbol, "bank_name": bank['bank_name'], "timestamp": datetime.now().isoformat(),
                "urls_tested": {}}
@@ -2789,161 +3446,249 @@ def diagnose_bank_website(bank_symbol: str):
     if bank.get('report_page'): test_urls.append(('report_page', bank['report_page']))
     if bank.get('annual_report_url'): test_urls.append(('annual_report_url', bank['annual_report_url']))
     if bank.get('quarter_report_url'): test_urls.append(('quarter_report_url', bank['quarter_report_url']))
-    for url_type, url in test_urls:
+
+    async def probe(url: str) -> Dict:
         try:
-            result = firecrawl.scrape(url, formats=["markdown"])
-            status_code = result.metadata.status_code if result.metadata else None
-            results["urls_tested"][url_type] = {"url": url, "status_code": status_code,
-                                                "accessible": status_code == 200}
+            # Links are a small payload and only the page status is needed, so an hour-old cached copy is fine
+            result = await firecrawl_scrape(url, ["links"], max_age=DIAGNOSE_MAX_AGE_MS)
+            status_code = (result.get('metadata') or {}).get('statusCode')
+            return {"url": url, "status_code": status_code, "accessible": status_code == 200}
         except Exception as e:
-            results["urls_tested"][url_type] = {"url": url, "error": str(e), "accessible": False}
+            return {"url": url, "error": str(e), "accessible": False}
+
+    # Probe all configured URLs at once
+    probe_results = await asyncio.gather(*(probe(url) for _, url in test_urls))
+    for (url_type, _), probe_result in zip(test_urls, probe_results):
+        results["urls_tested"][url_type] = probe_result
     return results
 
 
+def conditional_report_response(request: Request, response: Response, payload: Dict):
+    """
+    Attach a weak ETag (from pdf_url and fiscal_year) to a report payload
+    Returns an empty 304 when the client already holds the same report
+    """
+    digest = hashlib.md5(f"{payload.get('pdf_url')}|{payload.get('fiscal_year')}".encode()).hexdigest()
+    etag = f'W/"{digest}"'
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "max-age=600"})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "max-age=600"
+    return payload
+
+
 @app.get("/annual-report")
-def get_annual_report(bank_symbol: str, fiscal_year: str):
+async def get_annual_report(bank_symbol: str, fiscal_year: str, request: Request, response: Response):
     bank_symbol = bank_symbol.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-    bank = get_bank_info(bank_symbol)
+    cache_key = ('annual', bank_symbol, nepali_fy, None)
+    cached = get_cached_report_response(cache_key)
+    if cached: return conditional_report_response(request, response, cached)
+
+    bank = await run_in_threadpool(get_bank_info, bank_symbol)
     if not bank: raise HTTPException(status_code=404, detail=f"Bank '{bank_symbol}' not found")
 
-    existing = check_document_exists(bank['id'], nepali_fy, 'annual') or check_document_exists(bank['id'], english_fy,
-                                                                                               'annual')
+    existing = await run_in_threadpool(check_document_exists_any, bank['id'], [nepali_fy, english_fy], 'annual')
     if existing:
-        return {"status": "found", "source": "database", "bank_symbol": bank_symbol,
-                "fiscal_year": existing['fiscal_year'], "pdf_url": existing['pdf_url']}
+        payload = cache_report_response(cache_key, {"status": "found", "source": "database", "bank_symbol": bank_symbol,
+                                                    "fiscal_year": existing['fiscal_year'],
+                                                    "pdf_url": existing['pdf_url']})
+        return conditional_report_response(request, response, payload)
 
     if has_dynamic_api(bank_symbol):
-        api_doc = fetch_from_dynamic_api(bank_symbol, nepali_fy, 'annual')
+        api_doc = await fetch_from_dynamic_api(bank_symbol, nepali_fy, 'annual')
         if api_doc:
-            inserted = insert_document_from_api(bank['id'], bank_symbol, api_doc)
-            return {"status": "found", "source": "dynamic_api", "bank_symbol": bank_symbol,
-                    "fiscal_year": inserted['fiscal_year'], "pdf_url": inserted['pdf_url']}
-
-    report = scrape_specific_report(bank, nepali_fy, 'annual')
+            inserted = await run_in_threadpool(insert_document_from_api, bank['id'], bank_symbol, api_doc)
+            return conditional_report_response(request, response, {
+                "status": "found", "source": "dynamic_api", "bank_symbol": bank_symbol,
+                "fiscal_year": inserted['fiscal_year'], "pdf_url": inserted['pdf_url']})
+
+    async def scrape_and_store():
+        scraped = await scrape_specific_report(bank, nepali_fy, 'annual')
+        if scraped:
+            await run_in_threadpool(insert_document_to_db, bank['id'], bank_symbol, scraped)
+        return scraped
+
+    report = await dedup((bank['id'], nepali_fy, 'annual', None), scrape_and_store)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found via API or Scraper")
-    insert_document_to_db(bank['id'], bank_symbol, report)
-    return {"status": "found", "source": "scraped", "bank_symbol": bank_symbol, "fiscal_year": report['fiscal_year'],
-            "pdf_url": report['file_url']}
+    return conditional_report_response(request, response, {
+        "status": "found", "source": "scraped", "bank_symbol": bank_symbol, "fiscal_year": report['fiscal_year'],
+        "pdf_url": report['file_url']})
 
 
 @app.get("/quarterly-report")
-def get_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: str):
+async def get_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: str, request: Request,
+                               response: Response):
     bank_symbol = bank_symbol.upper()
     quarter = quarter.upper()
     if quarter not in ['Q1', 'Q2', 'Q3', 'Q4']: raise HTTPException(status_code=400, detail="Invalid Quarter")
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-    bank = get_bank_info(bank_symbol)
+    cache_key = ('quarterly', bank_symbol, nepali_fy, quarter)
+    cached = get_cached_report_response(cache_key)
+    if cached: return conditional_report_response(request, response, cached)
+
+    bank = await run_in_threadpool(get_bank_info, bank_symbol)
     if not bank: raise HTTPException(status_code=404, detail=f"Bank '{bank_symbol}' not found")
 
-    existing = check_document_exists(bank['id'], nepali_fy, 'quarterly', quarter) or check_document_exists(bank['id'],
-                                                                                                           english_fy,
-                                                                                                           'quarterly',
-                                                                                                           quarter)
+    existing = await run_in_threadpool(check_document_exists_any, bank['id'], [nepali_fy, english_fy], 'quarterly',
+                                       quarter)
     if existing:
-        return {"status": "found", "source": "database", "bank_symbol": bank_symbol,
-                "fiscal_year": existing['fiscal_year'], "pdf_url": existing['pdf_url']}
+        payload = cache_report_response(cache_key, {"status": "found", "source": "database", "bank_symbol": bank_symbol,
+                                                    "fiscal_year": existing['fiscal_year'],
+                                                    "pdf_url": existing['pdf_url']})
+        return conditional_report_response(request, response, payload)
 
     if has_dynamic_api(bank_symbol):
-        api_doc = fetch_from_dynamic_api(bank_symbol, nepali_fy, 'quarterly', quarter)
+        api_doc = await fetch_from_dynamic_api(bank_symbol, nepali_fy, 'quarterly', quarter)
         if api_doc:
-            inserted = insert_document_from_api(bank['id'], bank_symbol, api_doc)
-            return {"status": "found", "source": "dynamic_api", "bank_symbol": bank_symbol,
-                    "fiscal_year": inserted['fiscal_year'], "pdf_url": inserted['pdf_url']}
-
-    report = scrape_specific_report(bank, nepali_fy, 'quarterly', quarter)
+            inserted = await run_in_threadpool(insert_document_from_api, bank['id'], bank_symbol, api_doc)
+            return conditional_report_response(request, response, {
+                "status": "found", "source": "dynamic_api", "bank_symbol": bank_symbol,
+                "fiscal_year": inserted['fiscal_year'], "pdf_url": inserted['pdf_url']})
+
+    async def scrape_and_store():
+        scraped = await scrape_specific_report(bank, nepali_fy, 'quarterly', quarter)
+        if scraped:
+            await run_in_threadpool(insert_document_to_db, bank['id'], bank_symbol, scraped)
+        return scraped
+
+    report = await dedup((bank['id'], nepali_fy, 'quarterly', quarter), scrape_and_store)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found via API or Scraper")
-    insert_document_to_db(bank['id'], bank_symbol, report)
-    return {"status": "found", "source": "scraped", "bank_symbol": bank_symbol, "fiscal_year": report['fiscal_year'],
-            "pdf_url": report['file_url']}
+    return conditional_report_response(request, response, {
+        "status": "found", "source": "scraped", "bank_symbol": bank_symbol, "fiscal_year": report['fiscal_year'],
+        "pdf_url": report['file_url']})
 
 
-@app.post("/sync-dynamic-bank/{bank_symbol}")
-def sync_dynamic_bank_documents(bank_symbol: str):
-    bank_symbol = bank_symbol.upper()
-    if not has_dynamic_api(bank_symbol):
-        raise HTTPException(status_code=400, detail=f"Bank '{bank_symbol}' does not have dynamic API support")
-    bank = get_bank_info(bank_symbol)
-    if not bank: raise HTTPException(status_code=404, detail=f"Bank '{bank_symbol}' not found")
+# Rows per Supabase upsert when syncing a bank's document catalog; a whole bank usually fits in one request
+SYNC_INSERT_BATCH_SIZE = int(os.getenv("SYNC_INSERT_BATCH_SIZE", "500"))
+
 
-    # --- NABIL SYNC (Original Logic) ---
-    if bank_symbol == "NABIL":
-        config = DYNAMIC_API_BANKS["NABIL"]
+async def _insert_sync_documents(bank_id: int, rows: List[Dict], results: Dict):
+    """
+    Insert synced documents in batches of SYNC_INSERT_BATCH_SIZE, skipping pdf_urls and reports that are already stored
+    Rows sharing a report key keep only the first (syncers put the preferred copy first), so a batch cannot trip the
+    report-key unique index on itself; a batch that still fails is retried row by row so one bad row cannot sink it
+    """
+    unique_rows = {}
+    for row in rows:
+        unique_rows.setdefault(document_report_key(row), row)
+    results["conflicting_documents"] += len(rows) - len(unique_rows)
+    rows = await run_in_threadpool(filter_stored_documents, bank_id, list(unique_rows.values()), results)
+    for start in range(0, len(rows), SYNC_INSERT_BATCH_SIZE):
+        chunk = rows[start:start + SYNC_INSERT_BATCH_SIZE]
         try:
-            api_url = f"{config['api_base']}/get_financial_document_subcategories_by_category/{config['category_id']}"
-            print(f"Fetching from: {api_url}")
-            response = requests.get(api_url, timeout=30)
-            if response.status_code != 200: raise HTTPException(status_code=503,
-                                                                detail=f"Nabil API returned status {response.status_code}")
-            data = response.json()
-            subcategories = data.get('data', [])
-            existing_docs = supabase.table("financial_documents").select("pdf_url").eq("bank_id", bank['id']).execute()
-            existing_urls = set(doc['pdf_url'] for doc in existing_docs.data) if existing_docs.data else set()
-            results = {"bank_symbol": bank_symbol, "synced_at": datetime.now().isoformat(), "new_documents": 0,
-                       "existing_documents": 0, "errors": []}
-            for subcategory in subcategories:
-                subcat_id = subcategory.get('subcategory_id')
-                if subcat_id not in [config['quarterly_subcategory_id'], config['annual_subcategory_id']]: continue
-                report_type = "quarterly" if subcat_id == config['quarterly_subcategory_id'] else "annual"
-                documents = subcategory.get('documents', [])
-                documents_by_key = {}
-                for doc in documents:
-                    if doc.get('name_np') or 'nepali' in doc.get('name', '').lower(): continue
-                    fiscal_year_normalized = normalize_fiscal_year_format(doc.get('fiscal_year', ''))
-                    quarter = None
-                    if report_type == "quarterly":
-                        name_lower = doc.get('name', '').lower()
-                        if 'first' in name_lower or 'q1' in name_lower:
-                            quarter = 'Q1'
-                        elif 'second' in name_lower or 'q2' in name_lower:
-                            quarter = 'Q2'
-                        elif 'third' in name_lower or 'q3' in name_lower:
-                            quarter = 'Q3'
-                        elif 'fourth' in name_lower or 'q4' in name_lower:
-                            quarter = 'Q4'
-                    doc_key = (fiscal_year_normalized, quarter)
-                    if doc_key not in documents_by_key: documents_by_key[doc_key] = []
-                    documents_by_key[doc_key].append(doc)
-                for doc_key, docs in documents_by_key.items():
-                    fiscal_year_normalized, quarter = doc_key
-                    selected_doc = docs[0]
-                    file_path = selected_doc.get('file', '')
-                    full_url = f"{config['file_base']}/{file_path}" if file_path else None
-                    if not full_url: continue
-                    if full_url in existing_urls:
-                        results["existing_documents"] += 1
-                        continue
-                    try:
-                        doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": full_url,
-                                    "fiscal_year": fiscal_year_normalized, "report_type": report_type,
-                                    "quarter": quarter, "scraped_at": datetime.now().isoformat(), "method": "dynamic"}
-                        supabase.table("financial_documents").insert(doc_data).execute()
-                        results["new_documents"] += 1
-                        existing_urls.add(full_url)
-                    except Exception as e:
-                        results["errors"].append(str(e))
-            return results
+            result = await run_in_threadpool(supabase.table("financial_documents").upsert(
+                chunk, on_conflict="pdf_url", ignore_duplicates=True).execute)
+            inserted = len(result.data or [])
+            results["new_documents"] += inserted
+            results["existing_documents"] += len(chunk) - inserted
+            mark_documents_stored(bank_id, [doc['pdf_url'] for doc in result.data or []])
+            continue
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error syncing: {str(e)}")
+            logger.warning("Batch insert of %s synced documents failed, retrying one by one: %s", len(chunk), e)
+        stored_urls = []
+        for row in chunk:
+            try:
+                await run_in_threadpool(supabase.table("financial_documents").insert(row).execute)
+                results["new_documents"] += 1
+                stored_urls.append(row['pdf_url'])
+            except Exception as e:
+                if "financial_documents_report_key" in str(e):
+                    # Another copy of this report is stored under a different pdf_url
+                    results["conflicting_documents"] += 1
+                elif "unique constraint" in str(e).lower() or "duplicate key" in str(e).lower():
+                    results["existing_documents"] += 1
+                    stored_urls.append(row['pdf_url'])
+                else:
+                    results["errors"].append(str(e))
+        mark_documents_stored(bank_id, stored_urls)
+
+
+async def _sync_nabil(bank: Dict, bank_symbol: str, config: Dict) -> Dict:
+    """Sync NABIL documents from its subcategory API"""
+    try:
+        api_url = f"{config['api_base']}/get_financial_document_subcategories_by_category/{config['category_id']}"
+        logger.debug("Fetching from: %s", api_url)
+        response = await http_client.get(api_url, timeout=30)
+        if response.status_code != 200: raise HTTPException(status_code=503,
+                                                            detail=f"Nabil API returned status {response.status_code}")
+        data = orjson.loads(response.content)
+        subcategories = data.get('data', [])
+        seen_urls = set()
+        synced_at = datetime.now().isoformat()
+        results = {"bank_symbol": bank_symbol, "synced_at": synced_at, "new_documents": 0,
+                   "existing_documents": 0, "conflicting_documents": 0, "errors": []}
+        pending = []
+        for subcategory in subcategories:
+            report_type = NABIL_SUBCATEGORY_REPORT_TYPES.get(subcategory.get('subcategory_id'))
+            if not report_type: continue
+            documents = subcategory.get('documents', [])
+            # First English document per (fiscal year, quarter)
+            selected_by_key = {}
+            for doc in documents:
+                name_lower = doc.get('name', '').lower()
+                if doc.get('name_np') or 'nepali' in name_lower: continue
+                fiscal_year_normalized = normalize_fiscal_year_format(doc.get('fiscal_year', ''))
+                quarter = None
+                if report_type == "quarterly": quarter = infer_nabil_quarter(name_lower)
+                selected_by_key.setdefault((fiscal_year_normalized, quarter), doc)
+            for (fiscal_year_normalized, quarter), selected_doc in selected_by_key.items():
+                file_path = selected_doc.get('file', '')
+                full_url = f"{config['file_base']}/{file_path}" if file_path else None
+                if not full_url: continue
+                if full_url in seen_urls:
+                    results["existing_documents"] += 1
+                    continue
+                doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": full_url,
+                            "fiscal_year": fiscal_year_normalized, "report_type": report_type,
+                            "quarter": quarter, "scraped_at": synced_at, "method": "dynamic"}
+                pending.append(doc_data)
+                seen_urls.add(full_url)
+        await _insert_sync_documents(bank['id'], pending, results)
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error syncing: {str(e)}")
 
-    # --- PRIME BANK SYNC (Original Logic) ---
-    elif bank_symbol == "PCBL":
-        config = DYNAMIC_API_BANKS["PCBL"]
+
+async def _sync_prime(bank: Dict, bank_symbol: str, config: Dict) -> Dict:
+    """Sync Prime Bank (PCBL) documents from its paginated API"""
+    try:
+        seen_urls = set()
+        synced_at = datetime.now().isoformat()
+        results = {"bank_symbol": bank_symbol, "synced_at": synced_at, "new_documents": 0,
+                   "existing_documents": 0, "conflicting_documents": 0, "errors": []}
+        # One (title, row) per (fiscal year, report type, quarter): the first English one, else the first seen
+        selected_by_key = {}
+
+        async def fetch_page(api_url: str):
+            async with PRIME_PAGE_SEMAPHORE:
+                return await http_client.get(api_url, timeout=10)
+
+        async def listing_pages(listing: List[asyncio.Task]):
+            """Yield a listing's pages in order, cancelling the pages not yet needed once the consumer stops"""
+            try:
+                for task in listing:
+                    try:
+                        yield await task
+                    except Exception:
+                        return
+            finally:
+                for task in listing:
+                    if not task.done(): task.cancel()
+
+        # Request every page of both listings at once, walk each listing in page order and drop the
+        # requests past its last page as soon as that page is seen
+        report_types = [('annual', config['annual_endpoint']), ('quarterly', config['quarterly_endpoint'])]
+        listings = [[asyncio.create_task(fetch_page(f"{config['api_base']}{endpoint_template.format(page=page)}"))
+                     for page in range(1, PRIME_MAX_PAGES + 1)] for _, endpoint_template in report_types]
         try:
-            existing_docs = supabase.table("financial_documents").select("pdf_url").eq("bank_id", bank['id']).execute()
-            existing_urls = set(doc['pdf_url'] for doc in existing_docs.data) if existing_docs.data else set()
-            results = {"bank_symbol": bank_symbol, "synced_at": datetime.now().isoformat(), "new_documents": 0,
-                       "existing_documents": 0, "errors": []}
-            for report_type, endpoint_template in [('annual', config['annual_endpoint']),
-                                                   ('quarterly', config['quarterly_endpoint'])]:
-                page = 1
-                while page <= 20:
-                    api_url = f"{config['api_base']}{endpoint_template.format(page=page)}"
-                    response = requests.get(api_url, timeout=10)
+            for (report_type, _), listing in zip(report_types, listings):
+                pages = listing_pages(listing)
+                async for response in pages:
                     if response.status_code != 200: break
-                    api_response = response.json()
+                    api_response = orjson.loads(response.content)
                     if api_response.get('status') != 'Success': break
                     items = api_response.get('items', [])
                     if not items: break
@@ -2951,243 +3696,322 @@ def sync_dynamic_bank_documents(bank_symbol: str):
                         title = record.get('Title', '')
                         doc_path = record.get('DocPath', '')
                         if not title or not doc_path or 'kankai' in title.lower(): continue
-                        if doc_path in existing_urls:
+                        if doc_path in seen_urls:
                             results["existing_documents"] += 1
                             continue
                         fiscal_year = extract_fiscal_year_from_title(title)
                         if not fiscal_year: continue
                         fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
                         quarter = None
-                        if report_type == 'quarterly': quarter = extract_quarter_from_title(title)
-                        try:
-                            doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": doc_path,
-                                        "fiscal_year": fiscal_year_normalized, "report_type": report_type,
-                                        "quarter": quarter, "scraped_at": datetime.now().isoformat(),
-                                        "method": "dynamic"}
-                            supabase.table("financial_documents").insert(doc_data).execute()
-                            results["new_documents"] += 1
-                            existing_urls.add(doc_path)
-                        except Exception as e:
-                            results["errors"].append(str(e))
-                    page += 1
-            return results
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error syncing Prime: {str(e)}")
-
-    # --- SANIMA BANK SYNC (Original Logic) ---
-    elif bank_symbol == "SANIMA":
-        config = DYNAMIC_API_BANKS["SANIMA"]
-        try:
-            response = requests.get(config['api_base'], timeout=15)
-            api_response = response.json()
-            categories = api_response.get('data', {}).get('documentCategory', [])
-            existing_docs = supabase.table("financial_documents").select("pdf_url").eq("bank_id", bank['id']).execute()
-            existing_urls = set(doc['pdf_url'] for doc in existing_docs.data) if existing_docs.data else set()
-            results = {"bank_symbol": bank_symbol, "synced_at": datetime.now().isoformat(), "new_documents": 0,
-                       "existing_documents": 0, "errors": []}
-            for category in categories:
-                category_name = category.get('name', '')
-                if category_name not in ['Annual Report', 'Financial Report']: continue
-                report_type = 'annual' if category_name == 'Annual Report' else 'quarterly'
-                documents_by_key = {}
-                for subcategory in category.get('subCategories', []):
-                    for doc in subcategory.get('documents', []):
-                        fiscal_year = doc.get('fiscal_year', '')
-                        if not fiscal_year: continue
-                        fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
-                        quarter = None
                         if report_type == 'quarterly':
-                            quater_obj = doc.get('quater')
-                            if quater_obj:
-                                sys_name = quater_obj.get('systemName', '')
-                                q_map = {'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3',
-                                         'fourth_quater': 'Q4'}
-                                quarter = q_map.get(sys_name)
-                        doc_key = (fiscal_year_normalized, quarter)
-                        if doc_key not in documents_by_key: documents_by_key[doc_key] = []
-                        documents_by_key[doc_key].append(doc)
-                for doc_key, docs in documents_by_key.items():
-                    fiscal_year_normalized, quarter = doc_key
-                    selected_doc = None
-                    if len(docs) == 1:
-                        selected_doc = docs[0]
-                    else:
-                        english_docs = [d for d in docs if
-                                        'english' in d.get('name', '').lower() or '(eng)' in d.get('name',
-                                                                                                   '').lower() or not d.get(
-                                            'name_np')]
-                        nepali_docs = [d for d in docs if d not in english_docs]
-                        selected_doc = english_docs[0] if english_docs else nepali_docs[0]
-                    if not selected_doc: continue
-                    file_path = selected_doc.get('file', '')
-                    full_url = f"{config['file_base']}{file_path}" if file_path else None
-                    if not full_url or full_url in existing_urls:
-                        if full_url: results["existing_documents"] += 1
-                        continue
-                    try:
-                        doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": full_url,
+                            quarter = extract_quarter_from_title(title)
+                            if not quarter: continue
+                        doc_key = (fiscal_year_normalized, report_type, quarter)
+                        incumbent = selected_by_key.get(doc_key)
+                        if incumbent is not None and ('english' not in title.lower()
+                                                      or 'english' in incumbent[0].lower()):
+                            continue
+                        doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": doc_path,
                                     "fiscal_year": fiscal_year_normalized, "report_type": report_type,
-                                    "quarter": quarter, "scraped_at": datetime.now().isoformat(), "method": "dynamic"}
-                        supabase.table("financial_documents").insert(doc_data).execute()
-                        results["new_documents"] += 1
-                        existing_urls.add(full_url)
-                    except Exception as e:
-                        results["errors"].append(str(e))
-            return results
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error syncing Sanima: {str(e)}")
+                                    "quarter": quarter, "scraped_at": synced_at,
+                                    "method": "dynamic"}
+                        selected_by_key[doc_key] = (title, doc_data)
+                        seen_urls.add(doc_path)
+                await pages.aclose()
+        finally:
+            for task in (task for listing in listings for task in listing):
+                if not task.done(): task.cancel()
+        await _insert_sync_documents(bank['id'], [doc_data for _, doc_data in selected_by_key.values()], results)
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error syncing Prime: {str(e)}")
 
-    # --- GBIME SYNC (New Logic) ---
-    elif bank_symbol == "GBIME":
-        config = DYNAMIC_API_BANKS["GBIME"]
-        try:
-            existing_docs = supabase.table("financial_documents").select("pdf_url").eq("bank_id", bank['id']).execute()
-            existing_urls = set(doc['pdf_url'] for doc in existing_docs.data) if existing_docs.data else set()
-            results = {"bank_symbol": bank_symbol, "synced_at": datetime.now().isoformat(), "new_documents": 0,
-                       "existing_documents": 0, "errors": []}
-
-            for report_type, api_url in [('annual', config['annual_api']), ('quarterly', config['quarterly_api'])]:
-                print(f"Fetching GBIME {report_type}...")
-                response = requests.get(api_url, timeout=20)
-                if response.status_code != 200: continue
-
-                all_docs = flatten_gbime_documents(response.json())
-
-                # Group by FY+Quarter
-                docs_map = {}
-                for doc in all_docs:
-                    fy = normalize_fiscal_year_format(doc.get('fiscal_year'))
-                    if not fy: continue
-                    q = None
+
+def is_english_catalog_document(doc: Dict) -> bool:
+    """Whether a Sanima/NIMB category API document is the English copy"""
+    name_lower = doc.get('name', '').lower()
+    return 'english' in name_lower or '(eng)' in name_lower or not doc.get('name_np')
+
+
+async def _sync_sanima(bank: Dict, bank_symbol: str, config: Dict) -> Dict:
+    """Sync Sanima Bank documents from its category API"""
+    try:
+        response = await http_client.get(config['api_base'], timeout=15)
+        api_response = orjson.loads(response.content)
+        categories = api_response.get('data', {}).get('documentCategory', [])
+        seen_urls = set()
+        synced_at = datetime.now().isoformat()
+        results = {"bank_symbol": bank_symbol, "synced_at": synced_at, "new_documents": 0,
+                   "existing_documents": 0, "conflicting_documents": 0, "errors": []}
+        pending = []
+        for category in categories:
+            category_name = category.get('name', '')
+            if category_name not in ['Annual Report', 'Financial Report']: continue
+            report_type = 'annual' if category_name == 'Annual Report' else 'quarterly'
+            # First English copy per (fiscal year, quarter), else the first document
+            selected_by_key = {}
+            for subcategory in category.get('subCategories', []):
+                for doc in subcategory.get('documents', []):
+                    fiscal_year = doc.get('fiscal_year', '')
+                    if not fiscal_year: continue
+                    fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
+                    quarter = None
+                    if report_type == 'quarterly':
+                        quarter = resolve_quarter_from_quater_obj(doc.get('quater'))
+                    doc_key = (fiscal_year_normalized, quarter)
+                    incumbent = selected_by_key.get(doc_key)
+                    if incumbent is None or (is_english_catalog_document(doc)
+                                             and not is_english_catalog_document(incumbent)):
+                        selected_by_key[doc_key] = doc
+            for (fiscal_year_normalized, quarter), selected_doc in selected_by_key.items():
+                file_path = selected_doc.get('file', '')
+                full_url = f"{config['file_base']}{file_path}" if file_path else None
+                if not full_url or full_url in seen_urls:
+                    if full_url: results["existing_documents"] += 1
+                    continue
+                doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": full_url,
+                            "fiscal_year": fiscal_year_normalized, "report_type": report_type,
+                            "quarter": quarter, "scraped_at": synced_at, "method": "dynamic"}
+                pending.append(doc_data)
+                seen_urls.add(full_url)
+        await _insert_sync_documents(bank['id'], pending, results)
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error syncing Sanima: {str(e)}")
+
+
+async def _sync_gbime(bank: Dict, bank_symbol: str, config: Dict) -> Dict:
+    """Sync GBIME documents from its annual and quarterly APIs"""
+    try:
+        seen_urls = set()
+        synced_at = datetime.now().isoformat()
+        results = {"bank_symbol": bank_symbol, "synced_at": synced_at, "new_documents": 0,
+                   "existing_documents": 0, "conflicting_documents": 0, "errors": []}
+        pending = []
+
+        logger.debug("Fetching GBIME annual and quarterly...")
+        responses = await asyncio.gather(http_client.get(config['annual_api'], timeout=20),
+                                         http_client.get(config['quarterly_api'], timeout=20))
+        for report_type, response in zip(('annual', 'quarterly'), responses):
+            if response.status_code != 200: continue
+
+            # Pick one document per FY+Quarter: the first English one, else the first seen
+            selected = {}
+            for doc in iter_gbime_documents(orjson.loads(response.content)):
+                fy = normalize_fiscal_year_format(doc.get('fiscal_year'))
+                if not fy: continue
+                q = None
+                if report_type == 'quarterly':
+                    q = extract_gbime_quarter(doc.get('quater'), doc.get('name', ''))
+                    if not q: continue
+                key = (fy, q)
+                incumbent = selected.get(key)
+                if incumbent is None or ("english" in doc.get('name', '').lower()
+                                         and "english" not in incumbent.get('name', '').lower()):
+                    selected[key] = doc
+
+            # Process selections
+            for (fy, q), sel in selected.items():
+                path = sel.get('file', '')
+                full_url = f"{config['file_base']}{path.lstrip('/')}"
+
+                if full_url in seen_urls:
+                    results["existing_documents"] += 1
+                    continue
+
+                doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": full_url,
+                            "fiscal_year": fy, "report_type": report_type, "quarter": q,
+                            "scraped_at": synced_at, "method": "dynamic"}
+                pending.append(doc_data)
+                seen_urls.add(full_url)
+        await _insert_sync_documents(bank['id'], pending, results)
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error syncing GBIME: {str(e)}")
+
+
+async def _sync_nimb(bank: Dict, bank_symbol: str, config: Dict) -> Dict:
+    """Sync NIMB documents from its category API"""
+    try:
+        seen_urls = set()
+        synced_at = datetime.now().isoformat()
+        results = {"bank_symbol": bank_symbol, "synced_at": synced_at, "new_documents": 0,
+                   "existing_documents": 0, "conflicting_documents": 0, "errors": []}
+        # One document per (fiscal year, report type, quarter): the first English copy, else the first seen
+        selected_by_key = {}
+
+        logger.debug("Fetching from NIMB API: %s", config['api_base'])
+        response = await http_client.get(config['api_base'], timeout=20)
+        if response.status_code != 200:
+            raise HTTPException(status_code=503, detail=f"NIMB API returned status {response.status_code}")
+
+        api_response = orjson.loads(response.content)
+        categories = api_response.get('data', {}).get('documentCategory', [])
+
+        # Map report types to keyword lists
+        report_types = [
+            ('annual', config['annual_keywords']),
+            ('quarterly', config['quarterly_keywords'])
+        ]
+
+        for report_type, keywords in report_types:
+            for category in categories:
+                # Check if category matches NIMB specific keywords
+                if not any(kw in category.get('name', '') for kw in keywords): continue
+
+                # Flatten documents from subCategories and direct documents
+                all_cat_docs = []
+                for sub in category.get('subCategories', []) or []:
+                    all_cat_docs.extend(sub.get('documents', []) or [])
+                all_cat_docs.extend(category.get('documents', []) or [])
+
+                for doc in all_cat_docs:
+                    fiscal_year = doc.get('fiscal_year', '')
+                    if not fiscal_year: continue
+
+                    # Normalize fiscal year
+                    fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
+
+                    # Determine Quarter
+                    quarter = None
                     if report_type == 'quarterly':
-                        q = extract_gbime_quarter(doc.get('quater'), doc.get('name', ''))
-                        if not q: continue
-                    key = (fy, q)
-                    if key not in docs_map: docs_map[key] = []
-                    docs_map[key].append(doc)
-
-                # Process groups
-                for (fy, q), dlist in docs_map.items():
-                    sel = dlist[0]
-                    if len(dlist) > 1:
-                        eng = next((d for d in dlist if "english" in d.get('name', '').lower()), None)
-                        if eng: sel = eng
-
-                    path = sel.get('file', '')
-                    full_url = f"{config['file_base']}{path.lstrip('/')}"
-
-                    if full_url in existing_urls:
+                        quarter = resolve_quarter_from_quater_obj(doc.get('quater'))
+                        # Fallback text check if quarter object missing but unlikely based on JSON
+                        if not quarter:
+                            quarter = extract_q_token_quarter(doc.get('name', ''))
+                        if not quarter: continue
+
+                    # Build URL
+                    file_path = doc.get('file', '')
+                    if not file_path: continue
+                    file_path = file_path.replace(' ', '%20')  # Fix spaces
+                    full_url = f"{config['file_base']}{file_path}"
+
+                    if full_url in seen_urls:
                         results["existing_documents"] += 1
                         continue
+                    doc_key = (fiscal_year_normalized, report_type, quarter)
+                    incumbent = selected_by_key.get(doc_key)
+                    if incumbent is not None and (not is_english_catalog_document(doc)
+                                                  or is_english_catalog_document(incumbent[0])):
+                        continue
 
-                    try:
-                        doc_data = {"bank_id": bank['id'], "bank_symbol": bank_symbol, "pdf_url": full_url,
-                                    "fiscal_year": fy, "report_type": report_type, "quarter": q,
-                                    "scraped_at": datetime.now().isoformat(), "method": "dynamic"}
-                        supabase.table("financial_documents").insert(doc_data).execute()
-                        results["new_documents"] += 1
-                        existing_urls.add(full_url)
-                    except Exception as e:
-                        results["errors"].append(str(e))
-            return results
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error syncing GBIME: {str(e)}")
+                    doc_data = {
+                        "bank_id": bank['id'],
+                        "bank_symbol": bank_symbol,
+                        "pdf_url": full_url,
+                        "fiscal_year": fiscal_year_normalized,
+                        "report_type": report_type,
+                        "quarter": quarter,
+                        "scraped_at": synced_at,
+                        "method": "dynamic"
+                    }
+                    selected_by_key[doc_key] = (doc, doc_data)
+                    seen_urls.add(full_url)
 
-    # --- NIMB SYNC (New Logic) ---
-    elif bank_symbol == "NIMB":
-        config = DYNAMIC_API_BANKS["NIMB"]
-        try:
-            existing_docs = supabase.table("financial_documents").select("pdf_url").eq("bank_id", bank['id']).execute()
-            existing_urls = set(doc['pdf_url'] for doc in existing_docs.data) if existing_docs.data else set()
-            results = {"bank_symbol": bank_symbol, "synced_at": datetime.now().isoformat(), "new_documents": 0,
-                       "existing_documents": 0, "errors": []}
+        await _insert_sync_documents(bank['id'], [doc_data for _, doc_data in selected_by_key.values()], results)
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error syncing NIMB: {str(e)}")
 
-            print(f"Fetching from NIMB API: {config['api_base']}")
-            response = requests.get(config['api_base'], timeout=20)
-            if response.status_code != 200:
-                raise HTTPException(status_code=503, detail=f"NIMB API returned status {response.status_code}")
-
-            api_response = response.json()
-            categories = api_response.get('data', {}).get('documentCategory', [])
-
-            # Map report types to keyword lists
-            report_types = [
-                ('annual', config['annual_keywords']),
-                ('quarterly', config['quarterly_keywords'])
-            ]
-
-            for report_type, keywords in report_types:
-                for category in categories:
-                    # Check if category matches NIMB specific keywords
-                    if not any(kw in category.get('name', '') for kw in keywords): continue
-
-                    # Flatten documents from subCategories and direct documents
-                    all_cat_docs = []
-                    for sub in category.get('subCategories', []) or []:
-                        all_cat_docs.extend(sub.get('documents', []) or [])
-                    all_cat_docs.extend(category.get('documents', []) or [])
-
-                    for doc in all_cat_docs:
-                        fiscal_year = doc.get('fiscal_year', '')
-                        if not fiscal_year: continue
 
-                        # Normalize fiscal year
-                        fiscal_year_normalized = normalize_fiscal_year_format(fiscal_year)
+# Catalog sync per bank with a dynamic API
+DYNAMIC_API_SYNCERS = {
+    "NABIL": _sync_nabil,
+    "PCBL": _sync_prime,
+    "SANIMA": _sync_sanima,
+    "GBIME": _sync_gbime,
+    "NIMB": _sync_nimb,
+}
 
-                        # Determine Quarter
-                        quarter = None
-                        if report_type == 'quarterly':
-                            quater_obj = doc.get('quater')
-                            if quater_obj:
-                                sys_name = quater_obj.get('systemName', '').lower()
-                                q_map = {'first_quater': 'Q1', 'second_quater': 'Q2', 'third_quater': 'Q3',
-                                         'fourth_quater': 'Q4'}
-                                quarter = q_map.get(sys_name)
-                            # Fallback text check if quarter object missing but unlikely based on JSON
-                            if not quarter:
-                                if 'q1' in doc.get('name', '').lower():
-                                    quarter = 'Q1'
-                                elif 'q2' in doc.get('name', '').lower():
-                                    quarter = 'Q2'
-                                elif 'q3' in doc.get('name', '').lower():
-                                    quarter = 'Q3'
-                                elif 'q4' in doc.get('name', '').lower():
-                                    quarter = 'Q4'
-
-                        # Build URL
-                        file_path = doc.get('file', '')
-                        if not file_path: continue
-                        file_path = file_path.replace(' ', '%20')  # Fix spaces
-                        full_url = f"{config['file_base']}{file_path}"
 
-                        if full_url in existing_urls:
-                            results["existing_documents"] += 1
-                            continue
+# Background sync jobs by job_id, kept for an hour on the worker that ran them; the sync_jobs table
+# holds the same rows so /sync-status answers on every worker
+SYNC_JOBS = TTLCache(maxsize=256, ttl=3600)
+SYNC_JOBS_LOCK = threading.Lock()
 
-                        try:
-                            doc_data = {
-                                "bank_id": bank['id'],
-                                "bank_symbol": bank_symbol,
-                                "pdf_url": full_url,
-                                "fiscal_year": fiscal_year_normalized,
-                                "report_type": report_type,
-                                "quarter": quarter,
-                                "scraped_at": datetime.now().isoformat(),
-                                "method": "dynamic"
-                            }
-                            supabase.table("financial_documents").insert(doc_data).execute()
-                            results["new_documents"] += 1
-                            existing_urls.add(full_url)
-                        except Exception as e:
-                            # Unique violation usually handled by check above, but for safety
-                            if "unique constraint" not in str(e).lower():
-                                results["errors"].append(str(e))
-
-            return results
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error syncing NIMB: {str(e)}")
 
-    raise HTTPException(status_code=501, detail=f"Sync not implemented for {bank_symbol}")
+def save_sync_job(job: Dict) -> bool:
+    """Upsert a background sync job into the sync_jobs table, returns False when it could not be written"""
+    try:
+        supabase.table("sync_jobs").upsert(job, on_conflict="job_id").execute()
+        return True
+    except Exception as e:
+        logger.warning("Could not store sync job %s: %s", job["job_id"], e)
+        return False
+
+
+def load_sync_job(job_id: str) -> Optional[Dict]:
+    """Read a background sync job from the sync_jobs table"""
+    try:
+        result = supabase.table("sync_jobs").select("*").eq("job_id", job_id).limit(1).execute()
+    except Exception as e:
+        logger.warning("Could not read sync job %s: %s", job_id, e)
+        return None
+    return result.data[0] if result.data else None
+
+
+def _finish_sync_job(job_id: str, job_update: Dict):
+    """Record a background sync outcome in memory and in the sync_jobs table"""
+    job_update["finished_at"] = datetime.now().isoformat()
+    with SYNC_JOBS_LOCK:
+        job = SYNC_JOBS[job_id] = {**SYNC_JOBS.get(job_id, {}), **job_update}
+    save_sync_job(job)
+
+
+async def _run_sync_job(job_id: str, syncer, bank: Dict, bank_symbol: str):
+    """Run a dynamic-bank sync in the background and record its outcome under job_id"""
+    try:
+        job_update = {"status": "completed", "result": await syncer(bank, bank_symbol, DYNAMIC_API_BANKS[bank_symbol])}
+    except asyncio.CancelledError:
+        # Worker shutdown; write the outcome inline since awaiting again could be cancelled too
+        _finish_sync_job(job_id, {"status": "cancelled", "error": "Sync was cancelled before it finished"})
+        raise
+    except HTTPException as e:
+        job_update = {"status": "failed", "error": e.detail}
+    except Exception as e:
+        job_update = {"status": "failed", "error": str(e)}
+    await run_in_threadpool(_finish_sync_job, job_id, job_update)
+
+
+@app.post("/sync-dynamic-bank/{bank_symbol}")
+async def sync_dynamic_bank_documents(bank_symbol: str, background_tasks: BackgroundTasks, background: bool = False):
+    """
+    Sync a dynamic-API bank's document catalog into the database
+    With background=true the sync runs after the response is sent; poll /sync-status/{job_id} for the result
+    """
+    bank_symbol = bank_symbol.upper()
+    if not has_dynamic_api(bank_symbol):
+        raise HTTPException(status_code=400, detail=f"Bank '{bank_symbol}' does not have dynamic API support")
+    bank = await run_in_threadpool(get_bank_info, bank_symbol)
+    if not bank: raise HTTPException(status_code=404, detail=f"Bank '{bank_symbol}' not found")
+
+    syncer = DYNAMIC_API_SYNCERS.get(bank_symbol)
+    if not syncer: raise HTTPException(status_code=501, detail=f"Sync not implemented for {bank_symbol}")
+    if not background:
+        return await syncer(bank, bank_symbol, DYNAMIC_API_BANKS[bank_symbol])
+
+    job_id = uuid.uuid4().hex
+    job = {"job_id": job_id, "bank_symbol": bank_symbol, "status": "running", "started_at": datetime.now().isoformat()}
+    # Another worker could only find the job through the table, so without it polling would 404 at random
+    if not await run_in_threadpool(save_sync_job, job) and WORKER_COUNT > 1:
+        raise HTTPException(status_code=503, detail="Background sync needs the sync_jobs table when running several "
+                                                    "workers; retry without background=true")
+    with SYNC_JOBS_LOCK:
+        SYNC_JOBS[job_id] = job
+    background_tasks.add_task(_run_sync_job, job_id, syncer, bank, bank_symbol)
+    return ORJSONResponse(status_code=202, content=job)
+
+
+@app.get("/sync-status/{job_id}")
+async def get_sync_status(job_id: str):
+    """Status of a background sync, from this worker's memory or the sync_jobs table"""
+    with SYNC_JOBS_LOCK:
+        job = SYNC_JOBS.get(job_id)
+    if job is None:
+        job = await run_in_threadpool(load_sync_job, job_id)
+    if job is None: raise HTTPException(status_code=404, detail=f"Sync job '{job_id}' not found")
+    return job
 
 
 # ============================================================================
@@ -3195,7 +4019,7 @@ def sync_dynamic_bank_documents(bank_symbol: str):
 # ============================================================================
 
 @app.get("/dev-bank/annual-report")
-def get_dev_bank_annual_report(bank_symbol: str, fiscal_year: str):
+async def get_dev_bank_annual_report(bank_symbol: str, fiscal_year: str):
     """
     Get annual report for a development bank
     Similar to commercial bank endpoint but uses development_banks and development_banks_documents tables
@@ -3203,25 +4027,24 @@ def get_dev_bank_annual_report(bank_symbol: str, fiscal_year: str):
     bank_symbol = bank_symbol.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"\n{'='*80}")
-    print(f"📊 DEVELOPMENT BANK ANNUAL REPORT REQUEST: {bank_symbol} - {nepali_fy}")
-    print(f"{'='*80}")
-    print(f"📅 Fiscal Year: {nepali_fy} (Nepali) / {english_fy} (English)")
+    logger.debug("\n%s", LOG_BANNER)
+    logger.info("📊 DEVELOPMENT BANK ANNUAL REPORT REQUEST: %s - %s", bank_symbol, nepali_fy)
+    logger.debug(LOG_BANNER)
+    logger.info("📅 Fiscal Year: %s (Nepali) / %s (English)", nepali_fy, english_fy)
 
     # Get bank info from development_banks table
-    bank = get_development_bank_info(bank_symbol)
+    bank = await run_in_threadpool(get_development_bank_info, bank_symbol)
     if not bank:
         raise HTTPException(status_code=404, detail=f"Development Bank '{bank_symbol}' not found")
 
-    print(f"🏦 Bank: {bank.get('bank_name', bank_symbol)} ({bank_symbol})")
+    logger.info("🏦 Bank: %s (%s)", bank.get('bank_name', bank_symbol), bank_symbol)
 
     # Check if document exists in database
-    print(f"🔍 Checking database...")
-    existing = check_dev_bank_document_exists(bank['id'], nepali_fy, 'annual') or \
-               check_dev_bank_document_exists(bank['id'], english_fy, 'annual')
+    logger.info("🔍 Checking database...")
+    existing = await run_in_threadpool(check_dev_bank_document_exists, bank['id'], nepali_fy, 'annual')
 
     if existing:
-        print(f"✅ Found in database!")
+        logger.info("✅ Found in database!")
         return {
             "status": "found",
             "source": "database",
@@ -3230,16 +4053,16 @@ def get_dev_bank_annual_report(bank_symbol: str, fiscal_year: str):
             "pdf_url": existing['pdf_url']
         }
 
-    print(f"❌ Not in database.")
+    logger.info("❌ Not in database.")
 
     # Check if development bank has dynamic API support
     if has_dev_bank_dynamic_api(bank_symbol):
-        print(f"🔌 Development Bank has dynamic API support - fetching from API...")
-        api_doc = fetch_from_dev_bank_api(bank_symbol, nepali_fy, 'annual')
+        logger.info("🔌 Development Bank has dynamic API support - fetching from API...")
+        api_doc = await fetch_from_dev_bank_api(bank_symbol, nepali_fy, 'annual')
         if api_doc:
-            print(f"✅ Found via dynamic API")
+            logger.info("✅ Found via dynamic API")
             # Insert to development banks table
-            inserted = insert_dev_bank_document_to_db(bank['id'], bank_symbol, api_doc)
+            inserted = await run_in_threadpool(insert_dev_bank_document_to_db, bank['id'], bank_symbol, api_doc)
             return {
                 "status": "found",
                 "source": "dynamic_api",
@@ -3247,22 +4070,22 @@ def get_dev_bank_annual_report(bank_symbol: str, fiscal_year: str):
                 "fiscal_year": inserted['fiscal_year'],
                 "pdf_url": inserted['pdf_url']
             }
-        print(f"❌ Not found via dynamic API")
+        logger.info("❌ Not found via dynamic API")
 
     # Try scraping
-    print(f"🔍 Starting Firecrawl scraping...")
-    report = scrape_specific_report(bank, nepali_fy, 'annual')
+    logger.info("🔍 Starting Firecrawl scraping...")
+    report = await scrape_specific_report(bank, nepali_fy, 'annual')
 
     if not report:
-        print(f"❌ Report not found after scraping")
+        logger.info("❌ Report not found after scraping")
         raise HTTPException(
             status_code=404,
             detail=f"Report not found for {bank_symbol} {nepali_fy} annual. Use /add-document endpoint to add the document first."
         )
 
     # Insert to database
-    print(f"💾 Saving to database...")
-    inserted_doc = insert_dev_bank_document_to_db(bank['id'], bank_symbol, report)
+    logger.info("💾 Saving to database...")
+    inserted_doc = await run_in_threadpool(insert_dev_bank_document_to_db, bank['id'], bank_symbol, report)
 
     return {
         "status": "found",
@@ -3274,7 +4097,7 @@ def get_dev_bank_annual_report(bank_symbol: str, fiscal_year: str):
 
 
 @app.get("/dev-bank/quarterly-report")
-def get_dev_bank_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: str):
+async def get_dev_bank_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: str):
     """
     Get quarterly report for a development bank
     Similar to commercial bank endpoint but uses development_banks and development_banks_documents tables
@@ -3287,26 +4110,25 @@ def get_dev_bank_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: s
 
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"\n{'='*80}")
-    print(f"📊 DEVELOPMENT BANK QUARTERLY REPORT REQUEST: {bank_symbol} - {nepali_fy} {quarter}")
-    print(f"{'='*80}")
-    print(f"📅 Fiscal Year: {nepali_fy} (Nepali) / {english_fy} (English)")
-    print(f"📅 Quarter: {quarter}")
+    logger.debug("\n%s", LOG_BANNER)
+    logger.info("📊 DEVELOPMENT BANK QUARTERLY REPORT REQUEST: %s - %s %s", bank_symbol, nepali_fy, quarter)
+    logger.debug(LOG_BANNER)
+    logger.info("📅 Fiscal Year: %s (Nepali) / %s (English)", nepali_fy, english_fy)
+    logger.info("📅 Quarter: %s", quarter)
 
     # Get bank info from development_banks table
-    bank = get_development_bank_info(bank_symbol)
+    bank = await run_in_threadpool(get_development_bank_info, bank_symbol)
     if not bank:
         raise HTTPException(status_code=404, detail=f"Development Bank '{bank_symbol}' not found")
 
-    print(f"🏦 Bank: {bank.get('bank_name', bank_symbol)} ({bank_symbol})")
+    logger.info("🏦 Bank: %s (%s)", bank.get('bank_name', bank_symbol), bank_symbol)
 
     # Check if document exists in database
-    print(f"🔍 Checking database...")
-    existing = check_dev_bank_document_exists(bank['id'], nepali_fy, 'quarterly', quarter) or \
-               check_dev_bank_document_exists(bank['id'], english_fy, 'quarterly', quarter)
+    logger.info("🔍 Checking database...")
+    existing = await run_in_threadpool(check_dev_bank_document_exists, bank['id'], nepali_fy, 'quarterly', quarter)
 
     if existing:
-        print(f"✅ Found in database!")
+        logger.info("✅ Found in database!")
         return {
             "status": "found",
             "source": "database",
@@ -3316,16 +4138,16 @@ def get_dev_bank_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: s
             "pdf_url": existing['pdf_url']
         }
 
-    print(f"❌ Not in database.")
+    logger.info("❌ Not in database.")
 
     # Check if development bank has dynamic API support
     if has_dev_bank_dynamic_api(bank_symbol):
-        print(f"🔌 Development Bank has dynamic API support - fetching from API...")
-        api_doc = fetch_from_dev_bank_api(bank_symbol, nepali_fy, 'quarterly', quarter)
+        logger.info("🔌 Development Bank has dynamic API support - fetching from API...")
+        api_doc = await fetch_from_dev_bank_api(bank_symbol, nepali_fy, 'quarterly', quarter)
         if api_doc:
-            print(f"✅ Found via dynamic API")
+            logger.info("✅ Found via dynamic API")
             # Insert to development banks table
-            inserted = insert_dev_bank_document_to_db(bank['id'], bank_symbol, api_doc)
+            inserted = await run_in_threadpool(insert_dev_bank_document_to_db, bank['id'], bank_symbol, api_doc)
             return {
                 "status": "found",
                 "source": "dynamic_api",
@@ -3334,22 +4156,22 @@ def get_dev_bank_quarterly_report(bank_symbol: str, fiscal_year: str, quarter: s
                 "quarter": quarter,
                 "pdf_url": inserted['pdf_url']
             }
-        print(f"❌ Not found via dynamic API")
+        logger.info("❌ Not found via dynamic API")
 
     # Try scraping
-    print(f"🔍 Starting Firecrawl scraping...")
-    report = scrape_specific_report(bank, nepali_fy, 'quarterly', quarter)
+    logger.info("🔍 Starting Firecrawl scraping...")
+    report = await scrape_specific_report(bank, nepali_fy, 'quarterly', quarter)
 
     if not report:
-        print(f"❌ Report not found after scraping")
+        logger.info("❌ Report not found after scraping")
         raise HTTPException(
             status_code=404,
             detail=f"Report not found for {bank_symbol} {nepali_fy} {quarter}. Use /add-document endpoint to add the document first."
         )
 
     # Insert to database
-    print(f"💾 Saving to database...")
-    inserted_doc = insert_dev_bank_document_to_db(bank['id'], bank_symbol, report)
+    logger.info("💾 Saving to database...")
+    inserted_doc = await run_in_threadpool(insert_dev_bank_document_to_db, bank['id'], bank_symbol, report)
 
     return {
         "status": "found",
@@ -3370,29 +4192,28 @@ def get_finance_company_annual_report(company_symbol: str, fiscal_year: str):
     company_symbol = company_symbol.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"📊 FINANCE COMPANY ANNUAL: {company_symbol} {nepali_fy}")
+    logger.info("📊 FINANCE COMPANY ANNUAL: %s %s", company_symbol, nepali_fy)
 
     company = get_finance_company_info(company_symbol)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
     # 1. Database Check
-    existing = check_finance_company_document_exists(company['id'], nepali_fy, 'annual') or \
-               check_finance_company_document_exists(company['id'], english_fy, 'annual')
+    existing = check_finance_company_document_exists(company['id'], nepali_fy, 'annual')
 
     if existing:
         return {"status": "found", "source": "database", "pdf_url": existing['pdf_url']}
 
     # 2. Dynamic API Check
     if has_finance_company_dynamic_api(company_symbol):
-        print("  🔌 Using Dynamic API")
+        logger.info("  🔌 Using Dynamic API")
         api_doc = fetch_from_finance_company_api(company_symbol, nepali_fy, 'annual')
         if api_doc:
             inserted = insert_finance_company_document_to_db(company['id'], company_symbol, api_doc)
             return {"status": "found", "source": "dynamic_api", "pdf_url": inserted['pdf_url']}
 
     # 3. Firecrawl Scraping (Paginated & Static)
-    print("  🔍 Starting Scraping...")
+    logger.info("  🔍 Starting Scraping...")
 
     # Configure URLs based on type
     urls = []
@@ -3426,51 +4247,53 @@ def get_finance_company_annual_report(company_symbol: str, fiscal_year: str):
     {ordinal_instruction}
     Return JSON: {{ "found": true, "report": {{ "fiscal_year": "{nepali_fy}", "report_type": "annual", "file_url": "url" }} }}"""
 
-    for url in urls:
-        print(f"  Scanning: {url}")
+    for url, data in scrape_pages_json(urls, prompt):
+        logger.debug("  Scanning: %s", url)
         try:
-            result = firecrawl.scrape(url, formats=["markdown", {"type": "json", "prompt": prompt}])
-            if result.json and result.json.get('found'):
-                report = result.json.get('report')
+            if data and data.get('found'):
+                report = data.get('report')
                 if report and report.get('file_url'):
                     report['source'] = 'firecrawl'
                     inserted = insert_finance_company_document_to_db(company['id'], company_symbol, report)
                     return {"status": "found", "source": "scraped", "pdf_url": inserted['pdf_url']}
         except Exception as e:
-            print(f"  Error scraping {url}: {e}")
+            logger.warning("  Error scraping %s: %s", url, e)
 
     raise HTTPException(status_code=404, detail="Report not found")
 
 
+# Nepali month each Goodwill Finance (GFCL) quarterly report is titled by
+GFCL_QUARTER_MONTHS = {'Q1': 'Ashoj/Ashwin', 'Q2': 'Poush', 'Q3': 'Chaitra', 'Q4': 'Ashadh'}
+
+
 @app.get("/finance-company/quarterly-report")
 def get_finance_company_quarterly_report(company_symbol: str, fiscal_year: str, quarter: str):
     company_symbol = company_symbol.upper()
     quarter = quarter.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"📊 FINANCE COMPANY QUARTERLY: {company_symbol} {nepali_fy} {quarter}")
+    logger.info("📊 FINANCE COMPANY QUARTERLY: %s %s %s", company_symbol, nepali_fy, quarter)
 
     company = get_finance_company_info(company_symbol)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
     # 1. Database Check
-    existing = check_finance_company_document_exists(company['id'], nepali_fy, 'quarterly', quarter) or \
-               check_finance_company_document_exists(company['id'], english_fy, 'quarterly', quarter)
+    existing = check_finance_company_document_exists(company['id'], nepali_fy, 'quarterly', quarter)
 
     if existing:
         return {"status": "found", "source": "database", "pdf_url": existing['pdf_url']}
 
     # 2. Dynamic API Check
     if has_finance_company_dynamic_api(company_symbol):
-        print("  🔌 Using Dynamic API")
+        logger.info("  🔌 Using Dynamic API")
         api_doc = fetch_from_finance_company_api(company_symbol, nepali_fy, 'quarterly', quarter)
         if api_doc:
             inserted = insert_finance_company_document_to_db(company['id'], company_symbol, api_doc)
             return {"status": "found", "source": "dynamic_api", "pdf_url": inserted['pdf_url']}
 
     # 3. Firecrawl Scraping
-    print("  🔍 Starting Scraping...")
+    logger.info("  🔍 Starting Scraping...")
 
     urls = []
     if has_finance_company_pagination(company_symbol):
@@ -3487,26 +4310,24 @@ def get_finance_company_quarterly_report(company_symbol: str, fiscal_year: str,
     # Special Handling for Nepali Months (Goodwill)
     month_hint = ""
     if company_symbol == "GFCL":
-        month_map = {'Q1': 'Ashoj/Ashwin', 'Q2': 'Poush', 'Q3': 'Chaitra', 'Q4': 'Ashadh'}
-        month_hint = f"Look for month: {month_map.get(quarter, '')}"
+        month_hint = f"Look for month: {GFCL_QUARTER_MONTHS.get(quarter, '')}"
 
     prompt = f"""Find the {quarter} REPORT for {nepali_fy}.
     {month_hint}
     Keywords: {quarter}, Quarterly, Interim, Unaudited.
     Return JSON: {{ "found": true, "report": {{ "fiscal_year": "{nepali_fy}", "report_type": "quarterly", "quarter": "{quarter}", "file_url": "url" }} }}"""
 
-    for url in urls:
-        print(f"  Scanning: {url}")
+    for url, data in scrape_pages_json(urls, prompt):
+        logger.debug("  Scanning: %s", url)
         try:
-            result = firecrawl.scrape(url, formats=["markdown", {"type": "json", "prompt": prompt}])
-            if result.json and result.json.get('found'):
-                report = result.json.get('report')
+            if data and data.get('found'):
+                report = data.get('report')
                 if report and report.get('file_url'):
                     report['source'] = 'firecrawl'
                     inserted = insert_finance_company_document_to_db(company['id'], company_symbol, report)
                     return {"status": "found", "source": "scraped", "pdf_url": inserted['pdf_url']}
         except Exception as e:
-            print(f"  Error scraping {url}: {e}")
+            logger.warning("  Error scraping %s: %s", url, e)
 
     raise HTTPException(status_code=404, detail="Report not found")
 
@@ -3530,59 +4351,58 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
     microfinance_symbol = microfinance_symbol.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"\n📊 MICROFINANCE ANNUAL REPORT REQUEST: {microfinance_symbol} - {nepali_fy}")
-    print("="*80)
-    print(f"📅 Fiscal Year: {nepali_fy} (Nepali) / {english_fy} (English)")
+    logger.debug("\n%s", LOG_BANNER)
+    logger.info("📊 MICROFINANCE ANNUAL REPORT REQUEST: %s - %s", microfinance_symbol, nepali_fy)
+    logger.debug(LOG_BANNER)
+    logger.info("📅 Fiscal Year: %s (Nepali) / %s (English)", nepali_fy, english_fy)
 
     # Get microfinance company info
     company = get_microfinance_company_info(microfinance_symbol)
     if not company:
         raise HTTPException(status_code=404, detail=f"Microfinance company {microfinance_symbol} not found in database")
 
-    print(f"🏦 Company: {company.get('microfinance_name')} (ID: {company['id']})")
+    logger.info("🏦 Company: %s (ID: %s)", company.get('microfinance_name'), company['id'])
 
     # 1. Check database first
-    print("🔍 Checking database...")
-    existing = check_microfinance_company_document_exists(company['id'], nepali_fy, 'annual') or \
-               check_microfinance_company_document_exists(company['id'], english_fy, 'annual')
+    logger.info("🔍 Checking database...")
+    existing = check_microfinance_company_document_exists(company['id'], nepali_fy, 'annual')
 
     if existing:
-        print("✅ FOUND IN DATABASE!")
+        logger.info("✅ FOUND IN DATABASE!")
         return {
             "status": "found_in_database",
             "source": "database",
             "document": existing
         }
 
-    print("❌ Not in database.")
+    logger.info("❌ Not in database.")
 
     # 2. Check for Dynamic API support
     if has_microfinance_dynamic_api(microfinance_symbol):
-        print(f"🔌 Microfinance company has dynamic API support - fetching from API...")
+        logger.info("🔌 Microfinance company has dynamic API support - fetching from API...")
 
         try:
             api_doc = None
 
             if microfinance_symbol == "VLBS":
-                print("  Using Vijaya JWT API")
+                logger.debug("  Using Vijaya JWT API")
                 api_doc = fetch_from_vijaya_jwt_api(fiscal_year, 'annual')
 
             elif microfinance_symbol == "NICLBSL":
-                print("  Using NicAsia Laghubitta API")
+                logger.debug("  Using NicAsia Laghubitta API")
                 api_doc = fetch_from_nicbl_api(fiscal_year, 'annual')
 
             elif microfinance_symbol == "GILB":
-                print("  Using Global IME Ninja Tables")
+                logger.debug("  Using Global IME Ninja Tables")
                 api_doc = fetch_from_gilb_ninja_tables(fiscal_year, 'annual')
 
             elif microfinance_symbol == "PROFL":
-                print("  Using Progressive Finance API")
+                logger.debug("  Using Progressive Finance API")
                 # Use existing PROFL handler
                 config = MICROFINANCE_DYNAMIC_API["PROFL"]
                 headers = {"x-api-token": config["api_token"]}
-                response = requests.get(config["api_url"], headers=headers, timeout=15)
-                if response.status_code == 200:
-                    documents = response.json()
+                documents = get_api_json(config["api_url"], headers=headers)
+                if documents is not None:
                     for doc in documents:
                         if doc.get('file_type') == 'Annual Report':
                             doc_fy = doc.get('fiscal_year', '')
@@ -3597,7 +4417,7 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
                                 break
 
             if api_doc:
-                print("  ✅ Found via dynamic API")
+                logger.info("  ✅ Found via dynamic API")
                 inserted = insert_microfinance_company_document_to_db(company['id'], microfinance_symbol, api_doc)
                 return {
                     "status": "found_via_api",
@@ -3605,18 +4425,18 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
                     "document": inserted
                 }
             else:
-                print("  ❌ Not found via dynamic API")
+                logger.info("  ❌ Not found via dynamic API")
 
         except Exception as e:
-            print(f"  ❌ API error: {e}")
+            logger.error("  ❌ API error: %s", e)
 
     # 3. Check for CSRF Form support
     if has_microfinance_csrf_form(microfinance_symbol):
-        print(f"📝 Microfinance company uses CSRF form - fetching...")
+        logger.info("📝 Microfinance company uses CSRF form - fetching...")
         try:
             csrf_doc = fetch_from_ddbl_csrf_form(fiscal_year, 'annual')
             if csrf_doc:
-                print("  ✅ Found via CSRF form")
+                logger.info("  ✅ Found via CSRF form")
                 inserted = insert_microfinance_company_document_to_db(company['id'], microfinance_symbol, csrf_doc)
                 return {
                     "status": "found_via_csrf",
@@ -3624,37 +4444,31 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
                     "document": inserted
                 }
             else:
-                print("  ❌ Not found via CSRF form")
+                logger.info("  ❌ Not found via CSRF form")
         except Exception as e:
-            print(f"  ❌ CSRF form error: {e}")
+            logger.error("  ❌ CSRF form error: %s", e)
 
     # 4. Check for Pagination
     if has_microfinance_pagination(microfinance_symbol):
-        print(f"📄 Microfinance company uses pagination - Checking multiple pages...")
+        logger.info("📄 Microfinance company uses pagination - Checking multiple pages...")
         config = MICROFINANCE_PAGINATED[microfinance_symbol]
         max_pages = config.get("max_pages", 5)
         base_url = config.get("annual_url")
 
         # Only proceed if we have an Annual URL configured
         if base_url:
-            for page in range(1, max_pages + 1):
-                target_url = base_url.format(page=page)
-                print(f"   🔍 Scanning Page {page}: {target_url}")
+            page_urls = [base_url.format(page=page) for page in range(1, max_pages + 1)]
+            prompt = f"Extract the EXACT direct PDF link for the annual report of fiscal year {nepali_fy} or {english_fy}. Return JSON: {{'fiscal_year': '{nepali_fy}', 'report_type': 'annual', 'pdf_url': '<link>'}}"
+            for page, (target_url, data) in enumerate(scrape_pages_json(page_urls, prompt, FIRECRAWL_PAGE_WINDOW),
+                                                      start=1):
+                logger.debug("   🔍 Scanning Page %s: %s", page, target_url)
 
                 try:
-                    result = firecrawl.scrape(target_url, formats=[
-                        "markdown",
-                        {
-                            "type": "json",
-                            "prompt": f"Extract the EXACT direct PDF link for the annual report of fiscal year {nepali_fy} or {english_fy}. Return JSON: {{'fiscal_year': '{nepali_fy}', 'report_type': 'annual', 'pdf_url': '<link>'}}"
-                        }
-                    ])
-
-                    if result.json and isinstance(result.json, dict):
-                        pdf_url = result.json.get('pdf_url')
+                    if data and isinstance(data, dict):
+                        pdf_url = data.get('pdf_url')
                         if pdf_url and pdf_url.endswith('.pdf'):
                             # Success! Found it on this page
-                            print(f"   ✅ Found on Page {page}")
+                            logger.info("   ✅ Found on Page %s", page)
                             report = {
                                 'pdf_url': pdf_url,
                                 'fiscal_year': nepali_fy,
@@ -3669,14 +4483,14 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
                                 "document": inserted
                             }
                 except Exception as e:
-                    print(f"   ⚠️ Error on page {page}: {e}")
+                    logger.warning("   ⚠️ Error on page %s: %s", page, e)
                     # Continue to next page even if error
                     continue
         else:
-            print("   ⚠️ No annual_url configured for pagination, skipping.")
+            logger.warning("   ⚠️ No annual_url configured for pagination, skipping.")
 
     # 5. Fallback to Firecrawl scraping
-    print("🔍 Falling back to Firecrawl scraping...")
+    logger.info("🔍 Falling back to Firecrawl scraping...")
 
     urls = []
     if company.get('annual_report_url'):
@@ -3688,19 +4502,12 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
         raise HTTPException(status_code=404, detail=f"No annual report URLs configured for {microfinance_symbol}")
 
     # Try each URL
-    for url in urls:
+    prompt = f"Extract the EXACT direct PDF link for the annual report of fiscal year {nepali_fy} or {english_fy}. Return: {{\"fiscal_year\": \"{nepali_fy}\", \"report_type\": \"annual\", \"pdf_url\": \"<direct_pdf_link>\"}}"
+    for url, data in scrape_pages_json(urls, prompt):
         try:
-            print(f"🔍 Scraping: {url}")
-            result = firecrawl.scrape(url, formats=[
-                "markdown",
-                {
-                    "type": "json",
-                    "prompt": f"Extract the EXACT direct PDF link for the annual report of fiscal year {nepali_fy} or {english_fy}. Return: {{\"fiscal_year\": \"{nepali_fy}\", \"report_type\": \"annual\", \"pdf_url\": \"<direct_pdf_link>\"}}"
-                }
-            ])
-
-            if result.json and isinstance(result.json, dict):
-                pdf_url = result.json.get('pdf_url')
+            logger.info("🔍 Scraping: %s", url)
+            if data and isinstance(data, dict):
+                pdf_url = data.get('pdf_url')
                 if pdf_url and pdf_url.endswith('.pdf'):
                     report = {
                         'pdf_url': pdf_url,
@@ -3709,19 +4516,34 @@ def get_microfinance_annual_report(microfinance_symbol: str, fiscal_year: str):
                         'source': 'static'
                     }
                     inserted = insert_microfinance_company_document_to_db(company['id'], microfinance_symbol, report)
-                    print("✅ FOUND AND SAVED!")
+                    logger.info("✅ FOUND AND SAVED!")
                     return {
                         "status": "found_via_scraping",
                         "source": "firecrawl",
                         "document": inserted
                     }
         except Exception as e:
-            print(f"  ❌ Error scraping {url}: {e}")
+            logger.warning("  ❌ Error scraping %s: %s", url, e)
             continue
 
     raise HTTPException(status_code=404, detail=f"Annual report for {microfinance_symbol} {nepali_fy} not found")
 
 
+# Quarter hints for the Firecrawl prompts: paginated listings, then the static report pages
+MICROFINANCE_PAGE_QUARTER_KEYWORDS = {
+    'Q1': 'First,1st,Ashwin,Asoj',
+    'Q2': 'Second,2nd,Poush,Mid-Year',
+    'Q3': 'Third,3rd,Chaitra',
+    'Q4': 'Fourth,4th,Ashad,Ashadh,Annual'
+}
+MICROFINANCE_STATIC_QUARTER_KEYWORDS = {
+    'Q1': 'first|1st|ashwin',
+    'Q2': 'second|2nd|poush|mid-term',
+    'Q3': 'third|3rd|chaitra|nine month',
+    'Q4': 'fourth|4th|ashad'
+}
+
+
 @app.get("/microfinance/quarterly-report")
 def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str, quarter: str):
     """
@@ -3738,10 +4560,11 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
     quarter = quarter.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"\n📊 MICROFINANCE QUARTERLY REPORT REQUEST: {microfinance_symbol} - {nepali_fy} {quarter}")
-    print("="*80)
-    print(f"📅 Fiscal Year: {nepali_fy} (Nepali) / {english_fy} (English)")
-    print(f"📅 Quarter: {quarter}")
+    logger.debug("\n%s", LOG_BANNER)
+    logger.info("📊 MICROFINANCE QUARTERLY REPORT REQUEST: %s - %s %s", microfinance_symbol, nepali_fy, quarter)
+    logger.debug(LOG_BANNER)
+    logger.info("📅 Fiscal Year: %s (Nepali) / %s (English)", nepali_fy, english_fy)
+    logger.info("📅 Quarter: %s", quarter)
 
     # Validate quarter
     if quarter not in ['Q1', 'Q2', 'Q3', 'Q4']:
@@ -3752,49 +4575,47 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
     if not company:
         raise HTTPException(status_code=404, detail=f"Microfinance company {microfinance_symbol} not found in database")
 
-    print(f"🏦 Company: {company.get('microfinance_name')} (ID: {company['id']})")
+    logger.info("🏦 Company: %s (ID: %s)", company.get('microfinance_name'), company['id'])
 
     # 1. Check database first
-    print(f"🔍 Checking database for {quarter}...")
-    existing = check_microfinance_company_document_exists(company['id'], nepali_fy, 'quarterly', quarter) or \
-               check_microfinance_company_document_exists(company['id'], english_fy, 'quarterly', quarter)
+    logger.info("🔍 Checking database for %s...", quarter)
+    existing = check_microfinance_company_document_exists(company['id'], nepali_fy, 'quarterly', quarter)
 
     if existing:
-        print(f"✅ FOUND {quarter} IN DATABASE!")
+        logger.info("✅ FOUND %s IN DATABASE!", quarter)
         return {
             "status": "found_in_database",
             "source": "database",
             "document": existing
         }
 
-    print(f"❌ {quarter} not in database.")
+    logger.info("❌ %s not in database.", quarter)
 
     # 2. Check for Dynamic API support
     if has_microfinance_dynamic_api(microfinance_symbol):
-        print(f"🔌 Microfinance company has dynamic API support - fetching from API...")
+        logger.info("🔌 Microfinance company has dynamic API support - fetching from API...")
 
         try:
             api_doc = None
 
             if microfinance_symbol == "VLBS":
-                print("  Using Vijaya JWT API")
+                logger.debug("  Using Vijaya JWT API")
                 api_doc = fetch_from_vijaya_jwt_api(fiscal_year, 'quarterly', quarter)
 
             elif microfinance_symbol == "NICLBSL":
-                print("  Using NicAsia Laghubitta API")
+                logger.debug("  Using NicAsia Laghubitta API")
                 api_doc = fetch_from_nicbl_api(fiscal_year, 'quarterly', quarter)
 
             elif microfinance_symbol == "GILB":
-                print("  Using Global IME Ninja Tables")
+                logger.debug("  Using Global IME Ninja Tables")
                 api_doc = fetch_from_gilb_ninja_tables(fiscal_year, 'quarterly', quarter)
 
             elif microfinance_symbol == "PROFL":
-                print("  Using Progressive Finance API")
+                logger.debug("  Using Progressive Finance API")
                 config = MICROFINANCE_DYNAMIC_API["PROFL"]
                 headers = {"x-api-token": config["api_token"]}
-                response = requests.get(config["api_url"], headers=headers, timeout=15)
-                if response.status_code == 200:
-                    documents = response.json()
+                documents = get_api_json(config["api_url"], headers=headers)
+                if documents is not None:
                     for doc in documents:
                         if doc.get('file_type') == 'Quarterly Report':
                             doc_fy = doc.get('fiscal_year', '')
@@ -3802,15 +4623,7 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
 
                             # Check fiscal year and quarter
                             if (fiscal_year in doc_fy or nepali_fy in doc_fy):
-                                quarter_match = False
-                                if quarter == 'Q1' and any(k in doc_title for k in ['first', '1st', 'q1']):
-                                    quarter_match = True
-                                elif quarter == 'Q2' and any(k in doc_title for k in ['second', '2nd', 'q2']):
-                                    quarter_match = True
-                                elif quarter == 'Q3' and any(k in doc_title for k in ['third', '3rd', 'q3']):
-                                    quarter_match = True
-                                elif quarter == 'Q4' and any(k in doc_title for k in ['fourth', '4th', 'q4']):
-                                    quarter_match = True
+                                quarter_match = title_matches_quarter(doc_title, quarter)
 
                                 if quarter_match:
                                     file_path = doc.get('file_path', '') or doc.get('file_path_url', '')
@@ -3824,7 +4637,7 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
                                     break
 
             if api_doc:
-                print(f"  ✅ Found {quarter} via dynamic API")
+                logger.info("  ✅ Found %s via dynamic API", quarter)
                 inserted = insert_microfinance_company_document_to_db(company['id'], microfinance_symbol, api_doc)
                 return {
                     "status": "found_via_api",
@@ -3832,18 +4645,18 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
                     "document": inserted
                 }
             else:
-                print(f"  ❌ {quarter} not found via dynamic API")
+                logger.info("  ❌ %s not found via dynamic API", quarter)
 
         except Exception as e:
-            print(f"  ❌ API error: {e}")
+            logger.error("  ❌ API error: %s", e)
 
     # 3. Check for CSRF Form support
     if has_microfinance_csrf_form(microfinance_symbol):
-        print(f"📝 Microfinance company uses CSRF form - fetching...")
+        logger.info("📝 Microfinance company uses CSRF form - fetching...")
         try:
             csrf_doc = fetch_from_ddbl_csrf_form(fiscal_year, 'quarterly', quarter)
             if csrf_doc:
-                print(f"  ✅ Found {quarter} via CSRF form")
+                logger.info("  ✅ Found %s via CSRF form", quarter)
                 inserted = insert_microfinance_company_document_to_db(company['id'], microfinance_symbol, csrf_doc)
                 return {
                     "status": "found_via_csrf",
@@ -3851,44 +4664,32 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
                     "document": inserted
                 }
             else:
-                print(f"  ❌ {quarter} not found via CSRF form")
+                logger.info("  ❌ %s not found via CSRF form", quarter)
         except Exception as e:
-            print(f"  ❌ CSRF form error: {e}")
+            logger.error("  ❌ CSRF form error: %s", e)
 
     # 4. Check for Pagination
     if has_microfinance_pagination(microfinance_symbol):
-        print(f"📄 Microfinance company uses pagination - Checking multiple pages...")
+        logger.info("📄 Microfinance company uses pagination - Checking multiple pages...")
         config = MICROFINANCE_PAGINATED[microfinance_symbol]
         max_pages = config.get("max_pages", 5)
         base_url = config.get("quarterly_url")
 
         # Determine keywords for the quarter
-        q_keywords = {
-            'Q1': 'First,1st,Ashwin,Asoj',
-            'Q2': 'Second,2nd,Poush,Mid-Year',
-            'Q3': 'Third,3rd,Chaitra',
-            'Q4': 'Fourth,4th,Ashad,Ashadh,Annual'
-        }
-        keywords = q_keywords.get(quarter, quarter)
+        keywords = MICROFINANCE_PAGE_QUARTER_KEYWORDS.get(quarter, quarter)
 
         if base_url:
-            for page in range(1, max_pages + 1):
-                target_url = base_url.format(page=page)
-                print(f"   🔍 Scanning Page {page}: {target_url}")
+            page_urls = [base_url.format(page=page) for page in range(1, max_pages + 1)]
+            prompt = f"Find the {quarter} ({keywords}) quarterly/interim report for {nepali_fy}. Return JSON: {{'fiscal_year': '{nepali_fy}', 'quarter': '{quarter}', 'report_type': 'quarterly', 'pdf_url': '<link>'}}"
+            for page, (target_url, data) in enumerate(scrape_pages_json(page_urls, prompt, FIRECRAWL_PAGE_WINDOW),
+                                                      start=1):
+                logger.debug("   🔍 Scanning Page %s: %s", page, target_url)
 
                 try:
-                    result = firecrawl.scrape(target_url, formats=[
-                        "markdown",
-                        {
-                            "type": "json",
-                            "prompt": f"Find the {quarter} ({keywords}) quarterly/interim report for {nepali_fy}. Return JSON: {{'fiscal_year': '{nepali_fy}', 'quarter': '{quarter}', 'report_type': 'quarterly', 'pdf_url': '<link>'}}"
-                        }
-                    ])
-
-                    if result.json and isinstance(result.json, dict):
-                        pdf_url = result.json.get('pdf_url')
+                    if data and isinstance(data, dict):
+                        pdf_url = data.get('pdf_url')
                         if pdf_url:  # Allow images too if needed, but prefer PDF
-                            print(f"   ✅ Found on Page {page}")
+                            logger.info("   ✅ Found on Page %s", page)
                             report = {
                                 'pdf_url': pdf_url,
                                 'fiscal_year': nepali_fy,
@@ -3904,13 +4705,13 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
                                 "document": inserted
                             }
                 except Exception as e:
-                    print(f"   ⚠️ Error on page {page}: {e}")
+                    logger.warning("   ⚠️ Error on page %s: %s", page, e)
                     continue
         else:
-            print("   ⚠️ No quarterly_url configured for pagination, skipping.")
+            logger.warning("   ⚠️ No quarterly_url configured for pagination, skipping.")
 
     # 5. Fallback to Firecrawl scraping
-    print(f"🔍 Falling back to Firecrawl scraping for {quarter}...")
+    logger.info("🔍 Falling back to Firecrawl scraping for %s...", quarter)
 
     urls = []
     if company.get('quarter_report_url'):
@@ -3921,28 +4722,13 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
     if not urls:
         raise HTTPException(status_code=404, detail=f"No quarterly report URLs configured for {microfinance_symbol}")
 
-    # Map quarter to keywords
-    quarter_keywords = {
-        'Q1': 'first|1st|ashwin',
-        'Q2': 'second|2nd|poush|mid-term',
-        'Q3': 'third|3rd|chaitra|nine month',
-        'Q4': 'fourth|4th|ashad'
-    }
-
     # Try each URL
-    for url in urls:
+    prompt = f"Extract the EXACT direct PDF link for the {quarter} ({MICROFINANCE_STATIC_QUARTER_KEYWORDS[quarter]}) quarterly/interim report of fiscal year {nepali_fy} or {english_fy}. Return: {{\"fiscal_year\": \"{nepali_fy}\", \"report_type\": \"quarterly\", \"quarter\": \"{quarter}\", \"pdf_url\": \"<direct_pdf_link>\"}}"
+    for url, data in scrape_pages_json(urls, prompt):
         try:
-            print(f"🔍 Scraping: {url}")
-            result = firecrawl.scrape(url, formats=[
-                "markdown",
-                {
-                    "type": "json",
-                    "prompt": f"Extract the EXACT direct PDF link for the {quarter} ({quarter_keywords[quarter]}) quarterly/interim report of fiscal year {nepali_fy} or {english_fy}. Return: {{\"fiscal_year\": \"{nepali_fy}\", \"report_type\": \"quarterly\", \"quarter\": \"{quarter}\", \"pdf_url\": \"<direct_pdf_link>\"}}"
-                }
-            ])
-
-            if result.json and isinstance(result.json, dict):
-                pdf_url = result.json.get('pdf_url')
+            logger.info("🔍 Scraping: %s", url)
+            if data and isinstance(data, dict):
+                pdf_url = data.get('pdf_url')
                 if pdf_url and pdf_url.endswith('.pdf'):
                     report = {
                         'pdf_url': pdf_url,
@@ -3952,14 +4738,14 @@ def get_microfinance_quarterly_report(microfinance_symbol: str, fiscal_year: str
                         'source': 'static'
                     }
                     inserted = insert_microfinance_company_document_to_db(company['id'], microfinance_symbol, report)
-                    print(f"✅ FOUND {quarter} AND SAVED!")
+                    logger.info("✅ FOUND %s AND SAVED!", quarter)
                     return {
                         "status": "found_via_scraping",
                         "source": "firecrawl",
                         "document": inserted
                     }
         except Exception as e:
-            print(f"  ❌ Error scraping {url}: {e}")
+            logger.warning("  ❌ Error scraping %s: %s", url, e)
             continue
 
     raise HTTPException(status_code=404, detail=f"Quarterly report {quarter} for {microfinance_symbol} {nepali_fy} not found")
@@ -4041,53 +4827,15 @@ CLI_QUARTER_NEPALI_MONTHS = {
 
 def get_life_insurance_company_info(company_symbol: str) -> Optional[Dict]:
     """Fetch life insurance company from life_insurance_companies table"""
-    try:
-        result = supabase.table("life_insurance_companies").select("*").eq("symbol", company_symbol.upper()).execute()
-        if result.data and len(result.data) > 0:
-            return result.data[0]
-        return None
-    except Exception as e:
-        print(f"Error fetching life insurance company info: {e}")
-        return None
+    return get_institution_info("life_insurance_companies", company_symbol)
 
 
 def check_life_insurance_document_exists(company_id: int, fiscal_year: str, report_type: str,
                                          quarter: Optional[str] = None) -> Optional[Dict]:
-    """Check if document already exists in life_insurance_companies_documents table"""
-    try:
-        query = (supabase.table("life_insurance_companies_documents")
-                 .select("*")
-                 .eq("life_insurance_id", company_id)
-                 .eq("fiscal_year", fiscal_year)
-                 .eq("report_type", report_type))
-        if quarter:
-            query = query.eq("quarter", quarter)
-        else:
-            query = query.is_("quarter", "null")
-        result = query.execute()
-        if result.data and len(result.data) > 0:
-            return result.data[0]
-
-        # Try alternate fiscal year format
-        nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
-        alt_fy = english_fy if fiscal_year == nepali_fy else nepali_fy
-        if alt_fy != fiscal_year:
-            query_alt = (supabase.table("life_insurance_companies_documents")
-                         .select("*")
-                         .eq("life_insurance_id", company_id)
-                         .eq("fiscal_year", alt_fy)
-                         .eq("report_type", report_type))
-            if quarter:
-                query_alt = query_alt.eq("quarter", quarter)
-            else:
-                query_alt = query_alt.is_("quarter", "null")
-            result_alt = query_alt.execute()
-            if result_alt.data and len(result_alt.data) > 0:
-                return result_alt.data[0]
-        return None
-    except Exception as e:
-        print(f"Error checking life insurance document: {e}")
-        return None
+    """Check if document already exists in life_insurance_companies_documents table (either fiscal year format)"""
+    nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
+    return check_document_exists_any(company_id, [fiscal_year, nepali_fy, english_fy], report_type, quarter,
+                                     table="life_insurance_companies_documents", id_column="life_insurance_id")
 
 
 def has_life_insurance_dynamic_api(company_symbol: str) -> bool:
@@ -4119,11 +4867,11 @@ def insert_life_insurance_document_to_db(company_id: int, company_symbol: str, r
                    .execute())
 
         if existing.data and len(existing.data) > 0:
-            print(f"   📄 PDF URL already exists in database")
+            logger.info("   📄 PDF URL already exists in database")
             existing_doc = existing.data[0]
 
             # Use Gemini AI to verify which metadata is correct for this PDF URL
-            print(f"   🧠 Verifying metadata with Gemini AI for existing PDF...")
+            logger.info("   🧠 Verifying metadata with Gemini AI for existing PDF...")
             ai_meta = extract_metadata_from_pdf_url(pdf_url, company_symbol)
 
             should_update = False
@@ -4132,17 +4880,17 @@ def insert_life_insurance_document_to_db(company_id: int, company_symbol: str, r
             if ai_meta:
                 # If Gemini found a different fiscal year or quarter, update the database
                 if ai_meta.get('fiscal_year') and ai_meta['fiscal_year'] != existing_doc.get('fiscal_year'):
-                    print(f"     - Updating FY: {existing_doc.get('fiscal_year')} -> {ai_meta['fiscal_year']}")
+                    logger.debug("     - Updating FY: %s -> %s", existing_doc.get('fiscal_year'), ai_meta['fiscal_year'])
                     update_data['fiscal_year'] = ai_meta['fiscal_year']
                     should_update = True
 
                 if ai_meta.get('report_type') and ai_meta['report_type'] != existing_doc.get('report_type'):
-                    print(f"     - Updating Type: {existing_doc.get('report_type')} -> {ai_meta['report_type']}")
+                    logger.debug("     - Updating Type: %s -> %s", existing_doc.get('report_type'), ai_meta['report_type'])
                     update_data['report_type'] = ai_meta['report_type']
                     should_update = True
 
                 if ai_meta.get('quarter') and ai_meta['quarter'] != existing_doc.get('quarter'):
-                    print(f"     - Updating Quarter: {existing_doc.get('quarter')} -> {ai_meta['quarter']}")
+                    logger.debug("     - Updating Quarter: %s -> %s", existing_doc.get('quarter'), ai_meta['quarter'])
                     update_data['quarter'] = ai_meta['quarter']
                     should_update = True
 
@@ -4171,7 +4919,7 @@ def insert_life_insurance_document_to_db(company_id: int, company_symbol: str, r
         result = supabase.table("life_insurance_companies_documents").insert(doc_data).execute()
         return result.data[0] if result.data else doc_data
     except Exception as e:
-        print(f"   ❌ Error inserting life insurance document: {e}")
+        logger.error("   ❌ Error inserting life insurance document: %s", e)
         raise
 
 
@@ -4184,12 +4932,9 @@ def fetch_from_pmli_api(fiscal_year: str, report_type: str, quarter: Optional[st
     try:
         config = LIFE_INSURANCE_DYNAMIC_API["PMLI"]
         api_url = config['annual_api'] if report_type == 'annual' else config['quarterly_api']
-        response = requests.get(api_url, timeout=30)
-        if response.status_code != 200:
-            print(f"   PMLI API returned {response.status_code}")
+        data = get_api_json(api_url, timeout=30)
+        if data is None:
             return None
-
-        data = response.json()
         items = data.get('data', [])
         nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
@@ -4200,13 +4945,13 @@ def fetch_from_pmli_api(fiscal_year: str, report_type: str, quarter: Optional[st
 
             # Extract fiscal year from summary or title
             item_fy = None
-            fy_match = re.search(r'(\d{4}/\d{2,4})', summary) or re.search(r'(\d{4}/\d{2,4})', title)
+            fy_match = _FY_TEXT_RE.search(summary) or _FY_TEXT_RE.search(title)
             if fy_match:
                 item_fy = normalize_fiscal_year_format(fy_match.group(1))
 
             # Also handle short format like "80/81" in title
             if not item_fy:
-                short_match = re.search(r'(\d{2}/\d{2})', title)
+                short_match = _FY_SHORT_RE.search(title)
                 if short_match:
                     parts = short_match.group(1).split('/')
                     item_fy = normalize_fiscal_year_format(f"20{parts[0]}/{parts[1]}")
@@ -4240,10 +4985,16 @@ def fetch_from_pmli_api(fiscal_year: str, report_type: str, quarter: Optional[st
                     }
         return None
     except Exception as e:
-        print(f"   Error fetching from PMLI API: {e}")
+        logger.error("   Error fetching from PMLI API: %s", e)
         return None
 
 
+# Handler per LIFE_INSURANCE_DYNAMIC_API 'method'
+LIFE_INSURANCE_API_METHODS = {
+    "pmli_api": fetch_from_pmli_api,
+}
+
+
 def fetch_from_life_insurance_api(company_symbol: str, fiscal_year: str, report_type: str,
                                    quarter: Optional[str] = None) -> Optional[Dict]:
     """Main dispatcher for life insurance dynamic API handlers"""
@@ -4251,10 +5002,11 @@ def fetch_from_life_insurance_api(company_symbol: str, fiscal_year: str, report_
     if not config:
         return None
     method = config.get('method')
-    if method == 'pmli_api':
-        return fetch_from_pmli_api(fiscal_year, report_type, quarter)
-    print(f"   Unknown life insurance API method: {method}")
-    return None
+    fetcher = LIFE_INSURANCE_API_METHODS.get(method)
+    if not fetcher:
+        logger.warning("   Unknown life insurance API method: %s", method)
+        return None
+    return fetcher(fiscal_year, report_type, quarter)
 
 
 # ============================================================================
@@ -4270,9 +5022,9 @@ def get_life_insurance_annual_report(company_symbol: str, fiscal_year: str):
     company_symbol = company_symbol.upper()
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"\n{'='*70}")
-    print(f"LIFE INSURANCE ANNUAL: {company_symbol} | FY: {nepali_fy} / {english_fy}")
-    print(f"{'='*70}")
+    logger.debug("\n%s", LOG_BANNER)
+    logger.info("LIFE INSURANCE ANNUAL: %s | FY: %s / %s", company_symbol, nepali_fy, english_fy)
+    logger.debug(LOG_BANNER)
 
     # RJBCL: only quarterly reports exist
     if company_symbol == "RJBCL":
@@ -4286,22 +5038,21 @@ def get_life_insurance_annual_report(company_symbol: str, fiscal_year: str):
         raise HTTPException(status_code=404, detail=f"Life insurance company '{company_symbol}' not found")
 
     # 1. Database Check
-    print("Checking database for existing document...")
-    existing = (check_life_insurance_document_exists(company['id'], nepali_fy, 'annual') or
-                check_life_insurance_document_exists(company['id'], english_fy, 'annual'))
+    logger.info("Checking database for existing document...")
+    existing = check_life_insurance_document_exists(company['id'], nepali_fy, 'annual')
     if existing:
         return {"status": "found", "source": "database", "pdf_url": existing['pdf_url']}
 
     # 2. Dynamic API Check
     if has_life_insurance_dynamic_api(company_symbol):
-        print("Checking dynamic API...")
+        logger.info("Checking dynamic API...")
         api_doc = fetch_from_life_insurance_api(company_symbol, nepali_fy, 'annual')
         if api_doc:
             inserted = insert_life_insurance_document_to_db(company['id'], company_symbol, api_doc)
             return {"status": "found", "source": "dynamic_api", "pdf_url": inserted['pdf_url']}
 
     # 3. Firecrawl Scraping
-    print("Sourcing URLs for scraping...")
+    logger.info("Sourcing URLs for scraping...")
     urls = []
 
     # Priority 1: DB URLs
@@ -4328,18 +5079,17 @@ def get_life_insurance_annual_report(company_symbol: str, fiscal_year: str):
         f' Return JSON: {{"found": true, "report": {{"fiscal_year": "{nepali_fy}", "report_type": "annual", "file_url": "<pdf_url>"}}}}'
     )
 
-    for url in urls:
-        print(f"🔍 Scraping: {url}")
+    for url, data in scrape_pages_json(urls, prompt):
+        logger.info("🔍 Scraping: %s", url)
         try:
-            result = firecrawl.scrape(url, formats=["markdown", {"type": "json", "prompt": prompt}])
-            if result.json and result.json.get('found'):
-                report = result.json.get('report')
+            if data and data.get('found'):
+                report = data.get('report')
                 if report and report.get('file_url'):
                     report['source'] = 'static'
                     inserted = insert_life_insurance_document_to_db(company['id'], company_symbol, report)
                     return {"status": "found", "source": "scraped", "pdf_url": inserted['pdf_url']}
         except Exception as e:
-            print(f"  ❌ Error scraping {url}: {e}")
+            logger.warning("  ❌ Error scraping %s: %s", url, e)
             continue
 
     raise HTTPException(status_code=404, detail="Annual report not found via any method")
@@ -4358,31 +5108,30 @@ def get_life_insurance_quarterly_report(company_symbol: str, fiscal_year: str, q
 
     nepali_fy, english_fy = normalize_fiscal_year(fiscal_year)
 
-    print(f"\n{'='*70}")
-    print(f"LIFE INSURANCE QUARTERLY: {company_symbol} | FY: {nepali_fy} | {quarter}")
-    print(f"{'='*70}")
+    logger.debug("\n%s", LOG_BANNER)
+    logger.info("LIFE INSURANCE QUARTERLY: %s | FY: %s | %s", company_symbol, nepali_fy, quarter)
+    logger.debug(LOG_BANNER)
 
     company = get_life_insurance_company_info(company_symbol)
     if not company:
         raise HTTPException(status_code=404, detail=f"Life insurance company '{company_symbol}' not found")
 
     # 1. Database Check
-    print("Checking database for existing document...")
-    existing = (check_life_insurance_document_exists(company['id'], nepali_fy, 'quarterly', quarter) or
-                check_life_insurance_document_exists(company['id'], english_fy, 'quarterly', quarter))
+    logger.info("Checking database for existing document...")
+    existing = check_life_insurance_document_exists(company['id'], nepali_fy, 'quarterly', quarter)
     if existing:
         return {"status": "found", "source": "database", "pdf_url": existing['pdf_url']}
 
     # 2. Dynamic API Check
     if has_life_insurance_dynamic_api(company_symbol):
-        print("Checking dynamic API...")
+        logger.info("Checking dynamic API...")
         api_doc = fetch_from_life_insurance_api(company_symbol, nepali_fy, 'quarterly', quarter)
         if api_doc:
             inserted = insert_life_insurance_document_to_db(company['id'], company_symbol, api_doc)
             return {"status": "found", "source": "dynamic_api", "pdf_url": inserted['pdf_url']}
 
     # 3. Firecrawl Scraping
-    print("Sourcing URLs for scraping...")
+    logger.info("Sourcing URLs for scraping...")
     urls = []
 
     # Priority 1: DB URLs
@@ -4414,18 +5163,17 @@ def get_life_insurance_quarterly_report(company_symbol: str, fiscal_year: str, q
         f' Return JSON: {{"found": true, "report": {{"fiscal_year": "{nepali_fy}", "report_type": "quarterly", "quarter": "{quarter}", "file_url": "<pdf_url>"}}}}'
     )
 
-    for url in urls:
-        print(f"🔍 Scraping: {url}")
+    for url, data in scrape_pages_json(urls, prompt):
+        logger.info("🔍 Scraping: %s", url)
         try:
-            result = firecrawl.scrape(url, formats=["markdown", {"type": "json", "prompt": prompt}])
-            if result.json and result.json.get('found'):
-                report = result.json.get('report')
+            if data and data.get('found'):
+                report = data.get('report')
                 if report and report.get('file_url'):
                     report['source'] = 'static'
                     inserted = insert_life_insurance_document_to_db(company['id'], company_symbol, report)
                     return {"status": "found", "source": "scraped", "pdf_url": inserted['pdf_url']}
         except Exception as e:
-            print(f"  ❌ Error scraping {url}: {e}")
+            logger.warning("  ❌ Error scraping %s: %s", url, e)
             continue
 
     raise HTTPException(status_code=404, detail="Quarterly report not found via any method")
@@ -4434,4 +5182,7 @@ def get_life_insurance_quarterly_report(company_symbol: str, fiscal_year: str, q
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+    # loop/http "auto" pick uvloop and httptools when installed (uvloop is not available on Windows)
+    # The app is passed as an import string so each worker process builds its own clients and caches
+    uvicorn.run("financial_documents_api:app", host="0.0.0.0", port=8002, loop="auto", http="auto",
+                workers=WORKER_COUNT)
@@ -0,0 +1,62 @@
+import os
+import unittest
+
+# The module reads these at import time; no client is created until the app starts
+for _name in ("SUPABASE_URL", "SUPABASE_KEY", "FIRECRAWL_API_KEY", "GOOGLE_API_KEY"):
+    os.environ.setdefault(_name, "test")
+
+from financial_documents_api import _match_pdf_link
+
+PAGE_URL = "https://bank.example.com/investor-relations/"
+
+
+def match(links, report_type="annual", quarter=None, fiscal_year="2080/81"):
+    return _match_pdf_link(links, PAGE_URL, fiscal_year, report_type, quarter)
+
+
+class MatchAnnualReportTest(unittest.TestCase):
+    def test_matches_annual_report_link_text(self):
+        report = match([("/uploads/ar.pdf", "Annual Report 2080/81")])
+        self.assertEqual(report["file_url"], "https://bank.example.com/uploads/ar.pdf")
+        self.assertEqual(report["fiscal_year"], "2080/81")
+        self.assertIsNone(report["quarter"])
+
+    def test_matches_annual_report_file_name(self):
+        report = match([("/uploads/Annual_Report_2080-81.pdf", "Download")])
+        self.assertEqual(report["file_url"], "https://bank.example.com/uploads/Annual_Report_2080-81.pdf")
+
+    def test_rejects_general_meeting_notice(self):
+        links = [("/uploads/agm.pdf", "Notice of 25th Annual General Meeting 2080/81"),
+                 ("/uploads/2080-81_AGM_Minutes.pdf", "Annual meeting 2080/81")]
+        self.assertIsNone(match(links))
+
+    def test_ignores_annual_reports_directory(self):
+        self.assertIsNone(match([("/annual-reports/2080-81/dividend.pdf", "Dividend 2080/81")]))
+
+    def test_skips_other_fiscal_years(self):
+        links = [("/uploads/ar-79.pdf", "Annual Report 2079/80"), ("/uploads/ar-80.pdf", "Annual Report 2080/81")]
+        self.assertEqual(match(links)["file_url"], "https://bank.example.com/uploads/ar-80.pdf")
+
+    def test_first_matching_link_wins(self):
+        links = [("/uploads/notice.pdf", "AGM Notice 2080/81"), ("/uploads/ar.pdf", "Annual Report 2080/81"),
+                 ("/uploads/ar-full.pdf", "Annual Report 2080/81 (full)")]
+        self.assertEqual(match(links)["file_url"], "https://bank.example.com/uploads/ar.pdf")
+
+
+class MatchQuarterlyReportTest(unittest.TestCase):
+    def test_matches_requested_quarter(self):
+        links = [("/uploads/q1.pdf", "Q1 Report 2080/81"), ("/uploads/q3.pdf", "Q3 Report 2080/81")]
+        report = match(links, "quarterly", "Q3")
+        self.assertEqual(report["file_url"], "https://bank.example.com/uploads/q3.pdf")
+        self.assertEqual(report["quarter"], "Q3")
+
+    def test_skips_annual_links(self):
+        self.assertIsNone(match([("/uploads/ar.pdf", "Annual Report Q4 2080/81")], "quarterly", "Q4"))
+
+    def test_ignores_quarter_in_directory(self):
+        self.assertIsNone(match([("/reports/q2/statement-2080-81.pdf", "Financial Statement 2080/81")],
+                                "quarterly", "Q2"))
+
+
+if __name__ == "__main__":
+    unittest.main()